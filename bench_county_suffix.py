@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark fix_missing_commas_in_county_state() against a linear scan over
+US_COUNTIES doing the same matching, on every place name in PlaceTable.
+"""
+import argparse
+import sqlite3
+import time
+
+from config import rmtree_path, US_COUNTIES
+from gazetteer import GAZETTEER
+from normalizer import fix_missing_commas_in_county_state
+
+
+def linear_scan(name: str) -> str:
+    """The linear form of the same matching: try every (county, state) pair."""
+    parts = [p.strip() for p in name.split(",")]
+    if len(parts) < 2:
+        return name
+
+    head = parts[0]
+    found = None
+    for county, state in US_COUNTIES:
+        if state == parts[1] and head.endswith(f" {county}") and (found is None or len(county) > len(found)):
+            city = head[:-len(county) - 1]
+            if GAZETTEER.is_place(city, f"{county} County", state):
+                found = county
+    if found:
+        return ", ".join([head[:-len(found) - 1], found] + parts[1:])
+    return name
+
+
+def time_function(func, names, repeat):
+    """Return (best seconds over repeat runs, results of the last run)."""
+    best = None
+    results = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [func(name) for name in names]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def bench(db_path, repeat=3):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    names = [row[0] for row in conn.execute("SELECT Name FROM PlaceTable NOT INDEXED") if row[0]]
+    conn.close()
+    print(f"🧪 {len(names)} place names, {len(US_COUNTIES)} counties")
+
+    timings = {}
+    results = {}
+    for label, func in (("linear scan", linear_scan), ("county index", fix_missing_commas_in_county_state)):
+        timings[label], results[label] = time_function(func, names, repeat)
+        per_name = timings[label] / max(len(names), 1) * 1e6
+        print(f"    {label:<14} best of {repeat}: {timings[label] * 1000:9.2f} ms  ({per_name:8.2f} µs per name)")
+
+    if timings["county index"]:
+        print(f"    speed-up: {timings['linear scan'] / timings['county index']:.0f}x")
+    if results["linear scan"] == results["county index"]:
+        print("✅ Identical results")
+    else:
+        diffs = sum(1 for a, b in zip(results["linear scan"], results["county index"]) if a != b)
+        print(f"⚠️  {diffs} names differ between the two implementations")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the county index of fix_missing_commas_in_county_state")
+    parser.add_argument("--db", default=rmtree_path, help="RootsMagic database to read place names from")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    bench(args.db, repeat=args.repeat)
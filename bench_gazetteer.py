@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark Gazetteer lookups against the list scans they replaced, on county
+and place lists scaled up from us_counties.txt and us_places.txt (10x by
+default), with as many misses as hits among the queries.  The places go
+through a PlaceIndex file written to a temporary directory.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from config import US_COUNTIES, US_PLACES
+from gazetteer import Gazetteer
+from placeindex import PlaceIndex, write_place_index
+
+
+def scaled(entries, scale):
+    """entries, plus scale - 1 renamed copies ("Autauga 2", ...)."""
+    out = list(entries)
+    for copy in range(2, scale + 1):
+        out += [(f"{entry[0]} {copy}",) + tuple(entry[1:]) for entry in entries]
+    return out
+
+
+def county_of_scan(places, city, state):
+    """The original assign_county_if_known_place() loop."""
+    for entry_city, entry_county, entry_state in places:
+        if city == entry_city and state == entry_state:
+            return entry_county
+    return None
+
+
+def time_queries(func, queries, repeat):
+    """Return (best seconds over repeat runs, results of the last run)."""
+    best = None
+    results = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [func(*query) for query in queries]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def bench(scale=10, queries=2000, repeat=3, seed=1):
+    counties = scaled(US_COUNTIES, scale)
+    places = scaled(US_PLACES, scale)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "places.idx")
+        t0 = time.perf_counter()
+        write_place_index(path, places)
+        gazetteer = Gazetteer(counties, PlaceIndex(path))
+        print(f"🧪 {len(counties)} counties, {len(places)} places ({scale}x); "
+              f"indexed in {(time.perf_counter() - t0) * 1000:.1f} ms, "
+              f"place index {os.path.getsize(path) / 1024:.0f} KiB")
+        run_checks(gazetteer, counties, places, queries, repeat, seed)
+        gazetteer.places.close()
+
+
+def run_checks(gazetteer, counties, places, queries, repeat, seed):
+    rng = random.Random(seed)
+    county_queries = [rng.choice(counties) for _ in range(queries // 2)]
+    county_queries += [(f"{county}x", state) for county, state in county_queries]
+    place_queries = [rng.choice(places) for _ in range(queries // 2)]
+    place_queries += [(f"{city}x", county, state) for city, county, state in place_queries]
+    city_queries = [(city, state) for city, _, state in place_queries]
+
+    checks = (
+        ("(county, state) in", county_queries,
+         lambda county, state: (county, state) in counties, gazetteer.is_county),
+        ("(city, county, state) in", place_queries,
+         lambda city, county, state: (city, county, state) in places, gazetteer.is_place),
+        ("county of (city, state)", city_queries,
+         lambda city, state: county_of_scan(places, city, state), gazetteer.county_of),
+    )
+    for label, query_list, scan, lookup in checks:
+        scan_seconds, scan_results = time_queries(scan, query_list, repeat)
+        lookup_seconds, lookup_results = time_queries(lookup, query_list, repeat)
+        per_scan = scan_seconds / len(query_list) * 1e6
+        per_lookup = lookup_seconds / len(query_list) * 1e6
+        speedup = scan_seconds / lookup_seconds if lookup_seconds else float("inf")
+        same = "✅" if scan_results == lookup_results else "⚠️  results differ"
+        print(f"    {label:<26} list {per_scan:9.2f} µs  gazetteer {per_lookup:6.3f} µs  ({speedup:,.0f}x) {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Gazetteer lookups against list scans")
+    parser.add_argument("--scale", type=int, default=10, help="Copies of the county and place files to index")
+    parser.add_argument("--queries", type=int, default=2000, help="Lookups per check, half of them misses")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    bench(scale=args.scale, queries=args.queries, repeat=args.repeat)
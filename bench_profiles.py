@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SQLite performance profiles in config.SQLITE_PROFILES.
+
+Every profile runs the same read (analysis) and write (bulk-write)
+workloads against a scratch copy of the database, never the original.
+"""
+import argparse
+import csv
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+
+from config import rmtree_path, SQLITE_PROFILES
+from rmutils import (
+    RMConnection,
+    PlaceWriter,
+    _load_rmnocase,
+    apply_profile,
+    find_duplicate_place_names,
+    get_all_places,
+)
+
+
+def open_copy(path, profile):
+    conn = sqlite3.connect(path, factory=RMConnection)
+    conn.row_factory = sqlite3.Row
+    _load_rmnocase(conn)
+    # the scratch copy has no reindex marker, make its indexes match our collation
+    conn.execute("REINDEX RMNOCASE;")
+    if profile:
+        apply_profile(conn, profile)
+    return conn
+
+
+def analysis_workload(conn):
+    find_duplicate_place_names(conn)
+    get_all_places(conn)
+    conn.execute("""
+        SELECT p.PlaceID, COUNT(e.EventID)
+        FROM PlaceTable p
+        LEFT JOIN EventTable e ON e.PlaceID = p.PlaceID
+        GROUP BY p.PlaceID
+        ORDER BY p.Name COLLATE RMNOCASE
+    """).fetchall()
+
+
+def bulk_write_workload(conn, batch_size=50):
+    # rewrite every name as-is; commits every batch_size rows like a fix_places stage
+    with PlaceWriter(conn, batch_size=batch_size) as writer:
+        for pid, name in get_all_places(conn):
+            writer.rename_place(pid, name)
+
+
+WORKLOADS = {
+    "analysis": analysis_workload,
+    "bulk-write": bulk_write_workload,
+}
+
+
+def bench(db_path, repeat=3):
+    results = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for profile in [None, *SQLITE_PROFILES]:
+            label = profile or "default"
+            for workload, func in WORKLOADS.items():
+                times = []
+                for _ in range(repeat):
+                    copy = os.path.join(scratch, "bench.rmtree")
+                    shutil.copyfile(db_path, copy)
+                    conn = open_copy(copy, profile)
+                    t0 = time.perf_counter()
+                    func(conn)
+                    times.append(time.perf_counter() - t0)
+                    conn.close()
+                    for suffix in ("", "-wal", "-shm", "-journal"):
+                        if os.path.exists(copy + suffix):
+                            os.remove(copy + suffix)
+                best = min(times)
+                results.append((label, workload, best))
+                print(f"    {label:<14} {workload:<12} best of {repeat}: {best * 1000:9.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark SQLite performance profiles")
+    parser.add_argument("--db", default=rmtree_path, help="RootsMagic database to copy for the runs")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per profile and workload (best is reported)")
+    parser.add_argument("--csv", help="Append the results to this CSV file")
+    args = parser.parse_args()
+
+    print(f"🧪 Profiles against a copy of {args.db}")
+    results = bench(args.db, repeat=args.repeat)
+
+    if args.csv:
+        new_file = not os.path.exists(args.csv)
+        stamp = datetime.now().isoformat(timespec="seconds")
+        with open(args.csv, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["Timestamp", "Database", "Profile", "Workload", "Seconds"])
+            for profile, workload, seconds in results:
+                writer.writerow([stamp, args.db, profile, workload, f"{seconds:.6f}"])
+        print(f"✅ Recorded {len(results)} results in {args.csv}")
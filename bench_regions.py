@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark the regional passes that finish normalize_once(): every region's
+passes on every name, as before, against only the passes for the region
+jurisdictions.classify() puts the name in, on every place name in PlaceTable.
+"""
+import argparse
+import io
+import sqlite3
+import time
+from contextlib import redirect_stdout
+
+from config import rmtree_path
+from jurisdictions import classify
+from normalizer import us_passes, canadian_passes, mexican_passes, _REGIONAL_PASSES
+
+
+def every_region(name: str) -> str:
+    """The original tail: all regional passes, whatever the name ends in."""
+    return mexican_passes(canadian_passes(us_passes(name)))
+
+
+def dispatched(name: str) -> str:
+    passes = _REGIONAL_PASSES.get(classify(name))
+    return passes(name) if passes else name
+
+
+def time_function(func, names, repeat):
+    """Return (best seconds over repeat runs, results of the last run)."""
+    best = None
+    results = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        results = [func(name) for name in names]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def bench(db_path, repeat=3):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    names = [row[0] for row in conn.execute("SELECT Name FROM PlaceTable NOT INDEXED") if row[0]]
+    conn.close()
+
+    regions = {}
+    for name in names:
+        region = classify(name)
+        regions[region] = regions.get(region, 0) + 1
+    print(f"🧪 {len(names)} place names: "
+          + ", ".join(f"{region} {count}" for region, count in sorted(regions.items(), key=lambda item: -item[1])))
+
+    timings = {}
+    results = {}
+    with redirect_stdout(io.StringIO()):
+        for label, func in (("every region", every_region), ("dispatched", dispatched)):
+            timings[label], results[label] = time_function(func, names, repeat)
+    for label, seconds in timings.items():
+        per_name = seconds / max(len(names), 1) * 1e6
+        print(f"    {label:<14} best of {repeat}: {seconds * 1000:9.2f} ms  ({per_name:8.2f} µs per name)")
+
+    if timings["dispatched"]:
+        print(f"    speed-up: {timings['every region'] / timings['dispatched']:.1f}x")
+    if results["every region"] == results["dispatched"]:
+        print("✅ Identical results")
+    else:
+        diffs = sum(1 for a, b in zip(results["every region"], results["dispatched"]) if a != b)
+        print(f"⚠️  {diffs} names differ between the two implementations")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the region dispatch at the end of normalize_once")
+    parser.add_argument("--db", default=rmtree_path, help="RootsMagic database to read place names from")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    bench(args.db, repeat=args.repeat)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark the native unifuzz RMNOCASE collation against the pure-Python
+fallback in rmnocase.py by sorting PlaceTable.Name and NameTable.Surname.
+"""
+import argparse
+import sqlite3
+import time
+
+from config import rmtree_path
+from rmnocase import fold_key
+from rmutils import _load_rmnocase
+
+
+# NOT INDEXED forces a real sort instead of walking the RMNOCASE index
+QUERIES = {
+    "PlaceTable.Name": "SELECT Name FROM PlaceTable NOT INDEXED ORDER BY Name COLLATE RMNOCASE",
+    "NameTable.Surname": "SELECT Surname FROM NameTable NOT INDEXED ORDER BY Surname COLLATE RMNOCASE",
+}
+
+
+def open_with(db_path, collation):
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    _load_rmnocase(conn, collation)
+    return conn, time.perf_counter() - t0
+
+
+def time_query(conn, sql, repeat):
+    """Return (first run, best run, rows); the first run is the cold-cache one."""
+    times = []
+    rows = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = conn.execute(sql).fetchall()
+        times.append(time.perf_counter() - t0)
+    return times[0], min(times), rows
+
+
+def bench(db_path, repeat=5):
+    results = {}
+    for collation in ("native", "python"):
+        try:
+            conn, load_time = open_with(db_path, collation)
+        except SystemExit as e:
+            print(f"⚠️  {collation}: skipped ({e})")
+            continue
+        print(f"\n🧪 {collation} (connect + collation load: {load_time * 1000:.2f} ms)")
+        for label, sql in QUERIES.items():
+            fold_key.cache_clear()
+            first, best, rows = time_query(conn, sql, repeat)
+            results[(collation, label)] = [r[0] for r in rows]
+            print(f"    {label:<20} {len(rows):>8} rows  first: {first * 1000:8.2f} ms"
+                  f"  best of {repeat}: {best * 1000:8.2f} ms")
+        if collation == "python":
+            print(f"    fold_key cache: {fold_key.cache_info()}")
+        conn.close()
+
+    # Report any ordering differences between the two implementations
+    for label in QUERIES:
+        native = results.get(("native", label))
+        python = results.get(("python", label))
+        if native is None or python is None:
+            continue
+        if native == python:
+            print(f"✅ {label}: identical ordering")
+        else:
+            diffs = sum(1 for a, b in zip(native, python) if a != b)
+            print(f"⚠️  {label}: {diffs} positions differ between native and python")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark RMNOCASE collation implementations")
+    parser.add_argument("--db", default=rmtree_path, help="RootsMagic database to sort")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (best is reported)")
+    args = parser.parse_args()
+
+    bench(args.db, repeat=args.repeat)
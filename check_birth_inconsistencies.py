@@ -1,6 +1,7 @@
 
 import pandas as pd
-from rmutils import get_connection, run_query
+from rmutils import get_connection, run_query, ID_DTYPES, EVENT_DTYPES
+from config import SQLITE_PROFILES
 
 def parse_rm_date(date_str):
     try:
@@ -9,37 +10,84 @@ def parse_rm_date(date_str):
     except:
         return pd.NaT
 
-def main():
-    conn = get_connection()
+def load_event_dates(conn, fact_id, column, chunksize=50000):
+    """
+    PersonID and parsed date of every person event of one fact type.
+    Read in chunks and parsed as it goes; only the two compact columns
+    (int32 ID, datetime64 date) are kept, never the raw Date strings.
+    """
+    query = f"SELECT OwnerID AS PersonID, Date AS {column} FROM EventTable WHERE OwnerType = 0 AND EventType = ?"
+    chunks = []
+    for chunk in run_query(conn, query, params=(int(fact_id),), chunksize=chunksize, dtype=EVENT_DTYPES):
+        chunk[column] = pd.to_datetime(chunk[column].apply(parse_rm_date))
+        chunks.append(chunk)
+    if not chunks:
+        return pd.DataFrame({"PersonID": pd.Series(dtype="int32"), column: pd.Series(dtype="datetime64[ns]")})
+    return pd.concat(chunks, ignore_index=True)
+
+
+def find_problems(conn, births, deaths, chunksize=50000):
+    """
+    Child/mother pairs whose dates don't fit, streamed from ChildTable in
+    chunks: each chunk is joined against births and deaths and only its
+    problem rows are kept, so the pairs of a large tree are never all in
+    memory at once (births and deaths themselves are, see load_event_dates).
+    """
+    query = "SELECT c.ChildID, f.MotherID FROM ChildTable c JOIN FamilyTable f ON c.FamilyID = f.FamilyID WHERE f.MotherID IS NOT NULL"
+    child_births = births.rename(columns={"PersonID": "ChildID", "BirthDate": "ChildBirth"})
+    mother_births = births.rename(columns={"PersonID": "MotherID", "BirthDate": "MotherBirth"})
+    mother_deaths = deaths.rename(columns={"PersonID": "MotherID", "DeathDate": "MotherDeath"})
+
+    problems = []
+    for relations in run_query(conn, query, chunksize=chunksize, dtype=ID_DTYPES):
+        df = (
+            relations.merge(child_births, on="ChildID", how="left")
+            .merge(mother_births, on="MotherID", how="left")
+            .merge(mother_deaths, on="MotherID", how="left")
+        )
+
+        df["TooYoung"] = (df["ChildBirth"] - df["MotherBirth"]).dt.days < (13 * 365)
+        df["TooOld"] = (df["ChildBirth"] - df["MotherBirth"]).dt.days > (55 * 365)
+        df["PostDeath"] = df["MotherDeath"].notna() & (df["ChildBirth"] > df["MotherDeath"])
+
+        problems.append(df[df["TooYoung"] | df["TooOld"] | df["PostDeath"]])
+
+    if not problems:
+        columns = ["ChildID", "MotherID", "ChildBirth", "MotherBirth", "MotherDeath", "TooYoung", "TooOld", "PostDeath"]
+        return pd.DataFrame(columns=columns)
+    return pd.concat(problems, ignore_index=True)
+
+
+def load_primary_names(conn, person_ids, chunksize=50000):
+    """Given/Surname of the primary names of person_ids, streamed from NameTable."""
+    query = "SELECT OwnerID AS PersonID, Given, Surname FROM NameTable WHERE IsPrimary = 1"
+    chunks = [
+        chunk[chunk["PersonID"].isin(person_ids)]
+        for chunk in run_query(conn, query, chunksize=chunksize, dtype=ID_DTYPES)
+    ]
+    if not chunks:
+        return pd.DataFrame({"PersonID": pd.Series(dtype="int32"), "Given": [], "Surname": []})
+    return pd.concat(chunks, ignore_index=True)
+
+
+def main(profile=None):
+    conn = get_connection(profile=profile)
 
     birth_fact_id = run_query(conn, "SELECT FactTypeID FROM FactTypeTable WHERE LOWER(Name) = 'birth'").iloc[0, 0]
     death_fact_id = run_query(conn, "SELECT FactTypeID FROM FactTypeTable WHERE LOWER(Name) = 'death'").iloc[0, 0]
 
-    births = run_query(conn, f"SELECT OwnerID AS PersonID, Date AS BirthDate FROM EventTable WHERE OwnerType = 0 AND EventType = {birth_fact_id}")
-    deaths = run_query(conn, f"SELECT OwnerID AS PersonID, Date AS DeathDate FROM EventTable WHERE OwnerType = 0 AND EventType = {death_fact_id}")
-
-    relations = run_query(conn, "SELECT c.ChildID, f.MotherID FROM ChildTable c JOIN FamilyTable f ON c.FamilyID = f.FamilyID WHERE f.MotherID IS NOT NULL")
+    births = load_event_dates(conn, birth_fact_id, "BirthDate")
+    deaths = load_event_dates(conn, death_fact_id, "DeathDate")
 
-    names = run_query(conn, "SELECT OwnerID AS PersonID, Given, Surname FROM NameTable WHERE IsPrimary = 1")
+    problems = find_problems(conn, births, deaths)
 
-    df = (
-        relations.merge(births.rename(columns={"PersonID": "ChildID", "BirthDate": "ChildBirth"}), on="ChildID", how="left")
-        .merge(births.rename(columns={"PersonID": "MotherID", "BirthDate": "MotherBirth"}), on="MotherID", how="left")
-        .merge(deaths.rename(columns={"PersonID": "MotherID", "DeathDate": "MotherDeath"}), on="MotherID", how="left")
-        .merge(names.rename(columns={"PersonID": "ChildID", "Given": "ChildGiven", "Surname": "ChildSurname"}), on="ChildID", how="left")
+    # names are only needed for the rows being reported
+    names = load_primary_names(conn, set(problems["ChildID"]) | set(problems["MotherID"]))
+    problems = (
+        problems.merge(names.rename(columns={"PersonID": "ChildID", "Given": "ChildGiven", "Surname": "ChildSurname"}), on="ChildID", how="left")
         .merge(names.rename(columns={"PersonID": "MotherID", "Given": "MotherGiven", "Surname": "MotherSurname"}), on="MotherID", how="left")
     )
 
-    df["ChildBirth"] = df["ChildBirth"].apply(parse_rm_date)
-    df["MotherBirth"] = df["MotherBirth"].apply(parse_rm_date)
-    df["MotherDeath"] = df["MotherDeath"].apply(parse_rm_date)
-
-    df["TooYoung"] = (df["ChildBirth"] - df["MotherBirth"]).dt.days < (13 * 365)
-    df["TooOld"] = (df["ChildBirth"] - df["MotherBirth"]).dt.days > (55 * 365)
-    df["PostDeath"] = df["MotherDeath"].notna() & (df["ChildBirth"] > df["MotherDeath"])
-
-    problems = df[df["TooYoung"] | df["TooOld"] | df["PostDeath"]].copy()
-
     cols = [
         "ChildGiven", "ChildSurname", "ChildBirth",
         "MotherGiven", "MotherSurname", "MotherBirth",
@@ -54,4 +102,10 @@ def main():
     return results
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Report mothers too young, too old or dead at a child's birth")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
+    args = parser.parse_args()
+
+    main(profile=args.profile)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare the working-tree normalizer against the one in a git revision.
+
+Every place name in the database (and optionally a file of names, one per
+line) goes through both versions of normalize_place_iteratively(); any name
+whose result differs is printed.  Use it to check that a rewrite of the rules
+is a pure speed-up.
+"""
+import argparse
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+import normalizer
+from config import SQLITE_PROFILES
+from rmutils import get_connection
+
+
+def load_reference(revision):
+    """Import normalizer.py as of revision under the name normalizer_reference."""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    source = subprocess.run(
+        ["git", "show", f"{revision}:normalizer.py"],
+        cwd=base_path, capture_output=True, text=True, check=False,
+    )
+    if source.returncode != 0:
+        sys.exit(f"❌ Cannot read normalizer.py at {revision}: {source.stderr.strip()}")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False, encoding="utf-8") as f:
+        f.write(source.stdout)
+    try:
+        spec = importlib.util.spec_from_file_location("normalizer_reference", f.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.remove(f.name)
+    return module
+
+
+def normalize_all(module, names):
+    """Return ([results], seconds) with caching off and messages swallowed."""
+    kwargs = {"use_cache": False} if hasattr(module, "NORMALIZE_CACHE") else {}
+    t0 = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        results = [module.normalize_place_iteratively(0, name, **kwargs) for name in names]
+    return results, time.perf_counter() - t0
+
+
+def compare(revision="HEAD", names_file=None, profile=None):
+    conn = get_connection(read_only=True, profile=profile)
+    names = [row[0] for row in conn.execute("SELECT Name FROM PlaceTable WHERE PlaceType != 1") if row[0]]
+    conn.close()
+    if names_file:
+        with open(names_file, encoding="utf-8") as f:
+            names += [line.rstrip("\n") for line in f if line.strip()]
+
+    reference = load_reference(revision)
+    expected, reference_time = normalize_all(reference, names)
+    actual, current_time = normalize_all(normalizer, names)
+
+    differences = [(n, e, a) for n, e, a in zip(names, expected, actual) if e != a]
+    for name, old, new in differences:
+        print(f"≠ \"{name}\"\n    {revision}: {old!r}\n    working tree: {new!r}")
+
+    print(f"⏱️  {len(names)} names: {revision} {reference_time:.2f} s, working tree {current_time:.2f} s")
+    if differences:
+        print(f"❌ {len(differences)} names normalize differently")
+        return False
+    print("✅ Identical results")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the normalizer against a git revision")
+    parser.add_argument("--against", default="HEAD", help="Git revision to compare with (default: HEAD)")
+    parser.add_argument("--names", help="Extra file of place names, one per line")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
+    args = parser.parse_args()
+
+    sys.exit(0 if compare(args.against, args.names, profile=args.profile) else 1)
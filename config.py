@@ -3,6 +3,36 @@ import os
 rmtree_path = os.path.expanduser("~/Genealogy/ZebMoore_Ancestry.rmtree")
 extension_path = os.path.expanduser("~/src/unifuzz/unifuzz.so")
 
+# SQLite PRAGMA sets selectable with get_connection(profile=...) or --profile.
+# journal_mode, locking_mode and synchronous are only applied to writable
+# on-disk connections, and the original journal mode is restored on close so
+# the file goes back to RootsMagic the way it was found.
+SQLITE_PROFILES = {
+    # read-mostly reports: big page cache, memory-mapped reads, RAM temp b-trees
+    "analysis": {
+        "mmap_size": 268435456,      # 256 MiB
+        "cache_size": -262144,       # 256 MiB (negative = KiB)
+        "temp_store": "MEMORY",
+    },
+    # many small writes (fix_places): WAL with fewer fsyncs, still crash safe
+    "bulk-write": {
+        "mmap_size": 268435456,
+        "cache_size": -262144,
+        "temp_store": "MEMORY",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+    },
+    # as bulk-write, but holds the file exclusively; only when RootsMagic is closed
+    "offline-batch": {
+        "locking_mode": "EXCLUSIVE",
+        "mmap_size": 268435456,
+        "cache_size": -262144,
+        "temp_store": "MEMORY",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+    },
+}
+
 UNIQUE_FACT_TYPES = {
     1: "Birth",
     2: "Death",
@@ -563,8 +593,8 @@ COMMON_PLACE_MAPPINGS = {
     "Ann Arbor": "Ann Arbor, Washtenaw, Michigan, USA",
     "Winter Haven": "Winter Haven, Polk, Florida, USA",
     "Salt Lake": "Salt Lake, Utah, USA",
-    "Melrose Park": "Melrose Park, Cook, Illiniois, USA",
-    "River Grove": "River Grove, Cook, Illiniois, USA",
+    "Melrose Park": "Melrose Park, Cook, Illinois, USA",
+    "River Grove": "River Grove, Cook, Illinois, USA",
     "New York City": "New York City, New York County, New York, USA",
     "Buffalo Grove": "Buffalo Grove, Lake, Illinois, USA",
     "Spokane City": "Spokane, Spokane County, Washington, USA",
@@ -601,10 +631,6 @@ def load_us_counties(filename="us_counties.txt"):
     return counties
 
 
-# Make available globally in config
-US_COUNTIES = load_us_counties()
-
-
 def load_us_places(filename="us_places.txt"):
     """Load city–county–state mappings into a list of 3-tuples."""
     places = []
@@ -622,7 +648,16 @@ def load_us_places(filename="us_places.txt"):
     return places
 
 
-US_PLACES = load_us_places()
+# US_COUNTIES and US_PLACES are read on first use; the normalizer goes
+# through gazetteer.GAZETTEER, which has its own compiled cache
+_LAZY_TABLES = {"US_COUNTIES": load_us_counties, "US_PLACES": load_us_places}
+
+
+def __getattr__(name):
+    if name in _LAZY_TABLES:
+        value = globals()[name] = _LAZY_TABLES[name]()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -1,4 +1,5 @@
 import sqlite3
+import sys
 from collections import defaultdict
 import inspect
 import csv
@@ -20,7 +21,11 @@ from rmutils import (
     print_event_references_for_place_ids,
     infer_and_insert_missing_county,
     update_place_name,
+    PlaceWriter,
+    HelperIndexes,
+    WorkingCopy,
 )
+from report_executor import ReportExecutor, print_report_results
 
 from normalizer import (
     strip_address_if_present,
@@ -29,7 +34,11 @@ from normalizer import (
     normalize_if_matched,
     assign_county_if_known_place,
     known_county_inserted,
+    known_county_candidates,
+    RULES,
 )
+from spelling import suggested_corrections
+from config import SQLITE_PROFILES
 
 
 
@@ -121,7 +130,7 @@ def test_addresses():
 
 
 
-def delete_unused_places(conn: sqlite3.Connection, dry_run=True, brief=False):
+def delete_unused_places(conn: sqlite3.Connection, dry_run=True, brief=False, writer=None):
     place_ids = get_all_place_ids(conn)
     unused_count = 0
     for pid in place_ids:
@@ -131,7 +140,7 @@ def delete_unused_places(conn: sqlite3.Connection, dry_run=True, brief=False):
             name = get_place_name_from_id(conn, pid)
             print(f"This PlaceID {pid} is not referenced: name: \"{name}\"")
             # dump_place_usage(conn, pid)
-            ret = delete_place_id(conn, pid, dry_run=dry_run, brief=brief)
+            ret = delete_place_id(conn, pid, dry_run=dry_run, brief=brief, writer=writer)
             if not ret:
                 print(f"🚫 delete_place_id returned False for pid: {pid}")
     if unused_count > 0:
@@ -139,49 +148,59 @@ def delete_unused_places(conn: sqlite3.Connection, dry_run=True, brief=False):
 
 
 
-def do_merge_places(conn: sqlite3.Connection, dry_run=True, brief=False):
+def do_merge_places(conn: sqlite3.Connection, dry_run=True, brief=False, writer=None):
     dupes = find_duplicate_place_names(conn, brief=brief)
     num_dupes = len(dupes)
     print(f"Number of duplicates found: {num_dupes}\n")
 
     # let's merge those, if there are duplicates
     if num_dupes > 0:
-        merge_places(conn, dupes, dry_run=dry_run, brief=brief)
+        merge_places(conn, dupes, dry_run=dry_run, brief=brief, writer=writer)
 
 
 
 
 
-def fix_places(conn: sqlite3.Connection, dry_run=True, brief=False):
+def fix_places(conn: sqlite3.Connection, dry_run=True, brief=False, batch_size=None,
+               persistent_cache=False, jobs=1):
+    # Each stage reads what the previous one wrote, so every stage
+    # gets its own PlaceWriter (one transaction, committed on exit)
+
     ##################################
     # Delete unused places
     ##################################
-    delete_unused_places(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        delete_unused_places(conn, dry_run=dry_run, brief=brief, writer=writer)
 
     #######################################################
     # Find PlaceIDs where the place name is identical
     # Find duplicates and merge
     #######################################################
-    do_merge_places(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        do_merge_places(conn, dry_run=dry_run, brief=brief, writer=writer)
 
 
     ##################################################
     # do our best at renaming PlaceTable names
     ##################################################
-    normalize_place_names(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        normalize_place_names(conn, dry_run=dry_run, brief=brief, writer=writer,
+                              persistent_cache=persistent_cache, jobs=jobs)
 
 
     ####################################################
     # Fix up missing county
     ####################################################
-    infer_and_insert_missing_county(conn, dry_run=dry_run)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        infer_and_insert_missing_county(conn, dry_run=dry_run, writer=writer)
 
 
     #######################################################
     # Find PlaceIDs where the place name is identical
     # Find duplicates and merge
     #######################################################
-    do_merge_places(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        do_merge_places(conn, dry_run=dry_run, brief=brief, writer=writer)
 
 
 
@@ -190,13 +209,14 @@ def fix_places(conn: sqlite3.Connection, dry_run=True, brief=False):
     # county name
     #################################################
     place_ids = get_all_place_ids(conn)
-    for pid in place_ids:
-        place = get_place_name_from_id(conn, pid)
-        normalized_place, was_changed = normalize_if_matched(place)
-        if was_changed:
-            print(f"✔ Normalized: {place} → {normalized_place}")
-            print(f"📝 Updating PlaceID: {pid} name to {normalized_place}'")
-            update_place_name(conn, pid, normalized_place)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        for pid in place_ids:
+            place = get_place_name_from_id(conn, pid)
+            normalized_place, was_changed = normalize_if_matched(place)
+            if was_changed:
+                print(f"✔ Normalized: {place} → {normalized_place}")
+                print(f"📝 Updating PlaceID: {pid} name to {normalized_place}'")
+                update_place_name(conn, pid, normalized_place, writer=writer)
 
 
 
@@ -206,14 +226,22 @@ def fix_places(conn: sqlite3.Connection, dry_run=True, brief=False):
     # e.g. Wadsworth, Illinois, USA should become
     #      Wadsworth, Lake, Illinois, USA
     #################################################
+    # cities the gazetteer has in more than one county are reported, not guessed
     place_ids = get_all_place_ids(conn)
-    for pid in place_ids:
-        place = get_place_name_from_id(conn, pid)
-        normalized_place, was_changed = known_county_inserted(place)
-        if was_changed:
-            print(f"✔ County added: {place} → {normalized_place}")
-            print(f"📝 Updating PlaceID: {pid} name to {normalized_place}'")
-            update_place_name(conn, pid, normalized_place)
+    ambiguous = []
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        for pid in place_ids:
+            place = get_place_name_from_id(conn, pid)
+            counties = known_county_candidates(place)
+            if len(counties) > 1:
+                ambiguous.append((pid, place, counties))
+                continue
+            normalized_place, was_changed = known_county_inserted(place)
+            if was_changed:
+                print(f"✔ County added: {place} → {normalized_place}")
+                print(f"📝 Updating PlaceID: {pid} name to {normalized_place}'")
+                update_place_name(conn, pid, normalized_place, writer=writer)
+    report_ambiguous_counties(ambiguous)
 
 
 
@@ -221,20 +249,44 @@ def fix_places(conn: sqlite3.Connection, dry_run=True, brief=False):
     # Find PlaceIDs where the place name is identical
     # Find duplicates and merge
     #######################################################
-    do_merge_places(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        do_merge_places(conn, dry_run=dry_run, brief=brief, writer=writer)
 
 
     ##################################
     # Delete unused places
     ##################################
-    delete_unused_places(conn, dry_run=dry_run, brief=brief)
+    with PlaceWriter(conn, batch_size=batch_size, brief=brief) as writer:
+        delete_unused_places(conn, dry_run=dry_run, brief=brief, writer=writer)
 
 
 
-def funny_place_report (conn: sqlite3.Connection, brief: bool = False):
-    ##########################################################
-    # reporting and analysis
-    ##########################################################
+def report_ambiguous_counties(ambiguous):
+    """Print the (PlaceID, place, counties) that could be in more than one county."""
+    if not ambiguous:
+        return
+    print(f"⚠️  {len(ambiguous)} places are in more than one county of their state, left without one:")
+    for pid, place, counties in ambiguous:
+        print(f"    PlaceID {pid} \"{place}\": {', '.join(counties)}")
+    print()
+
+
+def report_possible_misspellings(conn: sqlite3.Connection):
+    """Print the places with a likely misspelling the normalizer left alone, for review."""
+    suspects = []
+    for pid, name in conn.execute("SELECT PlaceID, Name FROM PlaceTable ORDER BY PlaceID"):
+        for field, candidate in suggested_corrections(name or ""):
+            suspects.append((pid, name, field, candidate))
+    if not suspects:
+        return 0
+    print(f"⚠️  {len(suspects)} place fields may be misspelled, left as they are:")
+    for pid, name, field, candidate in suspects:
+        print(f"    PlaceID {pid} \"{name}\": {field} → {candidate}?")
+    print()
+    return len(suspects)
+
+
+def report_single_field_leftovers(conn: sqlite3.Connection):
     # report singles.....
     name_list = []
     pid_list = []
@@ -261,27 +313,97 @@ def funny_place_report (conn: sqlite3.Connection, brief: bool = False):
         print(f"leftovers: {num_leftovers}\n")
         print_event_references_for_place_ids(conn, pid_list)
         print(f"\n")
+    return num_leftovers
 
-    find_matches_against_known_segments(conn)
 
+# independent read-only reports, printed in this order
+FUNNY_PLACE_REPORTS = [
+    ("single-field leftovers", report_single_field_leftovers),
+    ("single names vs known segments", find_matches_against_known_segments),
+    ("possible misspellings", report_possible_misspellings),
     # what is left over?
-    report_non_normalized_places(conn)
+    ("non-normalized places", report_non_normalized_places),
+]
 
 
+def _holds_exclusive_lock(conn: sqlite3.Connection) -> bool:
+    return conn.execute("PRAGMA locking_mode").fetchone()[0].lower() == "exclusive"
 
 
-def devel():
+def funny_place_report (conn: sqlite3.Connection, brief: bool = False, jobs: int = 1):
+    ##########################################################
+    # reporting and analysis
+    ##########################################################
+    # a working copy only lives in conn, other connections can't see it,
+    # and an exclusive lock (the offline-batch profile) keeps them out too
+    if jobs > 1 and not isinstance(conn, WorkingCopy) and _holds_exclusive_lock(conn):
+        print("⚠️  The database is locked exclusively, running the reports one by one")
+    elif jobs > 1 and not isinstance(conn, WorkingCopy):
+        conn.commit()
+        results = ReportExecutor(jobs=jobs).run(FUNNY_PLACE_REPORTS)
+        print_report_results(results, timings=not brief)
+        return
+
+    for label, report in FUNNY_PLACE_REPORTS:
+        report(conn)
+
+
+
+
+def devel(in_memory=False, save_to=None, profile=None, helper_indexes=False, jobs=1,
+          persistent_cache=False, rule_stats=False):
     # open the connection to the database
-    conn = get_connection()
+    # in_memory works on a RAM copy that is only written back by save()
+    conn = get_connection(in_memory=in_memory, profile=profile)
 
     dry_run = False
     brief = False
 
-    fix_places(conn, dry_run=dry_run, brief=brief)
+    if rule_stats:
+        # regenerate the rule stages with a timer around every rule
+        RULES.compile(timing=True)
+
+    if helper_indexes:
+        # temporary indexes for the reference lookups, dropped on exit
+        with HelperIndexes(conn, brief=brief):
+            fix_places(conn, dry_run=dry_run, brief=brief, persistent_cache=persistent_cache,
+                       jobs=jobs)
+            funny_place_report(conn, brief=False, jobs=jobs)
+    else:
+        fix_places(conn, dry_run=dry_run, brief=brief, persistent_cache=persistent_cache,
+                   jobs=jobs)
+        funny_place_report(conn, brief=False, jobs=jobs)
+
+    if rule_stats:
+        RULES.report()
 
-    funny_place_report(conn, brief=False)
+    if in_memory:
+        try:
+            path = conn.save(save_to)
+        except ValueError as e:
+            sys.exit(f"❌ Working copy not saved: {e}")
+        print(f"💾 Working copy saved to {path}")
 
     conn.close()
 
 if __name__ == "__main__":
-    devel()
+    import argparse
+    parser = argparse.ArgumentParser(description="Clean up RootsMagic PlaceTable entries")
+    parser.add_argument("--in-memory", action="store_true",
+                        help="Work on an in-memory copy and save it when done")
+    parser.add_argument("--save-to", help="With --in-memory, save to this file instead of the original")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
+    parser.add_argument("--helper-indexes", action="store_true",
+                        help="Create temporary indexes for place-reference lookups during the run")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for normalizing place names and for the closing reports")
+    parser.add_argument("--normalize-cache", action="store_true",
+                        help="Keep normalization results next to the database for the next run")
+    parser.add_argument("--rule-stats", action="store_true",
+                        help="Time every normalizer rule and report the slow and unused ones")
+    args = parser.parse_args()
+
+    devel(in_memory=args.in_memory, save_to=args.save_to, profile=args.profile,
+          helper_indexes=args.helper_indexes, jobs=args.jobs,
+          persistent_cache=args.normalize_cache, rule_stats=args.rule_stats)
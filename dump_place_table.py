@@ -1,9 +1,10 @@
 from rmutils import get_connection
+from config import SQLITE_PROFILES
 import csv
 
 
-def dump_places(to_csv=None):
-    conn = get_connection()
+def dump_places(to_csv=None, reindex=None, profile=None):
+    conn = get_connection(reindex=reindex, profile=profile)
     cursor = conn.execute("SELECT PlaceID, Name FROM PlaceTable WHERE PlaceType != 1 ORDER BY PlaceID")
     rows = cursor.fetchall()
     conn.close()
@@ -24,6 +25,10 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Dump RootsMagic PlaceTable entries")
     parser.add_argument("--csv", help="Optional output file to save as CSV")
+    parser.add_argument("--reindex", action="store_true", default=None,
+                        help="Force REINDEX RMNOCASE even if the indexes look current")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
     args = parser.parse_args()
 
-    dump_places(args.csv)
+    dump_places(args.csv, reindex=args.reindex, profile=args.profile)
@@ -1,7 +1,8 @@
 
 import os
 from urllib.parse import urlparse, unquote
-from rmutils import get_connection, run_query, get_config
+from rmutils import get_connection, iter_query, get_config
+from config import SQLITE_PROFILES
 
 def build_full_path(media_path, media_file, rmtree_dir):
     if not media_path or not media_file:
@@ -18,17 +19,16 @@ def build_full_path(media_path, media_file, rmtree_dir):
         local_path = media_path
     return os.path.join(local_path, media_file.strip())
 
-def find_missing_files():
+def find_missing_files(profile=None):
     config = get_config()
     rmtree_dir = os.path.dirname(os.path.abspath(config["rmtree_path"]))
-    conn = get_connection()
+    conn = get_connection(profile=profile)
 
     query = "SELECT MediaID, MediaPath, MediaFile, MediaType FROM MultimediaTable"
-    media_df = run_query(conn, query)
 
     missing_files = []
-    for _, row in media_df.iterrows():
-        full_path = build_full_path(row["MediaPath"], row["MediaFile"], rmtree_dir)
+    for media_id, media_path, media_file, media_type in iter_query(conn, query):
+        full_path = build_full_path(media_path, media_file, rmtree_dir)
         if not full_path:
             continue
         if not os.path.isfile(full_path):
@@ -36,8 +36,8 @@ def find_missing_files():
 
     return missing_files
 
-def main():
-    missing = find_missing_files()
+def main(profile=None):
+    missing = find_missing_files(profile=profile)
     if missing:
         print("Missing media files:")
         for path in missing:
@@ -47,4 +47,10 @@ def main():
     return missing
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="List RootsMagic media files missing on disk")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
+    args = parser.parse_args()
+
+    main(profile=args.profile)
@@ -4,7 +4,7 @@ import signal
 import argparse
 from collections import defaultdict
 from rmutils import get_connection, get_primary_names
-from config import UNIQUE_FACT_TYPES
+from config import UNIQUE_FACT_TYPES, SQLITE_PROFILES
 
 signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
@@ -41,8 +41,8 @@ def get_event_details(conn, person_ids, event_type_ids):
     """
     return conn.execute(query).fetchall()
 
-def run():
-    conn = get_connection()
+def run(reindex=None, profile=None):
+    conn = get_connection(reindex=reindex, profile=profile)
     duplicates = find_duplicate_unique_facts(conn)
     if not duplicates:
         return []
@@ -77,9 +77,13 @@ def run():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Detect duplicate unique fact types in RootsMagic database")
     parser.add_argument("--summary", action="store_true", help="Only print summary count")
+    parser.add_argument("--reindex", action="store_true", default=None,
+                        help="Force REINDEX RMNOCASE even if the indexes look current")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
     args = parser.parse_args()
 
-    facts = run()
+    facts = run(reindex=args.reindex, profile=args.profile)
     if args.summary:
         print(f"[find_multiple_unique_facts] {len(facts)} duplicate facts found")
     else:
@@ -0,0 +1,254 @@
+# gazetteer.py
+"""
+The U.S. counties (us_counties.txt) and places (us_places.txt), indexed.
+
+config.US_COUNTIES and config.US_PLACES are lists in file order; testing a
+pair against them scans every entry.  A Gazetteer answers the normalizer's
+questions through the query methods below instead.  Counties are held in
+frozensets and dicts, by (county, state) and state, also casefolded.  Places,
+the list that grows to national size, stay on disk in a sorted PlaceIndex
+(placeindex.py) searched by (city, state).  Where a query can have more than
+one answer, the first in file order is the one the list scans found.
+
+GAZETTEER is loaded on first use.  The county indexes come from a pickle
+("us_gazetteer.cache") and the places from "us_places.idx", both next to
+the text files; each is rebuilt when its text file's mtime or size changes
+and its content hash does too, so worker processes and later runs skip the
+parsing and indexing.  Where that directory is read-only, the place index
+goes to a private per-user cache directory instead (never a shared one like
+/tmp, where another user could plant an index), or failing that to a
+temporary file that only lives as long as the process.
+"""
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+
+from config import load_us_counties, load_us_places
+from placeindex import PlaceIndex, write_place_index, stamp_place_index
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+COUNTIES_FILE = "us_counties.txt"
+PLACES_FILE = "us_places.txt"
+CACHE_PATH = os.path.join(BASE_PATH, "us_gazetteer.cache")
+PLACE_INDEX_PATH = os.path.join(BASE_PATH, "us_places.idx")
+CACHE_FORMAT = 3  # bump when Gazetteer's fields change
+USER_CACHE_NAME = "rmtree-gazetteer"  # under $XDG_CACHE_HOME or ~/.cache
+
+
+class Gazetteer:
+    """Indexed counties [(county, state)] and a PlaceIndex of [(city, "X County", state)]."""
+
+    def __init__(self, counties, places: PlaceIndex):
+        self.counties = tuple(counties)
+        self.places = places
+
+        self._counties = frozenset(self.counties)
+        self._counties_folded = frozenset(_folded(entry) for entry in self.counties)
+        self._counties_by_state = {}    # state -> frozenset of counties
+        for county, state in self.counties:
+            self._counties_by_state.setdefault(state, set()).add(county)
+        self._counties_by_state = {state: frozenset(names) for state, names in self._counties_by_state.items()}
+
+    def __getstate__(self):
+        # the place index is a file of its own; load_gazetteer() reattaches it
+        state = dict(vars(self))
+        state["places"] = None
+        return state
+
+    def is_county(self, county: str, state: str, ignore_case: bool = False) -> bool:
+        """True if county (without " County") is a county of state."""
+        if ignore_case:
+            return _folded((county, state)) in self._counties_folded
+        return (county, state) in self._counties
+
+    def is_place(self, city: str, county: str, state: str, ignore_case: bool = False) -> bool:
+        """True if city is listed in county ("X County") of state."""
+        counties = self.places.counties(city, state, ignore_case)
+        if ignore_case:
+            return county.casefold() in {found.casefold() for found in counties}
+        return county in counties
+
+    def counties_of(self, city: str, state: str, ignore_case: bool = False) -> list:
+        """The distinct counties ("X County") city is listed in, in file order."""
+        return list(dict.fromkeys(self.places.counties(city, state, ignore_case)))
+
+    def county_of(self, city: str, state: str, ignore_case: bool = False) -> str | None:
+        """The first county ("X County") city is listed in, or None."""
+        counties = self.places.counties(city, state, ignore_case)
+        return counties[0] if counties else None
+
+    def counties_in(self, state: str) -> frozenset:
+        return self._counties_by_state.get(state, frozenset())
+
+    def places_in(self, state: str, county: str | None = None) -> frozenset:
+        """The cities of state, or only those listed in its county ("X County")."""
+        return self.places.cities_in(state, county)
+
+    def __repr__(self):
+        return f"Gazetteer({len(self.counties)} counties, {len(self.places)} places)"
+
+
+def _folded(fields):
+    return tuple(field.casefold() for field in fields)
+
+
+def _signature(path) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _digest(path) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _read_cache(path, source):
+    """The cached county indexes (a Gazetteer without places), or None if missing or stale."""
+    signature = _signature(source)
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header.get("format") != CACHE_FORMAT:
+                return None
+            if header["signature"] == signature:
+                return pickle.load(f)
+            # touched but maybe not changed: only the content counts
+            if header["digest"] == _digest(source):
+                gazetteer = pickle.load(f)
+                _write_cache(path, source, gazetteer)
+                return gazetteer
+    except Exception:
+        # an unreadable cache is rebuilt like a stale one
+        return None
+    return None
+
+
+def _write_cache(path, source, gazetteer):
+    header = {"format": CACHE_FORMAT, "signature": _signature(source), "digest": _digest(source)}
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(gazetteer, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        # e.g. a read-only install: the next process just builds it again
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _current_index(path, signature, digest=None):
+    """The PlaceIndex at path if it was built from the source with this signature (or digest)."""
+    try:
+        index = PlaceIndex(path)
+    except (OSError, ValueError):
+        return None
+    if index.signature == signature or (digest is not None and index.digest == digest):
+        return index
+    index.close()
+    return None
+
+
+def _user_cache_dir(create=False):
+    """This user's cache directory for the place index (mode 0700), or None if missing or untrusted."""
+    if not hasattr(os, "getuid"):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.path.join(base, USER_CACHE_NAME)
+    try:
+        if create:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        info = os.lstat(directory)
+    except OSError:
+        return None
+    # an existing directory must be ours and closed to everyone else
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        return None
+    return directory
+
+
+def _private_place_index(places, stamp) -> PlaceIndex:
+    """A PlaceIndex in a new temporary file of our own, unlinked once mapped."""
+    handle, temporary = tempfile.mkstemp(suffix=".idx", prefix="us_places-")
+    os.close(handle)
+    try:
+        write_place_index(temporary, places, stamp)
+        return PlaceIndex(temporary)
+    finally:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass  # e.g. Windows, which can't remove a mapped file; mkstemp made it 0600
+
+
+def open_place_index(path=PLACE_INDEX_PATH) -> PlaceIndex:
+    """The PlaceIndex of us_places.txt at path, (re)written first if stale."""
+    source = os.path.join(BASE_PATH, PLACES_FILE)
+    signature = _signature(source)
+    index = _current_index(path, signature)
+    if index is not None:
+        return index
+
+    digest = _digest(source)
+    # beside the text file, or in this user's cache directory if that is read-only
+    def targets(create):
+        yield path
+        cache_dir = _user_cache_dir(create)
+        if cache_dir is not None:
+            yield os.path.join(cache_dir, f"us_places-{digest.hex()[:16]}.idx")
+
+    for target in targets(create=False):
+        index = _current_index(target, signature, digest)
+        if index is not None:
+            if index.signature != signature:
+                # touched but not changed
+                stamp_place_index(target, signature + (digest,))
+                index.signature = signature
+            return index
+
+    places = load_us_places()
+    for target in targets(create=True):
+        temporary = f"{target}.{os.getpid()}.tmp"
+        try:
+            write_place_index(temporary, places, signature + (digest,))
+            os.replace(temporary, target)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            continue
+        return PlaceIndex(target)
+    return _private_place_index(places, signature + (digest,))
+
+
+def load_gazetteer(cache_path=CACHE_PATH, place_index_path=PLACE_INDEX_PATH) -> Gazetteer:
+    """The Gazetteer from the county cache and the place index, each rebuilt if stale."""
+    source = os.path.join(BASE_PATH, COUNTIES_FILE)
+    gazetteer = _read_cache(cache_path, source)
+    if gazetteer is None:
+        gazetteer = Gazetteer(load_us_counties(), None)
+        _write_cache(cache_path, source, gazetteer)
+    gazetteer.places = open_place_index(place_index_path)
+    return gazetteer
+
+
+class _LazyGazetteer:
+    """Stands in for the Gazetteer until an attribute is first asked for, then loads it."""
+
+    def __init__(self):
+        self._gazetteer = None
+
+    def __getattr__(self, name):
+        # only reached for attributes not copied over yet
+        if self._gazetteer is None:
+            self._gazetteer = load_gazetteer()
+        value = getattr(self._gazetteer, name)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self):
+        return repr(self._gazetteer) if self._gazetteer else "Gazetteer (not loaded yet)"
+
+
+GAZETTEER = _LazyGazetteer()
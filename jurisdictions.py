@@ -0,0 +1,138 @@
+# jurisdictions.py
+"""
+Which country, state, territory or province a place name ends with.
+
+The config tables (FOREIGN_COUNTRIES, STATE_NAMES, HISTORICAL_US_TERRITORIES,
+MEXICAN_STATES, CANADIAN_PROVINCES) are loaded once into a trie keyed on the
+reversed characters of every entry, so one walk from the end of a name finds
+every entry it ends with, and where that entry starts, instead of an
+endswith() per entry.
+
+Every match carries the entry's position in its table (the iteration order
+of the table when this module was imported): the normalizer's loops stop at
+the first table entry that matches, and ranks let them keep doing exactly
+that.
+
+classify() sorts a name by the region it ends in, so the normalizer can run
+only the passes for that region.
+"""
+from collections import namedtuple
+
+from config import (
+    FOREIGN_COUNTRIES,
+    STATE_NAMES,
+    HISTORICAL_US_TERRITORIES,
+    MEXICAN_STATES,
+    CANADIAN_PROVINCES,
+)
+
+COUNTRY = "country"
+US_STATE = "state"
+US_TERRITORY = "territory"
+MEXICAN_STATE = "mexican state"
+CANADIAN_PROVINCE = "canadian province"
+
+# regions classify() sorts names into
+USA = "USA"
+CANADA = "Canada"
+MEXICO = "Mexico"
+HISTORICAL_TERRITORY = "historical territory"
+FOREIGN = "foreign"
+UNKNOWN = "unknown"
+
+# start: index in the name where the entry begins; rank: position in its table
+Suffix = namedtuple("Suffix", ["start", "kind", "rank", "entry"])
+
+_END = ""  # trie key holding the entries that end at a node
+
+
+class SuffixTrie:
+    """Entries stored back to front; suffixes(name) finds those name ends with."""
+
+    def __init__(self):
+        self._root = {}
+        self._names = {}
+
+    def add(self, entry, kind, rank):
+        node = self._root
+        for char in reversed(entry):
+            node = node.setdefault(char, {})
+        node.setdefault(_END, []).append((kind, rank, entry))
+        self._names.setdefault(entry.casefold(), set()).add(kind)
+
+    def suffixes(self, name, kind=None):
+        """Entries name ends with (of one kind if given), shortest first."""
+        found = []
+        node = self._root
+        for start in range(len(name) - 1, -1, -1):
+            node = node.get(name[start])
+            if node is None:
+                break
+            for entry_kind, rank, entry in node.get(_END, ()):
+                if kind is None or entry_kind == kind:
+                    found.append(Suffix(start, entry_kind, rank, entry))
+        return found
+
+    def ends_with(self, name, kinds, separator=""):
+        """True if name ends with an entry of one of kinds, preceded by separator."""
+        for suffix in self.suffixes(name):
+            if suffix.kind in kinds and name[:suffix.start].endswith(separator):
+                return True
+        return False
+
+    def is_a(self, name, kind):
+        """Whole-name match, ignoring case and surrounding whitespace."""
+        return kind in self._names.get(name.strip().casefold(), ())
+
+
+def build_trie():
+    trie = SuffixTrie()
+    for kind, table in (
+        (COUNTRY, FOREIGN_COUNTRIES),
+        (US_STATE, STATE_NAMES),
+        (US_TERRITORY, HISTORICAL_US_TERRITORIES),
+        (MEXICAN_STATE, MEXICAN_STATES),
+        (CANADIAN_PROVINCE, CANADIAN_PROVINCES),
+    ):
+        for rank, entry in enumerate(table):
+            trie.add(entry, kind, rank)
+    return trie
+
+
+JURISDICTIONS = build_trie()
+
+
+def build_region_trie():
+    """Casefolded entries by region; a region's own tables win over FOREIGN_COUNTRIES ("Canada")."""
+    regions = {}
+    for region, table in (
+        (FOREIGN, FOREIGN_COUNTRIES),
+        (HISTORICAL_TERRITORY, HISTORICAL_US_TERRITORIES),
+        (USA, list(STATE_NAMES) + ["USA"]),
+        (CANADA, CANADIAN_PROVINCES + ["Canada"]),
+        (MEXICO, MEXICAN_STATES + ["Mexico"]),
+    ):
+        for entry in table:
+            regions[entry.casefold()] = region
+    trie = SuffixTrie()
+    for entry, region in regions.items():
+        trie.add(entry, region, 0)
+    return trie
+
+
+REGIONS = build_region_trie()
+
+
+def classify(name) -> str:
+    """
+    The region name ends in: USA, CANADA, MEXICO, HISTORICAL_TERRITORY,
+    FOREIGN or UNKNOWN.  The longest entry ending the name at a word
+    boundary decides, ignoring case and trailing whitespace, so "Baja
+    California" is Mexican and "Santa Fe, New Mexico" American.
+    """
+    folded = name.rstrip().casefold()
+    region = UNKNOWN
+    for suffix in REGIONS.suffixes(folded):  # shortest first
+        if suffix.start == 0 or not folded[suffix.start - 1].isalnum():
+            region = suffix.kind
+    return region
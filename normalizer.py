@@ -1,35 +1,235 @@
 import sqlite3
 import re
 import inspect
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 
 from config import (
 #    rmtree_path,
 #    extension_path,
-    US_COUNTIES,
     STATE_ABBREVIATIONS,
-    OLD_STYLE_ABBR,
     STATE_NAMES,
-    US_PLACES,
-    FOREIGN_COUNTRIES,
     COMMON_PLACE_MAPPINGS,
     SPECIAL_PLACE_MAPPINGS,
     MEXICAN_STATES,
     CANADIAN_PROVINCES,
     HISTORICAL_US_TERRITORIES,
 )
+from jurisdictions import (
+    JURISDICTIONS,
+    COUNTRY,
+    US_STATE,
+    US_TERRITORY,
+    MEXICAN_STATE,
+    CANADIAN_PROVINCE,
+    USA,
+    CANADA,
+    MEXICO,
+    classify,
+)
+from gazetteer import GAZETTEER
+from normcache import NormalizationCache, MISS, cache_path_for
+from place import Place
+from rulebook import load_rules, DIGIT
+from spelling import correct_misspellings
+
+# results of normalize_place_iteratively(), keyed by name and rule-set version
+NORMALIZE_CACHE = NormalizationCache()
+
+
+# The plain substitution rules of normalize_once() live in
+# normalizer_rules.toml; RULES[stage](name) runs one stage of them
+RULES = load_rules()
+
+
+# ───────────────────────────────────────────────
+# Compiled rule tables
+#
+# Every other pattern applied per place is compiled once, here, in the order
+# the rules run.  Passing pattern strings to re.sub() went through the re
+# module cache ~200 times per place, and the patterns built in loops over the
+# config tables overflowed it, so most places recompiled them.
+# ───────────────────────────────────────────────
+
+def _compile_rules(rules, flags=0):
+    return [(re.compile(pattern, flags), repl) for pattern, repl in rules]
+
+
+def _apply_rules(rules, name):
+    for pattern, repl in rules:
+        name = pattern.sub(repl, name)
+    return name
+
+
+class _RuleFamily:
+    """
+    Related substitutions behind one fused alternation.  When the alternation
+    finds nothing, none of the members can match and the family is skipped
+    with a single search; otherwise the members run in order as before.
+
+    A member given as (pattern, repl, literals) also needs one of the
+    literals in the name; RULES.literals finds them in the same scan as the
+    rule file's, and members without theirs are skipped.
+    """
+
+    def __init__(self, rules, flags=0):
+        self.rules = _compile_rules([rule[:2] for rule in rules], flags)
+        self.requires = [frozenset(RULES.literals.key(l) for l in rule[2]) if len(rule) > 2 else None
+                         for rule in rules]
+        RULES.literals.add(literal for rule in rules if len(rule) > 2 for literal in rule[2])
+        self.gate = re.compile("|".join(f"(?:{rule[0]})" for rule in rules), flags)
+        self.calls = 0
+        self.skipped = 0
+        RULES.add_family(self)
+
+    def apply(self, name):
+        self.calls += 1
+        if not self.gate.search(name):
+            return name
+        found = RULES.literals.present(name)
+        for (pattern, repl), requires in zip(self.rules, self.requires):
+            if requires is not None and found.isdisjoint(requires):
+                self.skipped += 1
+                continue
+            new_name = pattern.sub(repl, name)
+            if new_name != name:
+                name = new_name
+                found = RULES.literals.present(name)
+        return name
+
+
+# fix_address()
+_COMPASS_SUFFIX = re.compile(r".*\b[NS]\. *[EW]\.*$", re.IGNORECASE)
+_TRAILING_PERIOD = re.compile(r"\.$", re.IGNORECASE)
+_SPLIT_COMPASS = re.compile(r"([NSEW])\. *([NSEW])$", re.IGNORECASE)
+_COMPASS_PAIR = re.compile("[NSEW][NSEW]$", re.IGNORECASE)
+
+# pp_for_strip_address(): strip_address picks up on digits in the name,
+# so numbered wards, districts and precincts go first
+_NUMBERED_DIVISIONS = _RuleFamily([
+    (r"\#", "", ["#"]),
+    (r"\bWard\s+[0-9]+", " ", ["Ward"]),
+    (r"\bMagisterial\s+District\s+No\s+[0-9]+", " ", ["Magisterial"]),
+    (r"\bMagisterial\s+District\s+[0-9]+", " ", ["Magisterial"]),
+    (r"\bMagisterial\s+Dist\s+\#*[0-9]+", " ", ["Magisterial"]),
+    (r"\bElection\s+District\s+[0-9]+", " ", ["Election"]),
+    (r"\bElection\s+Precinct\s+[0-9]+", " ", ["Election"]),
+    (r"\bElec\s+Prec\s+[0-9]+", " ", ["Elec"]),
+    (r"\bSchool\s+District\s+No\s+[0-9]+", " ", ["School"]),
+    (r"\bSchool\s+District\s+[0-9]+", " ", ["School"]),
+    (r"\bMag\s+Dist\s+[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+Dist\s+\#[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+D\s+[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+D[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+Dist\s+No\s+[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+Dist\s+No\s+[0-9]+", " ", ["Mag"]),
+    (r"\bMag\s+Dist\s+[0-9]+", " ", ["Mag"]),
+    (r"\bCivil\s+District\s+[0-9]+", " ", ["Civil"]),
+    (r"\bAssembly\s+District\s+[0-9]+", " ", ["Assembly"]),
+    (r"\bDistrict\s+[0-9]+", " ", ["District"]),
+    (r"\bSubdivision\s+[0-9]+", " ", ["Subdivision"]),
+    (r"\bDist-[0-9]+", " ", ["Dist-"]),
+    (r"\bDis-[0-9]+", " ", ["Dis-"]),
+    (r"\bDist\s+[0-9]+", " ", ["Dist"]),
+    (r"\bDis\s+[0-9]+", " ", ["Dis"]),
+    (r"\bBeat\s+[0-9]+", " ", ["Beat"]),
+    (r"\bRegiment\s+[0-9]+", " ", ["Regiment"]),
+    (r"\bJustice\s+Precinct\s+[0-9]+", " ", ["Justice"]),
+    (r"\bJustice\s+Precint\s+[0-9]+", " ", ["Justice"]),
+    (r"\bJ\s+P\s+[0-9]+", " ", [DIGIT]),
+    (r"\bA\s+D\s+[0-9]+", " ", [DIGIT]),
+    (r"\bG\s+H\s+No\s+[0-9]+", " ", [DIGIT]),
+    (r"\bJustice\s+Precinct", " ", ["Justice"]),
+    (r"\bPrecinct\s+[0-9]+", " ", ["Precinct"]),
+    (r"\bPrecint\s+[0-9]+", " ", ["Precint"]),
+], re.IGNORECASE)
+_STRAY_PERIODS = _compile_rules([
+    (r'\ \.', '.'),
+    (r'\.\.', '.'),
+    (r'\.  \,', '.,'),
+], re.DOTALL)
+_LEADING_SYMBOLS = re.compile(r"^[^\w\d]*")
+_APARTMENT = re.compile(r".*\bApt\.*\s+No\.*\s+\d+\.*", re.IGNORECASE)
+_APARTMENT_NUMBER = re.compile(r"\s*Apt\.*\s+No\.*\s+\d+\.*", re.IGNORECASE)
+_WASHINGTON_DC = re.compile(r".*\bWashington\,*\b.*\bD\.* *c\.$", re.IGNORECASE)
+_WASHINGTON_DC_TAIL = re.compile(r"\s+Washington\,*\s+.*\bD\.* *c\.$", re.IGNORECASE)
+_TOWNSHIP_RANGE = re.compile(r'^\d+\s+[NS]\s+\d+\s+[EW]', re.IGNORECASE)
+_RANGE = re.compile(r'(\d+\s+[EW])', re.IGNORECASE)
+_TOWNSHIP_R_RANGE = re.compile(r'^\d+\s+[NS]\s+R\s+\d+\s+[EW]', re.IGNORECASE)
+_R_RANGE = re.compile(r'([NS])\s+R\s+')
+_DROPPED_SINGLE_FIELDS = {
+    "Ev": "", "Sh": "", "Sp": "", "Fw": "", "Rural": "", "Suburban": "",
+    "This City": "", "Railroad Board": "", "North Main street": "",
+    "Salt/Lake-City": "Salt Lake City",
+}
+
+# strip_address_if_present()
+_TOWNSHIP_NUMBER = re.compile(r"\bTownship\s+[0-9]+", re.IGNORECASE)
+_RANGE_NUMBER = re.compile(r"\bRange\s+[0-9]+", re.IGNORECASE)
+_NON_DIGIT_PREFIX = re.compile(r"^[^\d]*")
+_ADDRESS_BEFORE_COMMA = re.compile(r"^\d{1,6}(?:\s+\S+){0,5}$")
+_ADDRESS_ONLY = re.compile(r"^\d{1,6}(?:\s+\S+){0,4}$")
+_NOT_AN_ADDRESS_ENDINGS = (COUNTRY, US_STATE, MEXICAN_STATE, CANADIAN_PROVINCE)
+_ADDRESS_STREET_SUFFIXES = [
+    "Street", "St", "Avenue", "Ave", "Road", "Rd", "Drive", "Dr", "Lane", "Ln",
+    "Boulevard", "Blvd", "Court", "Ct", "Terrace", "Place", "Way", "Loop", "Trail",
+    "Highway", "Hwy", "Parkway", "Pkwy", "Circle", "Plaza"
+]
+_ADDRESS_GEO_SUFFIXES = ["SW", "SE", "NE", "NW", "N", "S", "E", "W"]
+_ADDRESS = re.compile(
+    r'^\s*'
+    r'(?P<addr>\d{1,6}(?:\s+\S+){0,5})\s+'
+    r'\b(?:' + '|'.join(re.escape(s) for s in sorted(_ADDRESS_STREET_SUFFIXES, key=lambda s: -len(s))) + r')\b'
+    r'\b(?:' + '|'.join(re.escape(s) for s in sorted(_ADDRESS_GEO_SUFFIXES, key=lambda s: -len(s))) + r')\b'
+    r'(?:\s*\.\s*|\s*,\s*|\s+)?'
+    r'(?P<tail>.*)?$',
+    flags=re.IGNORECASE
+)
+_TRAILING_NON_WORD = re.compile(r"\W+$")
+_TRAILING_PERIODS = re.compile(r"\.+$")
+_TRAILING_COMMAS = re.compile(r"\,+$")
+
+# normalize_once(), in order of use
+_US_TWO_WORD_STATES = {
+    "West Virginia", "South Dakota", "North Dakota",
+    "New York", "New Jersey", "New Mexico",
+    "Rhode Island", "New Hampshire", "North Carolina", "South Carolina"
+}
+_NUMBERED_STREET = re.compile(r'^\d+\s+\w+')
+_STREET_WORD = re.compile(r'\b(St|Ave|Blvd|Rd|Ln|Dr|Ct|Way|Circle|Pl|Terrace)\b', re.IGNORECASE)
+# these run only when RULES.literals finds what they need (registered below)
+_PLSS = re.compile(r'\bT(?:wp)?\s*(\d+)([NS])\s*R\s*(\d+)([EW])\b')
+_NAMED_TOWNSHIP = re.compile(r'^.*[a-z]\s+Township\s+[a-z].*', re.IGNORECASE)
+_NAMED_TOWNSHIP_HEAD = re.compile(r'^(.*?\s+Township)')
+
+# one pattern per state or territory; JURISDICTIONS ranks them in config
+# table order because the loops below stop at the first match
+_STATE_NAME_COMMA = {state: re.compile(rf" (?!.*, ){state}$") for state in STATE_NAMES}
+_TERRITORY_COMMA = {
+    territory: (re.compile(rf"\b(.+?)\s+{re.escape(territory)}$"), rf"\1, {territory}")
+    for territory in HISTORICAL_US_TERRITORIES
+}
+_DOUBLE_COMMA = re.compile(r',,')
+_MEXICO_COMMA = re.compile(r"(?<!New) Mexico")
+_PARENTHETICAL = re.compile(r"\s*\([^()]*\)")
+_EXCESS_SPACES = re.compile(r"\s{2,}")
+_LEADING_HYPHEN = re.compile(r"^-")
+_PARENTHETICAL_PREFIX = re.compile(r'^[^,]*\([^)]*\),\s*')
+_PARENTHETICAL_CITY = re.compile(r'^\s*\((.*?)\),\s*(\w[\w\s.-]+?),\s*(.+)$')
+RULES.literals.add([DIGIT, "Township", "("])
+_STATES_WITH_SAME_NAME_COUNTY = {"arkansas", "idaho", "oklahoma", "iowa", "utah", "hawaii", "new york"}
 
 
 def fix_address(address):
-    m = re.match(r".*\b[NS]\. *[EW]\.*$", address, flags=re.IGNORECASE)
+    m = _COMPASS_SUFFIX.match(address)
     if m:
         # print(f"match: {m}")
-        address = re.sub(r"\.$", r'', address, flags=re.IGNORECASE)
+        address = _TRAILING_PERIOD.sub(r'', address)
         # print(f"address: {address}")
-        address = re.sub(r"([NSEW])\. *([NSEW])$", r'\1\2', address, flags=re.IGNORECASE)
+        address = _SPLIT_COMPASS.sub(r'\1\2', address)
         # print(f"address: {address}")
-        # address = re.sub(r"([NSEW][NSEW])$", r'\1\2', address, re.IGNORECASE)
-        pattern = "[NSEW][NSEW]$"
-        address = re.sub(pattern, lambda match: match.group(0).upper(), address, flags=re.IGNORECASE)
+        address = _COMPASS_PAIR.sub(lambda match: match.group(0).upper(), address)
         # print(f"address: {address}")
         return address      
     return address      
@@ -40,118 +240,53 @@ def pp_for_strip_address(name):
 
     # strip_address picks up on digits in the name
     # we should take care of these ourselves first
-    name = re.sub(r"\#", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bWard\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMagisterial\s+District\s+No\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMagisterial\s+District\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMagisterial\s+Dist\s+\#*[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bElection\s+District\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bElection\s+Precinct\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bElec\s+Prec\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bSchool\s+District\s+No\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bSchool\s+District\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+Dist\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+Dist\s+\#[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+D\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+D[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+Dist\s+No\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+Dist\s+No\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bMag\s+Dist\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bCivil\s+District\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bAssembly\s+District\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bDistrict\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bSubdivision\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bDist-[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bDis-[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bDist\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bDis\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bBeat\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bRegiment\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bJustice\s+Precinct\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bJustice\s+Precint\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bJ\s+P\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bA\s+D\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bG\s+H\s+No\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bJustice\s+Precinct", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bPrecinct\s+[0-9]+", " ", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bPrecint\s+[0-9]+", " ", name, flags=re.IGNORECASE)
+    name = _NUMBERED_DIVISIONS.apply(name)
     # name = re.sub(r" Ward [0-9][0-9]", " ", name)
 
-    name = re.sub(r'\ \.', '.', name, flags=re.DOTALL)
-    name = re.sub(r'\.\.', '.', name, flags=re.DOTALL)
-    name = re.sub(r'\.  \,', '.,', name, flags=re.DOTALL)
+    name = _apply_rules(_STRAY_PERIODS, name)
 
     # Remove leading symbols before first digit (e.g., "-410 N. Euclid")
-    name = re.sub(r"^[^\w\d]*", "", name)
+    name = _LEADING_SYMBOLS.sub("", name)
 
     # If there is an apartment number in the address, we are dropping it
     # get the first field, leave the rest as is
-    parts = [p.strip() for p in name.split(",")]
-    first_part = parts[0]
-    m = re.match(r".*\bApt\.*\s+No\.*\s+\d+\.*", parts[0], flags=re.IGNORECASE)
+    place = Place.parse(name)
+    m = _APARTMENT.match(place[0])
     if m:
         # print(f"match: {m}")
-        parts[0] = re.sub(r"\s*Apt\.*\s+No\.*\s+\d+\.*", r'', parts[0], flags=re.IGNORECASE)
-        # print(f"parts[0]: {parts[0]}")
-        name = ", ".join(parts)
+        place = place.replace(0, _APARTMENT_NUMBER.sub(r'', place[0]))
+        # print(f"place[0]: {place[0]}")
+        name = place.joined()
         # print(f"{name}")
 
 
     # print(f"{name}")
-    m = re.match(r".*\b[NS]\. *[EW]\.*$", name, flags=re.IGNORECASE)
-    if m:
-        # print(f"match: {m}")
-        name = re.sub(r"\.$", r'', name, flags=re.IGNORECASE)
-        # print(f"name: {name}")
-        name = re.sub(r"([NSEW])\. *([NSEW])$", r'\1\2', name, flags=re.IGNORECASE)
-        # print(f"name: {name}")
-        # name = re.sub(r"([NSEW][NSEW])$", r'\1\2', name, re.IGNORECASE)
-        pattern = "[NSEW][NSEW]$"
-        name = re.sub(pattern, lambda match: match.group(0).upper(), name, flags=re.IGNORECASE)
-        # print(f"name: {name}")
+    # same compass clean up as fix_address(), e.g. "... N. W." → "... NW"
+    name = fix_address(name)
 
 
-    m = re.match(r".*\bWashington\,*\b.*\bD\.* *c\.$", name, flags=re.IGNORECASE) 
+    m = _WASHINGTON_DC.match(name) 
     if m:
         # print(f"match: {m}")
-        name = re.sub(r"\s+Washington\,*\s+.*\bD\.* *c\.$", r', Washington, District of Columbia, USA', name, flags=re.IGNORECASE)
+        name = _WASHINGTON_DC_TAIL.sub(r', Washington, District of Columbia, USA', name)
         # print(f"name: {name}")
 
 
 
     # Transform names that obviously begin with a township designation
-    m = re.match(r'^\d+\s+[NS]\s+\d+\s+[EW]', name, flags=re.IGNORECASE)
+    m = _TOWNSHIP_RANGE.match(name)
     if m:
-        name = re.sub(r'^', r'Township ', name)            
-        name = re.sub(r'(\d+\s+[EW])', r'Range \1', name, flags=re.IGNORECASE)            
+        name = "Township " + name
+        name = _RANGE.sub(r'Range \1', name)            
 
-    m = re.match(r'^\d+\s+[NS]\s+R\s+\d+\s+[EW]', name, flags=re.IGNORECASE)
+    m = _TOWNSHIP_R_RANGE.match(name)
     if m:
-        name = re.sub(r'^', r'Township ', name)            
-        name = re.sub(r'([NS])\s+R\s+', r'\1 Range ', name)            
-
-
-    if len(parts) == 1:
-        if parts[0] == "Ev":
-            name = ""
-        if parts[0] == "Sh":
-            name = ""
-        if parts[0] == "Sp":
-            name = ""
-        if parts[0] == "Fw":
-            name = ""
-        if parts[0] == "Rural":
-            name = ""
-        if parts[0] == "Suburban":
-            name = ""
-        if parts[0] == "This City":
-            name = ""
-        if parts[0] == "Railroad Board":
-            name = ""
-        if parts[0] == "North Main street":
-            name = ""
-        if parts[0] == "Salt/Lake-City":
-            name = "Salt Lake City"
+        name = "Township " + name
+        name = _R_RANGE.sub(r'\1 Range ', name)            
+
+
+    if len(place) == 1:
+        name = _DROPPED_SINGLE_FIELDS.get(place[0], name)
 
 
     return name
@@ -171,11 +306,11 @@ def strip_address_if_present(name: str, pid: int = 0) -> tuple[str, str | None]:
         return name, None
 
     # Skip Townships
-    m = re.match(r"\bTownship\s+[0-9]+", name, flags=re.IGNORECASE)
+    m = _TOWNSHIP_NUMBER.match(name)
     if m:
         return name, None
 
-    m = re.match(r"\bRange\s+[0-9]+", name, flags=re.IGNORECASE)
+    m = _RANGE_NUMBER.match(name)
     if m:
         return name, None
 
@@ -184,14 +319,14 @@ def strip_address_if_present(name: str, pid: int = 0) -> tuple[str, str | None]:
     working = name.strip()
 
     # Remove leading symbols before first digit (e.g., "-410 N. Euclid")
-    working = re.sub(r"^[^\w\d]*", "", working)
+    working = _LEADING_SYMBOLS.sub("", working)
 
     # print(f"Try Fallback 1")
     # === Fallback 1: check if comma present and only evaluate portion before comma ===
     if "," in working:
         left, right = working.split(",", 1)
-        prefix = re.sub(r"^[^\d]*", "", left.strip())  # remove symbols before number
-        m = re.match(r"^\d{1,6}(?:\s+\S+){0,5}$", prefix)
+        prefix = _NON_DIGIT_PREFIX.sub("", left.strip())  # remove symbols before number
+        m = _ADDRESS_BEFORE_COMMA.match(prefix)
         if m:
             address = left.strip()
             # print(f"address: {address}")
@@ -203,26 +338,7 @@ def strip_address_if_present(name: str, pid: int = 0) -> tuple[str, str | None]:
 
     # print(f"Try Primary match")
     # === Primary match: full address up to known suffix ===
-    STREET_SUFFIXES = [
-        "Street", "St", "Avenue", "Ave", "Road", "Rd", "Drive", "Dr", "Lane", "Ln",
-        "Boulevard", "Blvd", "Court", "Ct", "Terrace", "Place", "Way", "Loop", "Trail",
-        "Highway", "Hwy", "Parkway", "Pkwy", "Circle", "Plaza"
-    ]
-    suffixes_sorted = sorted(STREET_SUFFIXES, key=lambda s: -len(s))
-    suffix_pattern = r'\b(?:' + '|'.join(re.escape(s) for s in suffixes_sorted) + r')\b'
-
-    GEO_SUFFIXES = ["SW", "SE", "NE", "NW", "N", "S", "E", "W"]
-    geo_suffixes_sorted = sorted(GEO_SUFFIXES, key=lambda s: -len(s))
-    geo_suffix_pattern = r'\b(?:' + '|'.join(re.escape(s) for s in geo_suffixes_sorted) + r')\b'
-
-    pattern = re.compile(
-        r'^\s*'
-        r'(?P<addr>\d{1,6}(?:\s+\S+){0,5})\s+' + suffix_pattern + geo_suffix_pattern +
-        r'(?:\s*\.\s*|\s*,\s*|\s+)?'
-        r'(?P<tail>.*)?$',
-        flags=re.IGNORECASE
-    )
-    match = pattern.match(working)
+    match = _ADDRESS.match(working)
     if match:
         address = working[:match.end()].strip()
         # print(f"address: {address}")
@@ -234,7 +350,7 @@ def strip_address_if_present(name: str, pid: int = 0) -> tuple[str, str | None]:
 
     # print(f"Try Fallback 2")
     # === Fallback 2: any address-looking prefix without requiring suffix ===
-    fallback2 = re.match(r"^\d{1,6}(?:\s+\S+){0,4}$", working)
+    fallback2 = _ADDRESS_ONLY.match(working)
     if fallback2:
         address = working.strip()
         # print(f"address: {address}")
@@ -261,34 +377,16 @@ def strip_address_if_present(name: str, pid: int = 0) -> tuple[str, str | None]:
        return name, None
     
     # strip any special character at the end
-    name = re.sub(r"\W+$", "", name)
-    name = re.sub(r"\.+$", "", name)
-    name = re.sub(r"\,+$", "", name)
+    name = _TRAILING_NON_WORD.sub("", name)
+    name = _TRAILING_PERIODS.sub("", name)
+    name = _TRAILING_COMMAS.sub("", name)
     # print(f"name: {name}")
 
-    # If we end in a known contry name, skip it
-    for country in FOREIGN_COUNTRIES:
-        if name.endswith(country):
-            # print(f"country found")
-            return name, None
-
-    # If we end in a known state or province name, skip it
-    for state in STATE_NAMES:
-        if name.endswith(state):
-            # print(f"state found")
-            return name, None
-
-    for state in MEXICAN_STATES:
-        if name.endswith(state):
-            # print(f"mexican state found")
-            return name, None
-
-    for province in CANADIAN_PROVINCES:
-        if name.endswith(province):
-            # print(f"province found")
-            return name, None
-
-    for suffix in STREET_SUFFIXES:
+    # If we end in a known country, state or province name, skip it
+    if JURISDICTIONS.ends_with(name, _NOT_AN_ADDRESS_ENDINGS):
+        return name, None
+
+    for suffix in _ADDRESS_STREET_SUFFIXES:
         if name.endswith(suffix):
             # print(f"suffix found")
             address = name
@@ -325,25 +423,23 @@ def normalize_once(pid, name, brief=True):
 
 
     # If 4 fields and ends with USA, remove ' County' from second field
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 4 and parts[-1].upper() == "USA":
-        if " County" in parts[1] and not is_legitimate_us_place_name(parts):
-            parts[1] = parts[1].replace(" County", "")
-            name = ", ".join(parts)
+    place = Place.parse(name)
+    if len(place) == 4 and place[-1].upper() == "USA":
+        if " County" in place[1] and not is_legitimate_us_place_name(place):
+            name = place.replace(1, place[1].replace(" County", "")).joined()
 
 
     # If 4 fields and ends with USA, remove ' County' from second field
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 4 and parts[-1].upper() == "USA":
-        if " County" in parts[1] and is_legitimate_us_place_name(parts):
-            town = parts[0].lower()
-            no_county = parts[1].replace(" County", "").lower()
+    place = Place.parse(name)
+    if len(place) == 4 and place[-1].upper() == "USA":
+        if " County" in place[1] and is_legitimate_us_place_name(place):
+            town = place.lower[0]
+            no_county = place[1].replace(" County", "").lower()
             if not (town == no_county):
-                state = parts[2].lower()
+                state = place.lower[2]
                 if not (state == no_county):
-                    no_county = parts[1].replace(" County", "")
-                    parts[1] = no_county
-                    name = ", ".join(parts)
+                    no_county = place[1].replace(" County", "")
+                    name = place.replace(1, no_county).joined()
 
 
     name = correct_misordered_county_name(name, brief=brief)
@@ -351,22 +447,14 @@ def normalize_once(pid, name, brief=True):
 
     # If 5 fields and ends with USA, and the first and second fields are indentical
     # remove the first field 
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 5 and parts[-1].upper() == "USA":
-        if parts[0] == parts[1]:
-            name = ", ".join(parts[1:-1])
+    place = Place.parse(name)
+    if len(place) == 5 and place[-1].upper() == "USA":
+        if place[0] == place[1]:
+            name = ", ".join(place[1:-1])
 
 
     # Obvious replacements to take care of up front before they get managled
-    name = re.sub(r'^No Township Listed,*\s+', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'^Rio Township, Rio,', r'Rio Township,', name, flags=re.IGNORECASE)
-    name = re.sub(r'Floyd Knox, Floyd,',  r', Floyds Knobs, Floyd,', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+Shenandoah, Iowa', r', Shenandoah, Iowa', name, flags=re.IGNORECASE)
-    name = re.sub(r'^Ohio, Preble Co$', r'Preble County, Ohio, USA', name, flags=re.IGNORECASE)
-    name = re.sub(r'\(original\)', r'', name, flags=re.IGNORECASE)
-    name = re.sub(r'\(new\)', r'', name, flags=re.IGNORECASE)
-    name = re.sub(r'\(Issued Through\)', r'', name, flags=re.IGNORECASE)
-    name = re.sub(r'^Route \d+$', r'', name, flags=re.IGNORECASE)
+    name = RULES["up-front"](name)
 
     
     # # get rid of addresses right away
@@ -382,22 +470,14 @@ def normalize_once(pid, name, brief=True):
 
 
     # Capitalize first character of each field
-    parts = [part.strip() for part in name.split(",")]
-    normalized_parts = [p[0].upper() + p[1:] if p else "" for p in parts]
-    name = ", ".join(normalized_parts)
+    name = ", ".join(p[0].upper() + p[1:] if p else "" for p in Place.parse(name))
 
     name = name.strip()
 
     normalized = name.strip()
 
     # Fix accidental splits in two-word U.S. state names
-    us_two_word_states = {
-        "West Virginia", "South Dakota", "North Dakota",
-        "New York", "New Jersey", "New Mexico",
-        "Rhode Island", "New Hampshire", "North Carolina", "South Carolina"
-    }
-    
-    for state in us_two_word_states:
+    for state in _US_TWO_WORD_STATES:
         parts = state.split()
         broken = f"{parts[0]}, {parts[1]}"
         fixed = state
@@ -429,9 +509,9 @@ def normalize_once(pid, name, brief=True):
     # when a place name is just a single character, remove it
     # making it a null string, another routine will delete the record
     # and update referencing records
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 1:
-        if len(parts[0]) < 2:
+    place = Place.parse(name)
+    if len(place) == 1:
+        if len(place[0]) < 2:
            return "NOPLACENAME"
 
     original = name.strip()
@@ -440,8 +520,8 @@ def normalize_once(pid, name, brief=True):
         return "NOPLACENAME"
     
     # 1. Starts with number followed by common address pattern
-    if re.match(r'^\d+\s+\w+', original):
-        if re.search(r'\b(St|Ave|Blvd|Rd|Ln|Dr|Ct|Way|Circle|Pl|Terrace)\b', original, re.IGNORECASE):
+    if _NUMBERED_STREET.match(original):
+        if _STREET_WORD.search(original):
             print(f"📍 PlaceID {pid} contains an address: \"{original}\", it will be marked for deletion")
             # maybe handle this later to prevent data bus
             return "NOPLACENAME"
@@ -462,53 +542,54 @@ def normalize_once(pid, name, brief=True):
 
 
     # Normalize PLSS-like entries
-    name = re.sub(
-        r'\bT(?:wp)?\s*(\d+)([NS])\s*R\s*(\d+)([EW])\b',
-        r'Township \1\2 Range \3\4',
-        name
-    )
+    if DIGIT in RULES.literals.present(name):
+        name = _PLSS.sub(r'Township \1\2 Range \3\4', name)
 
 
     # Fix names that have no separator after the Township when the township is named
-    m = re.match(r'^.*[a-z]\s+Township\s+[a-z].*', name, re.IGNORECASE)
+    m = "township" in RULES.literals.present(name) and _NAMED_TOWNSHIP.match(name)
     if m:
-        name = re.sub(r'^(.*?\s+Township)', r'\1,', name, re.IGNORECASE)
+        name = _NAMED_TOWNSHIP_HEAD.sub(r'\1,', name)
 
 
 
 
     # Add missing comma before known state names (e.g., 'Twin Falls Idaho' → 'Twin Falls, Idaho')
-    for state in STATE_NAMES:
-        if name.endswith(" " + state) and not name.endswith(", " + state):
-            name = re.sub(rf" (?!.*, ){state}$", f", {state}", name)
-            break  # Only apply to one state match
+    # (only the first state in table order that ends the name after a space)
+    missing = [
+        suffix for suffix in JURISDICTIONS.suffixes(name, US_STATE)
+        if name[:suffix.start].endswith(" ") and not name[:suffix.start].endswith(", ")
+    ]
+    if missing:
+        state = min(missing, key=lambda suffix: suffix.rank).entry
+        name = _STATE_NAME_COMMA[state].sub(f", {state}", name)
 
     # Insert comma before state abbreviation if missing
-    for abbr in STATE_ABBREVIATIONS:
-        pattern = rf"\b(.+?)\s+{abbr}$"
-        if re.search(pattern, name):
-            name = re.sub(pattern, rf"\1, {abbr}", name)
-            break  # only fix once
+    name = RULES["state-abbreviation-comma"](name)
 
     # Ensure comma before historical U.S. territory names
-    for territory in HISTORICAL_US_TERRITORIES:
-        pattern = rf"\b(.+?)\s+{re.escape(territory)}$"
-        if re.search(pattern, name):
-            name = re.sub(pattern, rf"\1, {territory}", name)
-            # remove double comma
-            name = re.sub(r',,', r',', name)
-            # fix doubles in the end
-            parts = [p.strip() for p in name.split(",")]
-            if len(parts) >= 2 and parts[-1] == parts[-2]:
-                name = ", ".join(parts[0:-1])
-            break  # only one match expected
+    territories = [
+        suffix for suffix in JURISDICTIONS.suffixes(name, US_TERRITORY)
+        if name[suffix.start - 1:suffix.start].isspace()
+    ]
+    if territories:
+        for suffix in sorted(territories, key=lambda suffix: suffix.rank):
+            pattern, repl = _TERRITORY_COMMA[suffix.entry]
+            if pattern.search(name):
+                name = pattern.sub(repl, name)
+                # remove double comma
+                name = _DOUBLE_COMMA.sub(r',', name)
+                # fix doubles in the end
+                place = Place.parse(name)
+                if len(place) >= 2 and place[-1] == place[-2]:
+                    name = ", ".join(place[0:-1])
+                break  # only one match expected
 
 
     # if there is only one field and it is the abbreviation of a country
     # or shortened name, correct to the full name
     # other substitutions for single field names
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 1:
+    if "," not in name:
         if name == "USA" or name == "United States":
             name = "United States of America"
         if name == "Deutschland":
@@ -524,20 +605,24 @@ def normalize_once(pid, name, brief=True):
 
     # Add comma before 'Mexico' unless it's part of 'New Mexico'
     if " Mexico" in name and "New Mexico" not in name:
-        name = re.sub(r"(?<!New) Mexico", r", Mexico", name)
+        name = _MEXICO_COMMA.sub(r", Mexico", name)
 
-    # Remove 3–5 letter uppercase prefixes (e.g., "KYRO - ", "NYCA - ")
-    name = re.sub(r"^[A-Z]{4,5} - ", "", name)
-    name = re.sub(r"^[A-Z]{4}[0-9] - ", "", name)
-    name = re.sub(r"^[A-Z]{3} - ", "", name)
-
-    # Remove lone trailing period
-    name = re.sub(r"\.\s*$", "", name)
+    # Remove 3–5 letter uppercase prefixes and a lone trailing period
+    name = RULES["code-prefixes"](name)
 
     # Insert comma before known country names if missing
-    for country in FOREIGN_COUNTRIES:
-        if name.endswith(" " + country):
-            name = name[: -len(country) - 1].rstrip(", ") + ", " + country
+    # (each country in table order gets its turn, on the name as rewritten so far)
+    rank = -1
+    while True:
+        later = [
+            suffix for suffix in JURISDICTIONS.suffixes(name, COUNTRY)
+            if suffix.rank > rank and name[:suffix.start].endswith(" ")
+        ]
+        if not later:
+            break
+        country = min(later, key=lambda suffix: suffix.rank)
+        rank = country.rank
+        name = name[: country.start - 1].rstrip(", ") + ", " + country.entry
 
 
 
@@ -562,147 +647,67 @@ def normalize_once(pid, name, brief=True):
 
 
     # Ensure a comma precedes valid Mexican state names (excluding 'New Mexico')
-    if not name.endswith("New Mexico, USA"):  # exclude legitimate U.S. state
-        for state in MEXICAN_STATES:
-            if (
-                state == "México"
-            ):  # special case to avoid conflict with 'Mexico' country
-                continue
-            pattern = rf"(?<!,),\s*{state}, Mexico$"
-            fixed_pattern = rf", {state}, Mexico"
-            if name.endswith(f" {state}, Mexico"):
-                name = re.sub(rf" {state}, Mexico$", fixed_pattern, name)
-                break
+    name = RULES["mexican-state-comma"](name)
 
     # Ensure a comma precedes Canadian province names if missing
-    if name.endswith(", Canada"):
-        for province in CANADIAN_PROVINCES:
-            if name.endswith(f" {province}, Canada"):
-                name = re.sub(rf" {province}, Canada$", rf", {province}, Canada", name)
-                break
+    name = RULES["canadian-province-comma"](name)
 
 
     # ───────────────────────────────────────────────
     # 🧹 Strip parenthetical text like (Independent City), (new), (7 yrs), etc.
     # Apply only once, before other cleanup
-    name = re.sub(r"\s*\([^()]*\)", "", name)  # remove parentheses and enclosed text
-    name = re.sub(r"\s{2,}", " ", name).strip(",. ")  # clean excess spaces and trailing punctuation
+    if "(" in RULES.literals.present(name):
+        name = _PARENTHETICAL.sub("", name)  # remove parentheses and enclosed text
+    name = _EXCESS_SPACES.sub(" ", name).strip(",. ")  # clean excess spaces and trailing punctuation
 
     # remove leading hyphen '-' in name
-    name = re.sub(r"^-", "", name)
-
-
-    name = re.sub(r", United States of America$", ", USA", name)
-    name = re.sub(r", U\.S\.A$", ", USA", name)
-    name = re.sub(r", U\.S\.A\.$", ", USA", name)
-    name = re.sub(r", U\.S\.$", ", USA", name)
-    name = re.sub(r", United States$", ", USA", name)
-    name = re.sub(r"^,\s*", "", name)
-    name = re.sub(r",+$", "", name)
-    name = re.sub(r",\s*,", ",", name)
-    name = re.sub(r",\s*", ", ", name)
-    name = re.sub(r" \d{5},", "", name)
-    name = re.sub(r" Co\.", " County", name)
-    name = re.sub(r"Co ", "County ", name)
-    name = re.sub(r" Co,", " County,", name)
-    name = re.sub(r" Co$", " County", name)
-    name = re.sub(r" Coun,", " County,", name)
-    name = re.sub(r"^County, ", "County ", name)
-    name = re.sub(r"([A-Z,a-z,0-9])&([A-Z,a-z,0-9])", r"\1 & \2", name)
-    name = re.sub(r"^Rural, ", "", name)
-    name = re.sub(r"\(Chicago\)", "", name)
-    name = re.sub(r" Ward [0-9],", ",", name)
-    name = re.sub(r" Ward [0-9][0-9],", ",", name)
-    name = re.sub(r"^District [0-9], ", "", name)
-    name = re.sub(r"^District [0-9][0-9], ", "", name)
-    name = re.sub(r" Twp,", ",", name)
-    name = re.sub(r" Twp.,", ",", name)
-    name = re.sub(r"^Magisterial ", "", name)
-    name = re.sub(r" Assembly District [0-9],", ",", name)
-    name = re.sub(r" Assembly District [0-9][0-9],", ",", name)
-    name = re.sub(r"^District No [0-9], ", "", name)
-    name = re.sub(r"^District No [0-9][0-9], ", "", name)
-    # name = re.sub(r"^Township [0-9], ", "", name)
-    # name = re.sub(r"^Township [0-9][0-9], ", "", name)
-    name = re.sub(r"^Precinct [0-9], ", "", name)
-    name = re.sub(r"^Precinct [0-9][0-9], ", "", name)
-    name = re.sub(r" Irland$", " Ireland", name)
-    name = re.sub(r"^Mag District No [0-9], ", "", name)
-    name = re.sub(r"^Mag District No [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag Dist No [0-9], ", "", name)
-    name = re.sub(r"^Mag Dist No [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag D No [0-9], ", "", name)
-    name = re.sub(r"^Mag D No [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag District [0-9], ", "", name)
-    name = re.sub(r"^Mag District [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag Dist [0-9], ", "", name)
-    name = re.sub(r"^Mag Dist [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag D [0-9], ", "", name)
-    name = re.sub(r"^Mag D [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag District \# [0-9], ", "", name)
-    name = re.sub(r"^Mag District \# [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag Dist \# [0-9], ", "", name)
-    name = re.sub(r"^Mag Dist \# [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag D \# [0-9], ", "", name)
-    name = re.sub(r"^Mag D \# [0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag District \#[0-9], ", "", name)
-    name = re.sub(r"^Mag District \#[0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag Dist \#[0-9], ", "", name)
-    name = re.sub(r"^Mag Dist \#[0-9][0-9], ", "", name)
-    name = re.sub(r"^Mag D \#[0-9], ", "", name)
-    name = re.sub(r"^Mag D \#[0-9][0-9], ", "", name)
-    name = re.sub(r"Fraanklin, ", "Franklin, ", name)
-    name = re.sub(r"Bethlehm, ", "Bethlehem, ", name)
-    name = re.sub(r"Abingon, ", "Abingdon, ", name)
-    name = re.sub(r"Grrenv", "Grenv", name)
-    name = re.sub(r"Los Angles", "Los Angeles", name)
-    name = re.sub(r"Indianapoli,", "Indianapolis,", name)
-    name = re.sub(r"St Louis", "St. Louis", name)
-    name = re.sub(r'\bSaint\s+(?=\w)', 'St. ', name)
-    name = re.sub(r'\bSt\s+(?=\w)', 'St. ', name)
-    name = re.sub(r'\bPrince Georges\b', "Prince George's", name)
-    name = re.sub(r"Fond Du Lac", "Fond Du Lac", name)
-
-
-
-    # Remove parenthetical prefixes like "City (Districts 1234-5678), ..."
-    name = re.sub(r'^[^,]*\([^)]*\),\s*', '', name)
-
-    # Remove leading parenthetical if followed by duplicate city
-    name = re.sub(
-        r'^\s*\((.*?)\),\s*(\w[\w\s.-]+?),\s*(.+)$',
-        lambda m: f"{m.group(2)}, {m.group(3)}" if m.group(2).lower() in m.group(3).lower() else m.group(0),
-        name
-    )
-
-
-    # Get County in the middle fixed
-    name = re.sub(r" County ", " County, ", name)
-
-    # Remove lone periods (again)
-    name = re.sub(r"\s+\.\s+", " ", name)
-
-    # Remove double commas and extra spaces between them
-    name = re.sub(r",\s*,", ", ", name)
-
-    # Remove trailing lone periods (e.g., "Oklahoma.")
-    name = re.sub(r"\.\s*$", "", name)
-
-    # Remove trailing commas (if still remaining)
-    name = re.sub(r",\s*$", "", name)
-
-    # Collapse repeated whitespace
-    name = re.sub(r"\s{2,}", " ", name)
-
-    for abbr, full in OLD_STYLE_ABBR.items():
-        name = re.sub(rf"\b{re.escape(abbr)}\b", full, name)
-
-    for abbr, full in STATE_ABBREVIATIONS.items():
-        name = re.sub(rf",\s*{abbr}(,|$)", rf", {full}\1", name)
-
-
-
-    if any(name.endswith(", " + state) for state in STATE_NAMES) and not name.endswith(
+    name = _LEADING_HYPHEN.sub("", name)
+
+
+    name = RULES["usa-suffixes"](name)
+    name = RULES["cleanup"](name)
+    name = RULES["mag-district-prefixes"](name)
+    name = RULES["misspellings"](name)
+    name = correct_misspellings(name)
+    name = RULES["saints"](name)
+
+
+
+    if "(" in RULES.literals.present(name):
+        # Remove parenthetical prefixes like "City (Districts 1234-5678), ..."
+        name = _PARENTHETICAL_PREFIX.sub('', name)
+
+        # Remove leading parenthetical if followed by duplicate city
+        name = _PARENTHETICAL_CITY.sub(
+            lambda m: f"{m.group(2)}, {m.group(3)}" if m.group(2).lower() in m.group(3).lower() else m.group(0),
+            name
+        )
+
+
+    # County in the middle, lone periods, double and trailing commas, whitespace
+    name = RULES["final-cleanup"](name)
+
+    name = RULES["old-style-abbreviations"](name)
+    name = RULES["state-abbreviation-fields"](name)
+
+
+
+    # The rest depends on the region the name ends in; the other regions'
+    # passes would leave it unchanged
+    passes = _REGIONAL_PASSES.get(classify(name))
+    if passes:
+        name = passes(name)
+
+    # # Standarize when only the county is known to a list
+    # # of known USA counties
+    # name = standardize_us_county_name(name, COUNTY_DB, STATE_NAMES)
+
+    return name
+
+
+def us_passes(name: str) -> str:
+    """Passes for names ending in a U.S. state or USA."""
+    if JURISDICTIONS.ends_with(name, (US_STATE,), ", ") and not name.endswith(
         ", USA"
     ):
         name += ", USA"
@@ -713,102 +718,316 @@ def normalize_once(pid, name, brief=True):
     #     if not name.endswith(", USA"):
     #         name += ", USA"
 
-    # Fix Canadian places missing a comma before the province
-    for province in CANADIAN_PROVINCES:
-        pattern = rf"\b({province})$"
-        if re.search(pattern, name, re.IGNORECASE):
-            if f", {province}" not in name:
-                # Insert comma before the province
-                name = re.sub(rf"\s+{province}$", rf", {province}", name)
-
-    # If ends with a known Canadian province but not ", Canada", append it
-    parts = [p.strip() for p in name.split(",")]
-    if parts[-1] in CANADIAN_PROVINCES and not name.endswith(", Canada"):
-        name += ", Canada"
-
-    # If ends with a known Mexican state but not ", Mexico", append it
-    parts = [p.strip() for p in name.split(",")]
-    if parts[-1] in MEXICAN_STATES and not name.endswith(", Mexiso"):
-        name += ", Mexiso"
-
-
     # If 4 fields and ends with USA, remove ' County' from second field
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 4 and parts[-1].upper() == "USA":
-        if " County" in parts[1] and not is_legitimate_us_place_name(parts):
-            parts[1] = parts[1].replace(" County", "")
-            name = ", ".join(parts)
+    place = Place.parse(name)
+    if len(place) == 4 and place[-1].upper() == "USA":
+        if " County" in place[1] and not is_legitimate_us_place_name(place):
+            name = place.replace(1, place[1].replace(" County", "")).joined()
 
 
     # Fix repeated state name before 'USA'
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) >= 4 and parts[-1] == "USA":
+    place = Place.parse(name)
+    if len(place) >= 4 and place[-1] == "USA":
         # Check if the second-to-last and third-to-last parts are the same
-        if parts[-2].lower() == parts[-3].lower():
+        if place.lower[-2] == place.lower[-3]:
             # Remove the redundant part
             # are only going to do this when the state doesn't have a county
             # with the same name
             # 
             # but take this opportunity to add the word County to the 
             # County name to make it clear
-            if not (parts[-2].lower() == "arkansas" or
-                    parts[-2].lower() == "idaho" or
-                    parts[-2].lower() == "oklahoma" or
-                    parts[-2].lower() == "iowa" or
-                    parts[-2].lower() == "utah" or
-                    parts[-2].lower() == "hawaii" or
-                    parts[-2].lower() == "new york"):
-                del parts[-3]
-                name = ", ".join(parts)
+            if place.lower[-2] not in _STATES_WITH_SAME_NAME_COUNTY:
+                name = ", ".join(place[:-3] + place[-2:])
             else:
-                county = parts[-3]
+                county = place[-3]
                 county += " County"
-                parts[-3] = county
-                name = ", ".join(parts)
+                name = place.replace(-3, county).joined()
+    return name
 
-    # # Standarize when only the county is known to a list
-    # # of known USA counties
-    # name = standardize_us_county_name(name, COUNTY_DB, STATE_NAMES)
 
+def canadian_passes(name: str) -> str:
+    """Passes for names ending in a Canadian province or Canada."""
+    # Fix Canadian places missing a comma before the province
+    name = RULES["canadian-province-missing-comma"](name)
+
+    # If ends with a known Canadian province but not ", Canada", append it
+    place = Place.parse(name)
+    if place[-1] in CANADIAN_PROVINCES and not name.endswith(", Canada"):
+        name += ", Canada"
+    return name
+
+
+def mexican_passes(name: str) -> str:
+    """Passes for names ending in a Mexican state or Mexico."""
+    # If ends with a known Mexican state but not ", Mexico", append it
+    place = Place.parse(name)
+    if place[-1] in MEXICAN_STATES and not name.endswith(", Mexiso"):
+        name += ", Mexiso"
     return name
 
 
-def normalize_place_iteratively(pid, name, brief=True):
+# what normalize_once() finishes a name with, by jurisdictions.classify();
+# historical territories, foreign and unknown places need nothing more
+_REGIONAL_PASSES = {
+    USA: us_passes,
+    CANADA: canadian_passes,
+    MEXICO: mexican_passes,
+}
+
+
+# normalize_place_iteratively() bookkeeping: PlaceID -> (passes of
+# normalize_once, name) for the last run, and strings known to come back unchanged
+MAX_PASSES = 50
+ITERATION_COUNTS = {}
+_FIXED_POINTS = set()
+_MAX_FIXED_POINTS = 200000
+
+
+def normalize_place_iteratively(pid, name, brief=True, use_cache=True):
     # print(f"    [{inspect.currentframe().f_code.co_name}] pid: {pid} name: \"{name}\"")
     # print(f"[{inspect.currentframe().f_back.f_code.co_name}] {pid} {name}")
-    previous = name
+    # pid is only used in messages, so the result depends on the name alone;
+    # a cache hit skips normalize_once and therefore its messages too
+    if use_cache:
+        cached = NORMALIZE_CACHE.lookup(name)
+        if cached is not MISS:
+            ITERATION_COUNTS[pid] = (0, name)
+            return cached
+        result = normalize_place_iteratively(pid, name, brief=brief, use_cache=False)
+        NORMALIZE_CACHE.store(name, result)
+        return result
+
+    # run normalize_once until the name stops changing; a string already known
+    # to be a fixed point needs no confirming pass, and a state seen before
+    # means rules keep undoing each other
+    current = name
+    trail = [name]
+    seen = {name: 0}
     count = 0
-    while True:
+    while current not in _FIXED_POINTS:
         count = count + 1
         # print(f"    [{inspect.currentframe().f_code.co_name}] Calling normalize_once, count: {count}")
-        current = normalize_once(pid, previous, brief=brief)
-        # print(f"    [{inspect.currentframe().f_code.co_name}] normalize_once returned with \"{current}\"")
-        if current == previous:
+        following = normalize_once(pid, current, brief=brief)
+        # print(f"    [{inspect.currentframe().f_code.co_name}] normalize_once returned with \"{following}\"")
+        if following == current:
+            if len(_FIXED_POINTS) >= _MAX_FIXED_POINTS:
+                _FIXED_POINTS.clear()
+            _FIXED_POINTS.add(current)
+            break
+        current = following
+        if current in seen:
+            report_normalization_cycle(pid, trail[seen[current]:] + [current])
             break
-        previous = current
+        if count >= MAX_PASSES:
+            print(f"⚠️ PlaceID {pid} still changing after {count} passes, stopping at \"{current}\"")
+            break
+        seen[current] = len(trail)
+        trail.append(current)
+    ITERATION_COUNTS[pid] = (count, name)
     return current if current != name else None
 
 
-def normalize_place_names(conn: sqlite3.Connection, dry_run=True, brief=True):
-    from rmutils import delete_place_id, current_utcmoddate
+def report_normalization_cycle(pid, states):
+    """Print the states of a normalization cycle and the rules-file rules firing along it."""
+    print(f"🔁 PlaceID {pid} does not converge, normalize_once cycles through:")
+    for state in states:
+        print(f"    \"{state}\"")
+
+    # replay the cycle once with the rule counters watched, then put them back
+    fired = set()
+    for state in states[:-1]:
+        before = list(RULES.hits)
+        with redirect_stdout(io.StringIO()):
+            normalize_once(pid, state)
+        fired.update(RULES.rules[i].id for i, (a, b) in enumerate(zip(before, RULES.hits)) if a != b)
+        RULES.hits[:] = before
+    if fired:
+        print(f"    rules firing in the cycle: {', '.join(sorted(fired))}")
+
+
+def report_iteration_counts(top=10):
+    """Print how many normalize_once passes the places of the last run took."""
+    if not ITERATION_COUNTS:
+        return
+    histogram = {}
+    for count, _ in ITERATION_COUNTS.values():
+        histogram[count] = histogram.get(count, 0) + 1
+    print("🔁 normalize_once passes per place: "
+          + ", ".join(f"{count}: {places}" for count, places in sorted(histogram.items())))
+    expensive = sorted(ITERATION_COUNTS.items(), key=lambda item: -item[1][0])[:top]
+    for place_id, (count, name) in expensive:
+        if count > 2:
+            print(f"    {count} passes  PlaceID {place_id} \"{name}\"")
+
+
+def _database_path(conn: sqlite3.Connection):
+    # a WorkingCopy lives in memory, its results belong with the file it came from
+    source = getattr(conn, "source_path", None)
+    if source:
+        return source
+    for _, name, path in conn.execute("PRAGMA database_list"):
+        if name == "main":
+            return path or None
+    return None
+
+
+def _normalize_chunk(rows, brief):
+    """Worker side of jobs > 1: normalize rows, returning each result with its messages."""
+    results = []
+    for place_id, name in rows:
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            new_name = normalize_place_iteratively(place_id, name, brief=brief, use_cache=False)
+        results.append((new_name, buffer.getvalue(), ITERATION_COUNTS[place_id][0]))
+    return results
+
+
+def _normalized_rows(rows, brief, jobs, chunk_size=200):
+    """
+    Yield (place_id, old_name, new_name) for rows in their original order.
+
+    Only the first occurrence of a name is normalized; repeats get its result.
+    With jobs > 1 the first occurrence of every name the cache doesn't know is
+    normalized by a process pool, in chunks; the caller consumes the results
+    in order while the workers run ahead, and each name's messages are printed
+    at the point the serial loop would have printed them.
+    """
+    if jobs <= 1:
+        results = {}
+        for place_id, name in rows:
+            if name in results:
+                ITERATION_COUNTS[place_id] = (0, name)
+            else:
+                results[name] = normalize_place_iteratively(place_id, name, brief=brief)
+            yield place_id, name, results[name]
+        return
+
+    # what each row needs: a cached result, or the position of its name in the work list
+    work = []
+    work_index = {}
+    plan = []
+    for place_id, name in rows:
+        if name in work_index:
+            plan.append((False, work_index[name]))
+            continue
+        cached = NORMALIZE_CACHE.lookup(name)
+        if cached is not MISS:
+            plan.append((True, cached))
+            continue
+        work_index[name] = len(work)
+        plan.append((False, len(work)))
+        work.append((place_id, name))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(_normalize_chunk, work[start:start + chunk_size], brief)
+            for start in range(0, len(work), chunk_size)
+        ]
+        computed = []
+        for (place_id, name), (is_cached, value) in zip(rows, plan):
+            if is_cached:
+                ITERATION_COUNTS[place_id] = (0, name)
+                yield place_id, name, value
+                continue
+            if value == len(computed):
+                # first occurrence: collect it and replay its messages
+                new_name, output, count = futures[value // chunk_size].result()[value % chunk_size]
+                print(output, end="")
+                ITERATION_COUNTS[place_id] = (count, name)
+                NORMALIZE_CACHE.store(name, new_name)
+                computed.append(new_name)
+            else:
+                ITERATION_COUNTS[place_id] = (0, name)
+            yield place_id, name, computed[value]
+
+
+def normalize_many(names, brief=True, jobs=1, place_ids=None):
+    """
+    Normalize a batch of names, each distinct string once.
+
+    Returns the results in the order of names: the normalized name, or None
+    for a name that is already normal.  place_ids, if given, label the
+    messages (PlaceID 0 otherwise).  names may be a pandas Series, in which
+    case the results come back as a Series on the same index.
+    """
+    values = list(names)
+    ids = list(place_ids) if place_ids is not None else [0] * len(values)
+    if len(ids) != len(values):
+        raise ValueError(f"normalize_many: {len(values)} names but {len(ids)} place_ids")
+
+    results = [new_name for _, _, new_name in _normalized_rows(list(zip(ids, values)), brief, jobs)]
+    if not brief:
+        report_dedup(values)
+    if hasattr(names, "index") and hasattr(names, "to_list"):
+        # a pandas Series: answer with one on the same index
+        return type(names)(results, index=names.index, name=names.name)
+    return results
+
+
+def dedup_stats(names) -> dict:
+    """How many of names repeat one another, exactly or up to case and surrounding space."""
+    names = list(names)
+    distinct = set(names)
+    folded = {name.strip().casefold() for name in distinct}
+    return {
+        "names": len(names),
+        "distinct": len(distinct),
+        "variants": len(distinct) - len(folded),
+        "dedup_ratio": 1 - len(distinct) / len(names) if names else 0.0,
+    }
+
+
+def report_dedup(names):
+    s = dedup_stats(names)
+    print(f"🧮 {s['names']} names, {s['distinct']} distinct ({s['dedup_ratio']:.0%} repeats, normalized once); "
+          f"{s['variants']} more differ only in case or surrounding spaces")
+
+
+def normalize_place_names(conn: sqlite3.Connection, dry_run=True, brief=True, writer=None,
+                          persistent_cache=False, jobs=1):
+    # persistent_cache keeps results in "<db>.normcache" for the next run
+    # jobs > 1 normalizes on that many processes; this thread stays the only writer
+    db_path = _database_path(conn) if persistent_cache else None
+    if db_path:
+        NORMALIZE_CACHE.open_store(cache_path_for(db_path))
+    ITERATION_COUNTS.clear()
+    try:
+        _normalize_place_names(conn, dry_run, brief, writer, jobs)
+    finally:
+        if not brief:
+            NORMALIZE_CACHE.report()
+            report_iteration_counts()
+        if db_path:
+            NORMALIZE_CACHE.close_store()
+
+
+def _normalize_place_names(conn, dry_run, brief, writer, jobs):
+    from rmutils import delete_place_id, PlaceWriter
     cursor = conn.execute("SELECT PlaceID, Name FROM PlaceTable WHERE PlaceType != 1")
+    rows = [(row["PlaceID"], row["Name"]) for row in cursor.fetchall()]
     updates = []
 
-    for row in cursor.fetchall():
-        place_id, old_name = row["PlaceID"], row["Name"]
-        new_name = normalize_place_iteratively(place_id, old_name, brief=brief)
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn, brief=brief)
+
+    for place_id, old_name, new_name in _normalized_rows(rows, brief, jobs):
         if new_name:
             if new_name == "NOPLACENAME":
                 if not brief:
                     print(f"🧹 PlaceID {place_id} had an old name of \"{old_name}\" and will be deleted")
-                ret = delete_place_id(conn, place_id, dry_run, brief=brief)
+                ret = delete_place_id(conn, place_id, dry_run, brief=brief, writer=writer)
             else:
                 if not brief:
                     print(f"🧹 PlaceID {place_id} had an old name of \"{old_name}\" and will be updated to \"{new_name}\"")
                 updates.append((place_id, old_name, new_name))
           
+    if not brief:
+        report_dedup(name for _, name in rows)
 
     if not updates:
+        if own_writer and not dry_run:
+            writer.commit()
         print("✅ No changes needed.")
         return
 
@@ -824,24 +1043,15 @@ def normalize_place_names(conn: sqlite3.Connection, dry_run=True, brief=True):
     if not dry_run:
         for place_id, _, new_name in updates:
             # Update Reverse and UTCModDate when modifying the place name
-            reverse = reverse_place_name(new_name)
-            utcmoddate = current_utcmoddate()
-
-            cursor.execute(
-                """
-                UPDATE PlaceTable
-                SET Name = ?, Reverse = ?, UTCModDate = ?
-                WHERE PlaceID = ?
-                """,
-                (new_name, reverse, utcmoddate, place_id),
-            )
-        conn.commit()
-        print("✅ Changes committed to the database.")
+            writer.rename_place(place_id, new_name, reverse=reverse_place_name(new_name))
+        if own_writer:
+            writer.commit()
+            print("✅ Changes committed to the database.")
     else:
         print("ℹ️  Dry run only. No changes made. Use dry_run=False to apply.")
 
 
-def is_legitimate_us_place_name(parts: list[str]) -> bool:
+def is_legitimate_us_place_name(parts: Place | list[str]) -> bool:
     """
     Returns True if parts[1] includes 'County', parts[2] is a valid US state name,
     and (parts[1] without ' County', parts[2]) is a valid (county, state) pair.
@@ -857,7 +1067,7 @@ def is_legitimate_us_place_name(parts: list[str]) -> bool:
         return False
 
     county_name = county_field.replace(" County", "").strip()
-    return (county_name, state) in US_COUNTIES
+    return GAZETTEER.is_county(county_name, state)
 
 
 def is_nonsensical_place_name(name):
@@ -882,13 +1092,13 @@ def correct_misordered_county_name(name: str, brief: bool=False) -> str:
     Fix place names like 'Clay County, Clay, Indiana, USA' → 'Clay, Clay County, Indiana, USA'
     Only apply fix if county-state pair is in US_COUNTIES.
     """
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) == 4 and parts[-1].upper() == "USA":
-        state = parts[2]
-        if state in STATE_NAMES and parts[0].endswith(" County"):
-            county_name = parts[0].replace(" County", "")
-            if (county_name, state) in US_COUNTIES:
-                return f"{parts[1]}, {parts[0]}, {state}, USA"
+    place = Place.parse(name)
+    if len(place) == 4 and place[-1].upper() == "USA":
+        state = place[2]
+        if state in STATE_NAMES and place[0].endswith(" County"):
+            county_name = place[0].replace(" County", "")
+            if GAZETTEER.is_county(county_name, state):
+                return f"{place[1]}, {place[0]}, {state}, USA"
     return name  # no change
 
 
@@ -898,27 +1108,26 @@ def fix_missing_commas_in_county_state(name: str) -> str:
     Fix entries like "Edinburg Shenandoah, Virginia, USA" to "Edinburg, Shenandoah, Virginia, USA"
     by inserting a missing comma between city and county.
     """
-    parts = name.split(",")
+    parts = [p.strip() for p in name.split(",")]
     if len(parts) < 2:
         return name  # Nothing to fix
 
-    head = parts[0].strip()
-    tail = ",".join(p.strip() for p in parts[1:])
-
-    for county, state in US_COUNTIES:
-        test_suffix = f"{county}, {state}"
-        if tail.startswith(test_suffix):
-            if head.endswith(county):
-                # Already something like "Edinburg Shenandoah"
-                fixed_head = head.replace(f" {county}", f", {county}")
-                return f"{fixed_head}, {tail}"
+    head, state = parts[0], parts[1]
+    # the county is the head's last words: try the longest first, e.g.
+    # "Van Buren" before "Buren"; the city left in front of it must be
+    # listed in that county, or "Fort Wayne, Indiana" would lose its "Fort"
+    split = head.find(" ")
+    while split != -1:
+        city, county = head[:split], head[split + 1:]
+        if GAZETTEER.is_county(county, state) and GAZETTEER.is_place(city, f"{county} County", state):
+            return ", ".join([city, county] + parts[1:])
+        split = head.find(" ", split + 1)
     return name
 
 
 def reverse_place_name(name: str) -> str:
     """Reverse the order of comma-separated fields in a place name."""
-    parts = [part.strip() for part in name.split(",")]
-    return ", ".join(reversed(parts))
+    return ", ".join(reversed(Place.parse(name)))
 
 
 def standardize_us_county_name(name, counties_db, state_list):
@@ -926,11 +1135,11 @@ def standardize_us_county_name(name, counties_db, state_list):
     Normalize U.S. county-style place names to the form:
     <county> County, <state>, USA
     """
-    parts = [p.strip() for p in name.split(",")]
-    if len(parts) != 3:
+    place = Place.parse(name)
+    if len(place) != 3:
         return name  # Not a candidate
 
-    county_candidate, state, country = parts
+    county_candidate, state, country = place
     if country.upper() != "USA":
         return name
     if state not in state_list:
@@ -954,11 +1163,11 @@ def suggest_us_place_correction(place: str) -> str:
     If the derived county is not a real county, emit a warning and return
     the original name.
     """
-    parts = [p.strip() for p in place.split(",")]
-    if len(parts) != 4 or parts[-1].upper() != "USA":
+    parsed = Place.parse(place)
+    if len(parsed) != 4 or parsed[-1].upper() != "USA":
         return place  # Must be 4-part ending in USA
 
-    city, county_candidate, state, country = parts
+    city, county_candidate, state, country = parsed
 
     if city.lower() != county_candidate.lower():
         return place  # First two fields must match
@@ -967,11 +1176,10 @@ def suggest_us_place_correction(place: str) -> str:
         return place  # Not a known U.S. state
 
     county_name = f"{county_candidate} County"
-    candidate_tuple = (city, county_name, state)
 
-    if candidate_tuple in US_PLACES:
+    if GAZETTEER.is_place(city, county_name, state):
         # Validate that the county is legitimate
-        if (county_candidate, state) in US_COUNTIES:
+        if GAZETTEER.is_county(county_candidate, state):
             return f"{city}, {county_name}, {state}, {country}"
         else:
             print(f"⚠️ Warning: '{county_name}, {state}' not in US_COUNTIES. Skipping normalization of '{place}'")
@@ -980,32 +1188,36 @@ def suggest_us_place_correction(place: str) -> str:
     return place
 
 
-def assign_county_if_known_place(place: str) -> str:
+def known_county_candidates(place: str) -> list[str]:
     """
-    To a three part place, ending in USA, and if
-    it is a actual state
-    If the derived county is not a real county, emit a warning and return
-    the original name.
+    The counties ("X County") a three part place, ending in USA with an
+    actual state, could be in according to the gazetteer; [] for other places.
     """
-    parts = [p.strip() for p in place.split(",")]
-    if len(parts) != 3 or parts[-1].upper() != "USA":
-        return place  # Must be 4-part ending in USA
-
-    city, state, country = parts
+    parsed = Place.parse(place)
+    if len(parsed) != 3 or parsed[-1].upper() != "USA":
+        return []
 
+    city, state, country = parsed
     if state not in STATE_NAMES:
-        return place  # Not a known U.S. state
+        return []  # Not a known U.S. state
 
-    for entry in US_PLACES:
-        if len(entry) != 3:
-            continue
-        entry_city, entry_county, entry_state = entry
+    return GAZETTEER.counties_of(city, state)
 
-        if city == entry_city and state == entry_state:
-            county_clean = entry_county.replace(" County", "").strip()
-            return f"{city}, {county_clean}, {state}, {country}"
 
-    return place
+def assign_county_if_known_place(place: str) -> str:
+    """
+    To a three part place, ending in USA, and if
+    it is a actual state, add the county the city is in.
+    A city the gazetteer lists in more than one county of the state is
+    left alone (known_county_candidates() tells which), not guessed.
+    """
+    counties = known_county_candidates(place)
+    if len(counties) != 1:
+        return place
+
+    city, state, country = Place.parse(place)
+    county_clean = counties[0].replace(" County", "").strip()
+    return f"{city}, {county_clean}, {state}, {country}"
 
 
 def known_county_inserted(place: str) -> tuple[str, bool]:
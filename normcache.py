@@ -0,0 +1,149 @@
+# normcache.py
+"""
+Memoized normalize_place_iteratively() results.
+
+Keys are (place name, rule-set version).  The version is a hash of the files
+the rules come from (normalizer.py, normalizer_rules.toml, config.py, ...),
+so editing a mapping or a gazetteer file invalidates every cached result
+without anyone having to remember to clear anything.
+
+Two layers: an in-process LRU, and an optional SQLite store (by default next
+to the database, "<db>.normcache") that carries results across runs and
+across the .rmtree files that share it.
+"""
+import hashlib
+import os
+import sqlite3
+from collections import OrderedDict
+from functools import lru_cache
+
+RULESET_FILES = (
+    "normalizer.py", "normalizer_rules.toml", "rulebook.py",
+    "config.py", "jurisdictions.py", "gazetteer.py", "placeindex.py", "spelling.py", "us_counties.txt", "us_places.txt",
+)
+
+# normalize_place_iteratively() returns None for "unchanged", so misses need their own marker
+MISS = object()
+
+
+@lru_cache(maxsize=1)
+def ruleset_version() -> str:
+    """Hash of the rule sources, computed once per process."""
+    digest = hashlib.sha256()
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    for filename in RULESET_FILES:
+        digest.update(filename.encode())
+        with open(os.path.join(base_path, filename), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def cache_path_for(db_path: str) -> str:
+    return f"{db_path}.normcache"
+
+
+class NormalizationCache:
+    """
+    LRU of name -> normalized name (None = already normal), optionally
+    backed by an on-disk store opened with open_store().
+    """
+
+    def __init__(self, maxsize=65536, version=None):
+        self.maxsize = maxsize
+        self.version = version or ruleset_version()
+        self._memory = OrderedDict()
+        self._store = None
+        self._pending = []
+        self.store_path = None
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def lookup(self, name):
+        """Return the cached result for name, or MISS."""
+        if name in self._memory:
+            self._memory.move_to_end(name)
+            self.hits += 1
+            return self._memory[name]
+
+        if self._store is not None:
+            row = self._store.execute(
+                "SELECT Result FROM NormalizeCache WHERE Version = ? AND Name = ?",
+                (self.version, name),
+            ).fetchone()
+            if row is not None:
+                self.store_hits += 1
+                self._remember(name, row[0])
+                return row[0]
+
+        self.misses += 1
+        return MISS
+
+    def store(self, name, result):
+        self._remember(name, result)
+        if self._store is not None:
+            self._pending.append((self.version, name, result))
+            if len(self._pending) >= 1000:
+                self.flush()
+
+    def _remember(self, name, result):
+        self._memory[name] = result
+        self._memory.move_to_end(name)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def open_store(self, path):
+        """Back the cache with the SQLite file at path, dropping stale rule-set versions."""
+        self.close_store()
+        self._store = sqlite3.connect(path)
+        self._store.execute("""
+            CREATE TABLE IF NOT EXISTS NormalizeCache (
+                Version TEXT NOT NULL,
+                Name TEXT NOT NULL,
+                Result TEXT,
+                PRIMARY KEY (Version, Name)
+            ) WITHOUT ROWID
+        """)
+        self._store.execute("DELETE FROM NormalizeCache WHERE Version != ?", (self.version,))
+        self._store.commit()
+        self.store_path = path
+
+    def flush(self):
+        if self._store is None or not self._pending:
+            return
+        self._store.executemany(
+            "INSERT OR REPLACE INTO NormalizeCache (Version, Name, Result) VALUES (?, ?, ?)",
+            self._pending,
+        )
+        self._store.commit()
+        self._pending = []
+
+    def close_store(self):
+        if self._store is None:
+            return
+        self.flush()
+        self._store.close()
+        self._store = None
+        self.store_path = None
+
+    def clear(self):
+        """Forget the in-process entries and the statistics (the store is kept)."""
+        self._memory.clear()
+        self.hits = self.store_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.store_hits + self.misses
+        return {
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.store_hits) / lookups if lookups else 0.0,
+            "size": len(self._memory),
+        }
+
+    def report(self):
+        s = self.stats()
+        where = f", store {self.store_path}" if self.store_path else ""
+        print(f"🗃️  Normalization cache (rules {self.version}{where}): "
+              f"{s['hits']} hits, {s['store_hits']} store hits, {s['misses']} misses "
+              f"({s['hit_rate']:.0%} hit rate)")
@@ -0,0 +1,56 @@
+# place.py
+"""
+A place name split into its comma-separated fields.
+
+Place is a tuple of the stripped fields, so indexing, len() and unpacking
+cost what they cost on a tuple; replacing a field gives a new Place.  The
+lower-case fields and the casefolded key are computed on first use and
+kept, and the string form is only built when asked for.  Place.parse()
+remembers recent names, so the normalizer's many "split on commas and
+strip" steps over the same string, pass after pass, share one Place.
+"""
+from functools import cached_property, lru_cache
+
+
+class Place(tuple):
+    """Fields of a place name, e.g. Place.parse("Salt Lake City, Salt Lake, Utah, USA")."""
+
+    def __new__(cls, fields, name=None):
+        place = super().__new__(cls, fields)
+        place._name = name      # the string it was parsed from, if any
+        return place
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def parse(name: str) -> "Place":
+        """Split on commas, stripping every field; empty fields are kept."""
+        return Place([part.strip() for part in name.split(",")], name)
+
+    @cached_property
+    def lower(self) -> tuple:
+        """The fields, lower-cased."""
+        return tuple(field.lower() for field in self)
+
+    @cached_property
+    def key(self) -> str:
+        """Casefolded "a, b, c" form, for comparisons that ignore case."""
+        return self.joined().casefold()
+
+    def replace(self, index, value) -> "Place":
+        """A new Place with self[index] set to value."""
+        fields = list(self)
+        fields[index] = value
+        return Place(fields)
+
+    def joined(self) -> str:
+        """The fields joined with ", ", whatever the original spacing was."""
+        return ", ".join(self)
+
+    def __str__(self):
+        # a parsed Place gives back its original string, spacing and all
+        if self._name is None:
+            self._name = self.joined()
+        return self._name
+
+    def __repr__(self):
+        return f"Place({tuple(self)!r})"
@@ -1,5 +1,7 @@
 import sqlite3
 from rmutils import get_connection, get_place_details
+from config import SQLITE_PROFILES
+from normalizer import normalize_many
 from collections import defaultdict
 from rapidfuzz import fuzz
 
@@ -10,6 +12,16 @@ def fetch_all_places(conn):
     return cursor.fetchall()
 
 
+def normalized_places(places, jobs=1):
+    """(PlaceID, name) pairs with each name replaced by its normalized form, if it has one."""
+    results = normalize_many([name for _, name in places], jobs=jobs,
+                             place_ids=[place_id for place_id, _ in places])
+    return [
+        (place_id, new_name if new_name and new_name != "NOPLACENAME" else name)
+        for (place_id, name), new_name in zip(places, results)
+    ]
+
+
 def compute_similarity_scores(places, method='levenshtein', threshold=90):
     duplicates = defaultdict(list)
     seen = set()
@@ -51,10 +63,23 @@ def report_fuzzy_matches(duplicates):
 
 
 if __name__ == '__main__':
-    conn = get_connection(read_only=False)
+    import argparse
+    parser = argparse.ArgumentParser(description="Report fuzzy-matching place names")
+    parser.add_argument("--profile", choices=SQLITE_PROFILES,
+                        help="SQLite performance profile (see config.SQLITE_PROFILES)")
+    parser.add_argument("--normalized", action="store_true",
+                        help="Compare the names as normalize_place_names() would rewrite them")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for normalizing the names (with --normalized)")
+    args = parser.parse_args()
+
+    conn = get_connection(read_only=False, profile=args.profile)
 
     print("🔎 Fetching all place names...")
     places = fetch_all_places(conn)
+    if args.normalized:
+        print("🧹 Normalizing place names...")
+        places = normalized_places(places, jobs=args.jobs)
 
     print("\n🧪 Running fuzzy match analysis (Levenshtein)...")
     levenshtein_matches = compute_similarity_scores(places, method='levenshtein', threshold=92)
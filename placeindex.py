@@ -0,0 +1,135 @@
+# placeindex.py
+"""
+U.S. places (city, county, state) in a sorted, fixed-layout file read through
+mmap, so a national gazetteer costs no Python objects until it is queried and
+every process opening the file shares its pages through the page cache.
+
+Layout, little-endian:
+    header    b"RMPX", format (u32), record count (u32), then the stamp of the
+              text file it was built from: mtime_ns (u64), size (u64), sha256
+    records   count x (offset u32, key length u16, record length u16),
+              sorted by key
+    strings   UTF-8; at each offset the key, casefolded "state<US>city",
+              followed by "city<US>county<US>state" as given
+
+Records with the same key keep the order of the text file.  A lookup is a
+binary search over the records comparing key bytes, and only the records
+whose key matches are decoded.
+"""
+import mmap
+import struct
+from bisect import bisect_left
+
+MAGIC = b"RMPX"
+FORMAT = 1
+_HEADER = struct.Struct("<4sIIQQ32s")
+_RECORD = struct.Struct("<IHH")
+_SEPARATOR = "\x1f"  # ASCII unit separator, never in a place name
+
+
+def place_key(city: str, state: str) -> bytes:
+    return f"{state.casefold()}{_SEPARATOR}{city.casefold()}".encode()
+
+
+def write_place_index(path, places, stamp=(0, 0, b"")):
+    """Write places [(city, county, state)] to path; stamp is (mtime_ns, size, sha256 digest)."""
+    records = sorted(
+        ((place_key(city, state), _SEPARATOR.join((city, county, state)).encode())
+         for city, county, state in places),
+        key=lambda record: record[0],   # stable: equal keys stay in file order
+    )
+    table = bytearray()
+    strings = bytearray()
+    base = _HEADER.size + _RECORD.size * len(records)
+    for key, record in records:
+        table += _RECORD.pack(base + len(strings), len(key), len(key) + len(record))
+        strings += key + record
+    mtime_ns, size, digest = stamp
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT, len(records), mtime_ns, size, digest))
+        f.write(table)
+        f.write(strings)
+
+
+def stamp_place_index(path, stamp):
+    """Record a new stamp for the text file in the header, when it was touched but not changed."""
+    try:
+        with open(path, "r+b") as f:
+            magic, version, count, *_ = _HEADER.unpack(f.read(_HEADER.size))
+            f.seek(0)
+            f.write(_HEADER.pack(magic, version, count, *stamp))
+    except OSError:
+        pass  # it is only checked by hash again next time
+
+
+class _Keys:
+    """The record keys as a sequence, for bisect."""
+
+    def __init__(self, index):
+        self._map = index._map
+        self._count = index.count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        offset, key_length, _ = _RECORD.unpack_from(self._map, _HEADER.size + _RECORD.size * i)
+        return self._map[offset:offset + key_length]
+
+
+class PlaceIndex:
+    """A place index file opened read-only; raises ValueError if it is not one."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a place index: {path}")
+        magic, version, self.count, mtime_ns, size, self.digest = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT:
+            self.close()
+            raise ValueError(f"Not a place index (format {FORMAT}): {path}")
+        self.signature = (mtime_ns, size)
+        self._keys = _Keys(self)
+
+    def _records(self, start, key, prefix=False):
+        """Decoded (city, county, state) of the records from start on whose key is (or starts with) key."""
+        for i in range(start, self.count):
+            offset, key_length, length = _RECORD.unpack_from(self._map, _HEADER.size + _RECORD.size * i)
+            found = self._map[offset:offset + key_length]
+            if found != key and not (prefix and found.startswith(key)):
+                return
+            yield tuple(self._map[offset + key_length:offset + length].decode().split(_SEPARATOR))
+
+    def counties(self, city: str, state: str, ignore_case: bool = False) -> list:
+        """The counties listed for (city, state), in file order."""
+        key = place_key(city, state)
+        matches = self._records(bisect_left(self._keys, key), key)
+        if ignore_case:
+            return [county for _, county, _ in matches]
+        return [county for found_city, county, found_state in matches
+                if found_city == city and found_state == state]
+
+    def cities_in(self, state: str, county: str | None = None) -> frozenset:
+        """The cities of state, or of its county ("X County"); only that state's records are decoded."""
+        prefix = f"{state.casefold()}{_SEPARATOR}".encode()
+        matches = self._records(bisect_left(self._keys, prefix), prefix, prefix=True)
+        return frozenset(city for city, found_county, found_state in matches
+                         if found_state == state and county in (None, found_county))
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """(city, county, state) for every record, in key order."""
+        for i in range(self.count):
+            offset, key_length, length = _RECORD.unpack_from(self._map, _HEADER.size + _RECORD.size * i)
+            yield tuple(self._map[offset + key_length:offset + length].decode().split(_SEPARATOR))
+
+    def close(self):
+        self._map.close()
+
+    def __repr__(self):
+        return f"PlaceIndex({self.path!r}, {self.count} places)"
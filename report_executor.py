@@ -0,0 +1,131 @@
+# report_executor.py
+"""
+Run independent read-only reports side by side.
+
+Each worker (thread or process) opens its own get_connection(read_only=True)
+connection, so N reports take roughly as long as the slowest one instead of
+the sum of all of them. Whatever a report prints is captured per report and
+handed back with its return value and run time, in the order the reports
+were given, so the combined output reads the same as a serial run.
+"""
+import io
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from rmutils import get_connection
+
+
+ReportResult = namedtuple("ReportResult", ["label", "value", "output", "seconds", "error"])
+
+# per worker thread/process state: its connection and its output buffer
+_worker = threading.local()
+
+
+class _ThreadStdout:
+    """sys.stdout stand-in sending each worker's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_worker, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        buffer = getattr(_worker, "buffer", None)
+        (buffer or self.stream).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _init_worker(profile, connect, install_stdout):
+    if install_stdout and not isinstance(sys.stdout, _ThreadStdout):
+        sys.stdout = _ThreadStdout(sys.stdout)
+    _worker.conn = get_connection(read_only=True, profile=profile) if connect else None
+
+
+def _run_report(label, func, args):
+    _worker.buffer = io.StringIO()
+    value = None
+    error = None
+    t0 = time.perf_counter()
+    try:
+        if _worker.conn is not None:
+            value = func(_worker.conn, *args)
+        else:
+            value = func(*args)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        seconds = time.perf_counter() - t0
+        output = _worker.buffer.getvalue()
+        _worker.buffer = None
+    return ReportResult(label, value, output, seconds, error)
+
+
+class ReportExecutor:
+    """
+    Runs (label, func, *args) reports on a pool of jobs workers.
+    func is called as func(conn, *args) with the worker's read-only
+    connection, or func(*args) when connect=False.
+
+    With processes=True (the default) func, args and the return value
+    must be picklable, i.e. module-level functions returning plain data.
+    Threads share one interpreter, so they only help reports that spend
+    their time inside SQLite.
+    """
+
+    def __init__(self, jobs=None, processes=True, profile="analysis", connect=True):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.processes = processes
+        self.profile = profile
+        self.connect = connect
+
+    def run(self, reports) -> list[ReportResult]:
+        reports = list(reports)
+        if not reports:
+            return []
+        jobs = min(self.jobs, len(reports))
+
+        if self.processes:
+            pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self.profile, self.connect, True),
+            )
+        else:
+            sys.stdout = _ThreadStdout(sys.stdout)
+            pool = ThreadPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(self.profile, self.connect, False),
+            )
+
+        try:
+            with pool:
+                futures = [pool.submit(_run_report, label, func, args) for label, func, *args in reports]
+                return [future.result() for future in futures]
+        finally:
+            if isinstance(sys.stdout, _ThreadStdout):
+                sys.stdout = sys.stdout.stream
+
+
+def print_report_results(results, timings=True):
+    """Print each report's captured output in order, then the run times."""
+    for result in results:
+        sys.stdout.write(result.output)
+        if result.error:
+            print(f"❌ {result.label} failed: {result.error}")
+
+    if timings and results:
+        print("\n⏱️  Report times:")
+        for result in results:
+            print(f"    {result.label:<40} {result.seconds:8.2f} s")
+        longest = max(r.seconds for r in results)
+        total = sum(r.seconds for r in results)
+        print(f"    {'sum of reports':<40} {total:8.2f} s  (longest {longest:.2f} s)")
@@ -0,0 +1,46 @@
+# rmnocase.py
+"""
+Pure-Python RMNOCASE collation.
+
+RootsMagic declares its name columns (PlaceTable.Name, NameTable.Surname, ...)
+with COLLATE RMNOCASE, so any connection that touches those indexes needs a
+collation of that name.  The usual choice is the native unifuzz.so extension;
+this module is the fallback for machines without it (or without
+enable_load_extension support in their Python build).
+
+Comparison is case- and diacritic-insensitive: "Müller" == "muller".
+"""
+import unicodedata
+from functools import lru_cache
+
+# Bump when fold_key() changes so persisted REINDEX markers are invalidated
+RMNOCASE_VERSION = "python-rmnocase-1"
+
+
+@lru_cache(maxsize=65536)
+def fold_key(value: str) -> str:
+    """
+    Return the case/diacritic folded form of value.
+    Memoized, so sorting a column only folds each distinct string once.
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.casefold()
+
+
+def rmnocase_compare(a: str, b: str) -> int:
+    """sqlite3 collation callable: negative, zero or positive like strcmp."""
+    if a == b:
+        return 0
+    ka = fold_key(a)
+    kb = fold_key(b)
+    return (ka > kb) - (ka < kb)
+
+
+def register_rmnocase(conn) -> str:
+    """
+    Register RMNOCASE on a sqlite3 connection.
+    Returns an identifier for the collation (used in REINDEX fingerprints).
+    """
+    conn.create_collation("RMNOCASE", rmnocase_compare)
+    return RMNOCASE_VERSION
@@ -5,14 +5,17 @@ import re
 import os
 import sys
 import csv
+import atexit
+import time
+import weakref
 # import argparse
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from datetime import datetime, timezone
 
 from config import (
     rmtree_path,
     extension_path,
-    US_COUNTIES,
+    SQLITE_PROFILES,
     STATE_ABBREVIATIONS,
     OLD_STYLE_ABBR,
     STATE_NAMES,
@@ -20,10 +23,14 @@ from config import (
     COMMON_PLACE_MAPPINGS,
     MEXICAN_STATES,
     CANADIAN_PROVINCES,
-    HISTORICAL_US_TERRITORIES,
     UNIQUE_FACT_TYPES,
 )
 
+from gazetteer import GAZETTEER
+from jurisdictions import JURISDICTIONS, COUNTRY, US_TERRITORY
+from place import Place
+from rmnocase import register_rmnocase
+
 from normalizer import (
     normalize_once,
     strip_address_if_present,
@@ -40,9 +47,201 @@ def get_config():
     }
 
 
-def get_connection(read_only=False):
+def _collation_fingerprint(db_path, collation_id):
+    """
+    Fingerprint of the loaded RMNOCASE collation plus the database's
+    schema cookie and file change counter (read from the SQLite header).
+    If any of these change, the RMNOCASE indexes may be stale.
+    """
+    return f"{collation_id}|{_file_state(db_path)}"
+
+
+def _file_state(db_path):
+    """The schema cookie and file change counter from the SQLite header."""
+    with open(db_path, "rb") as f:
+        header = f.read(100)
+    change_counter = int.from_bytes(header[24:28], "big")
+    schema_cookie = int.from_bytes(header[40:44], "big")
+    return f"{schema_cookie}|{change_counter}"
+
+
+def _load_rmnocase(conn, collation="auto"):
+    """
+    Make RMNOCASE available on conn and return an identifier for it.
+      - "native": load the unifuzz extension (error if unavailable)
+      - "python": use the pure-Python collation from rmnocase.py
+      - "auto":   native if it can be loaded, otherwise python
+    """
+    can_load = hasattr(conn, "enable_load_extension") and os.path.isfile(extension_path)
+
+    if collation == "native" and not can_load:
+        sys.exit(f"❌ Extension file not found or not loadable: {extension_path}")
+
+    if collation != "python" and can_load:
+        try:
+            conn.enable_load_extension(True)
+            try:
+                conn.load_extension(extension_path)
+            finally:
+                conn.enable_load_extension(False)
+        except sqlite3.Error as e:
+            # e.g. built for another architecture, or SQLite without extension loading
+            if collation == "native":
+                raise
+            print(f"⚠️ Could not load {extension_path} ({e}), using the Python RMNOCASE")
+            return register_rmnocase(conn)
+        ext = os.stat(extension_path)
+        return f"{extension_path}|{ext.st_size}|{ext.st_mtime_ns}"
+
+    return register_rmnocase(conn)
+
+
+def _reindex_marker_path(db_path):
+    """Sidecar file recording the fingerprint of the last REINDEX RMNOCASE."""
+    return db_path + ".reindex"
+
+
+def _read_reindex_marker(db_path):
+    try:
+        with open(_reindex_marker_path(db_path), encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_reindex_marker(db_path, fingerprint):
+    marker = _reindex_marker_path(db_path)
+    tmp = marker + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(fingerprint + "\n")
+    os.replace(tmp, marker)
+
+
+# connections that still have to put the journal mode back (see RMConnection)
+_profiled_connections = weakref.WeakSet()
+
+# PRAGMAs that change how the file itself is written
+_FILE_PRAGMAS = ("locking_mode", "journal_mode", "synchronous")
+
+
+class RMConnection(sqlite3.Connection):
+    """
+    Connection returned by get_connection(). If a profile changed the
+    journal mode, the original one is restored on close() (or at exit
+    for connections that are never closed).
+    """
+    original_journal_mode = None
+    schema_catalog = None
+
+    def close(self):
+        self.restore_journal_mode()
+        super().close()
+
+    def restore_journal_mode(self):
+        mode = self.original_journal_mode
+        if mode is None:
+            return
+        self.original_journal_mode = None
+        try:
+            self.commit()
+            self.execute("PRAGMA locking_mode = NORMAL")
+            self.execute(f"PRAGMA journal_mode = {mode}")
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not restore journal_mode={mode}: {e}")
+
+
+@atexit.register
+def _restore_profiled_connections():
+    for conn in list(_profiled_connections):
+        conn.restore_journal_mode()
+
+
+def apply_profile(conn, profile, writable=True):
+    """
+    Apply a named PRAGMA set from config.SQLITE_PROFILES.
+    PRAGMAs in _FILE_PRAGMAS are skipped unless writable is True.
+    """
+    if profile not in SQLITE_PROFILES:
+        sys.exit(f"❌ Unknown profile: {profile} (choose from {', '.join(SQLITE_PROFILES)})")
+
+    pragmas = SQLITE_PROFILES[profile]
+    if writable and "journal_mode" in pragmas:
+        conn.original_journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        _profiled_connections.add(conn)
+
+    for pragma, value in pragmas.items():
+        if pragma in _FILE_PRAGMAS and not writable:
+            continue
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+class WorkingCopy(RMConnection):
+    """
+    In-memory copy of a RootsMagic database, see get_connection(in_memory=True).
+    All queries and changes run against RAM; nothing reaches the .rmtree file
+    until save() is called. Closing without saving discards the changes.
+    """
+    source_path = None
+    collation_id = None
+    read_only = False
+    indexes_valid = False
+    # _file_state() of the source when it was copied (None: it changed during the copy)
+    source_state = None
+
+    def save(self, path=None, force=False):
+        """
+        Write the working copy back to its source file, or to path.
+        Uses the SQLite backup API, so the destination is replaced in a
+        single transaction and never left half-written.
+        Refuses to overwrite a source that was written since it was copied
+        (e.g. by RootsMagic) unless force is True, as those changes would be lost.
+        Returns the path written.
+        """
+        target = path or self.source_path
+        to_source = os.path.abspath(target) == os.path.abspath(self.source_path)
+        if self.read_only and to_source:
+            raise ValueError("Working copy was opened read-only; save it to a new file instead.")
+        if to_source and not force and _file_state(target) != self.source_state:
+            raise ValueError(f"{target} changed since it was copied; save to a new file, or pass force=True to overwrite it.")
+
+        self.commit()
+        dest = sqlite3.connect(target)
+        try:
+            self.backup(dest)
+            # session helper indexes never go back to RootsMagic
+            drop_helper_indexes(dest)
+        finally:
+            dest.close()
+
+        if self.indexes_valid:
+            # the backup and the dropped helper indexes changed the header,
+            # so the marker gets the file's fingerprint as written now
+            _write_reindex_marker(target, _collation_fingerprint(target, self.collation_id))
+        if to_source:
+            self.source_state = _file_state(target)
+        return target
+
+
+def get_connection(read_only=False, reindex=None, collation="auto", in_memory=False, profile=None):
     """Returns a SQLite connection with RMNOCASE extension loaded.
     Defaults to read-only access unless read_only is set to False.
+
+    profile names a PRAGMA set from config.SQLITE_PROFILES
+    ("analysis", "bulk-write", "offline-batch"); None keeps SQLite's defaults.
+
+    With in_memory=True the database is copied into a :memory: WorkingCopy
+    connection using the backup API; call conn.save() to write it back.
+
+    The collation argument selects the RMNOCASE implementation, see
+    _load_rmnocase(); by default the pure-Python one is used when
+    the unifuzz extension is not available.
+
+    REINDEX RMNOCASE is only run when needed:
+      - reindex=None:  only if the collation/database fingerprint differs
+                       from the one recorded after the last reindex
+      - reindex=True:  always (e.g. from a script's --reindex option)
+      - reindex=False: never
+    Read-only connections are never reindexed.
     """
     if not os.path.isfile(rmtree_path):
         sys.exit(f"❌ Database file not found: {rmtree_path}")
@@ -50,32 +249,112 @@ def get_connection(read_only=False):
         sys.exit(f"❌ Database file not readable: {rmtree_path}")
     if os.path.getsize(rmtree_path) == 0:
         sys.exit(f"❌ Database file is empty: {rmtree_path}")
-    if not os.path.isfile(extension_path):
-        sys.exit(f"❌ Extension file not found: {extension_path}")
 
     try:
-        if read_only:
+        if in_memory:
+            source = sqlite3.connect(f"file:{rmtree_path}?mode=ro", uri=True)
+            conn = sqlite3.connect(":memory:", factory=WorkingCopy)
+            try:
+                copied_state = _file_state(rmtree_path)
+                source.backup(conn)
+                if _file_state(rmtree_path) != copied_state:
+                    copied_state = None  # written during the copy: the marker can't vouch for it
+            finally:
+                source.close()
+            conn.source_path = rmtree_path
+            conn.source_state = copied_state
+            conn.read_only = read_only
+        elif read_only:
             uri = f"file:{rmtree_path}?mode=ro"
-            conn = sqlite3.connect(uri, uri=True)
+            conn = sqlite3.connect(uri, uri=True, factory=RMConnection)
         else:
-            conn = sqlite3.connect(rmtree_path)
+            conn = sqlite3.connect(rmtree_path, factory=RMConnection)
 
         conn.row_factory = sqlite3.Row
-        conn.enable_load_extension(True)
-        conn.load_extension(extension_path)
-        conn.execute("REINDEX RMNOCASE;")
+        collation_id = _load_rmnocase(conn, collation)
+
+        if profile:
+            apply_profile(conn, profile, writable=not (read_only or in_memory))
+
+        if not read_only and reindex is not False:
+            if in_memory:
+                # the state of the file as copied, not as it is now
+                fingerprint = copied_state and f"{collation_id}|{copied_state}"
+            else:
+                fingerprint = _collation_fingerprint(rmtree_path, collation_id)
+            if reindex or fingerprint is None or fingerprint != _read_reindex_marker(rmtree_path):
+                conn.execute("REINDEX RMNOCASE;")
+                if not in_memory:
+                    # REINDEX bumps the change counter, record the new state
+                    fingerprint = _collation_fingerprint(rmtree_path, collation_id)
+                    _write_reindex_marker(rmtree_path, fingerprint)
+            if in_memory:
+                # the copy was either reindexed in RAM or copied from a file
+                # whose marker matched; save() writes the marker for the file
+                conn.collation_id = collation_id
+                conn.indexes_valid = True
         return conn
 
     except Exception as e:
         sys.exit(f"❌ SQLite initialization error: {e}")
 
 
-def run_query(conn, sql, params=None):
-    """Executes a SQL query and returns a pandas DataFrame."""
+# Column dtypes for run_query(dtype=...): 32-bit IDs instead of int64,
+# categorical fact types (a handful of values repeated on every event)
+ID_DTYPES = {
+    "PersonID": "int32",
+    "OwnerID": "int32",
+    "PlaceID": "int32",
+    "EventID": "int32",
+    "MediaID": "int32",
+    "FamilyID": "int32",
+    "ChildID": "int32",
+    "MotherID": "int32",
+    "FatherID": "int32",
+}
+EVENT_DTYPES = {**ID_DTYPES, "EventType": "category", "OwnerType": "int8"}
+
+
+def run_query(conn, sql, params=None, chunksize=None, dtype=None):
+    """Executes a SQL query and returns a pandas DataFrame.
+    With chunksize, returns an iterator of DataFrames of at most chunksize
+    rows instead, so memory stays bounded on large trees.
+    dtype maps column names to pandas dtypes (see ID_DTYPES, EVENT_DTYPES);
+    columns not in the result are ignored.
+    """
+    try:
+        frames = pd.read_sql_query(sql, conn, params=params or {}, chunksize=chunksize)
+    except Exception as e:
+        sys.exit(f"❌ Query failed: {e}")
+    if not dtype:
+        return frames
+    if chunksize:
+        return (_with_dtypes(chunk, dtype) for chunk in frames)
+    return _with_dtypes(frames, dtype)
+
+
+def _with_dtypes(frame, dtype):
+    """frame with the dtypes of the columns it has; the query runs as given, never rewritten."""
+    present = {col: t for col, t in dtype.items() if col in frame.columns}
+    return frame.astype(present) if present else frame
+
+
+def iter_query(conn, sql, params=None, chunksize=10000):
+    """
+    Yields the rows of a query as plain tuples, fetching chunksize rows
+    at a time, for loops that don't need a DataFrame at all.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
     try:
-        return pd.read_sql_query(sql, conn, params=params or {})
+        cursor.execute(sql, params or ())
     except Exception as e:
         sys.exit(f"❌ Query failed: {e}")
+    while True:
+        rows = cursor.fetchmany(chunksize)
+        if not rows:
+            break
+        yield from rows
 
 
 def get_primary_names(conn, person_ids=None):
@@ -100,10 +379,120 @@ def get_primary_names(conn, person_ids=None):
     }
 
 
-def merge_place_records(conn, canonical_id, duplicate_id, dry_run=True, brief=True):
+class PlaceWriter:
+    """
+    Unit of work for place changes: renames, reference repoints and deletes
+    are queued and written with executemany() in a single transaction
+    instead of one UPDATE (and commit) per row.
+
+        with PlaceWriter(conn) as writer:
+            update_place_name(conn, pid, new_name, writer=writer)
+            delete_place_id(conn, other_pid, writer=writer)
+
+    Leaving the block commits; an exception rolls back. With batch_size set,
+    the queue is flushed and committed every batch_size operations.
+    Queued changes are not visible to queries until they are flushed.
+    Rows changed per statement are kept in rowcounts (see report()).
+    """
+
+    # flush order: repoints must reach their target before the delete
+    RENAME, REPOINT, DELETE = 0, 1, 2
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int | None = None, brief: bool = True):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.brief = brief
+        self._pending = {}  # (phase, sql) -> [params, ...]
+        self._queued = 0
+        self.labels = {}
+        self.rowcounts = defaultdict(int)
+        self.statements = defaultdict(int)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+            if not self.brief:
+                self.report()
+        else:
+            self._pending.clear()
+            self._queued = 0
+            self.conn.rollback()
+        return False
+
+    def _queue(self, phase, sql, params, label):
+        self._pending.setdefault((phase, sql), []).append(params)
+        self.labels.setdefault(sql, label)
+        self._queued += 1
+        if self.batch_size and self._queued >= self.batch_size:
+            self.commit()
+
+    def rename_place(self, place_id: int, name: str, reverse: str | None = None) -> None:
+        """Set Name (and Reverse, if given) and UTCModDate of a PlaceTable row."""
+        if reverse is None:
+            sql = "UPDATE PlaceTable SET Name = ?, UTCModDate = ? WHERE PlaceID = ?"
+            params = (name, current_utcmoddate(), place_id)
+        else:
+            sql = "UPDATE PlaceTable SET Name = ?, Reverse = ?, UTCModDate = ? WHERE PlaceID = ?"
+            params = (name, reverse, current_utcmoddate(), place_id)
+        self._queue(self.RENAME, sql, params, "PlaceTable renamed")
+
+    def repoint_place(self, table: str, col: str, old_id: int, new_id: int, touch: bool = True) -> None:
+        """Change table.col from old_id to new_id (0 to drop the reference)."""
+        if touch:
+            sql = f"UPDATE {table} SET {col} = ?, UTCModDate = ? WHERE {col} = ?"
+            params = (new_id, current_utcmoddate(), old_id)
+        else:
+            sql = f"UPDATE {table} SET {col} = ? WHERE {col} = ?"
+            params = (new_id, old_id)
+        self._queue(self.REPOINT, sql, params, f"{table}.{col} repointed")
+
+    def repoint_owner(self, table: str, owner_type: int, old_id: int, new_id: int, touch: bool = True) -> None:
+        """Change OwnerID from old_id to new_id for rows of the given OwnerType."""
+        if touch:
+            sql = f"UPDATE {table} SET OwnerID = ?, UTCModDate = ? WHERE OwnerType = ? AND OwnerID = ?"
+            params = (new_id, current_utcmoddate(), owner_type, old_id)
+        else:
+            sql = f"UPDATE {table} SET OwnerID = ? WHERE OwnerType = ? AND OwnerID = ?"
+            params = (new_id, owner_type, old_id)
+        self._queue(self.REPOINT, sql, params, f"{table}.OwnerID repointed")
+
+    def delete_place(self, place_id: int) -> None:
+        """Delete a PlaceTable row."""
+        sql = "DELETE FROM PlaceTable WHERE PlaceID = ?"
+        self._queue(self.DELETE, sql, (place_id,), "PlaceTable deleted")
+
+    def flush(self) -> None:
+        """Execute everything queued, without committing."""
+        cursor = self.conn.cursor()
+        for (phase, sql) in sorted(self._pending, key=lambda key: key[0]):
+            params = self._pending[(phase, sql)]
+            cursor.executemany(sql, params)
+            self.rowcounts[sql] += max(cursor.rowcount, 0)
+            self.statements[sql] += len(params)
+        self._pending.clear()
+        self._queued = 0
+
+    def commit(self) -> None:
+        """Flush and commit the transaction."""
+        self.flush()
+        self.conn.commit()
+
+    def report(self) -> None:
+        for sql, rows in self.rowcounts.items():
+            print(f"    ✅ {self.labels[sql]}: {rows} row(s) from {self.statements[sql]} statement(s)")
+
+
+def merge_place_records(conn, canonical_id, duplicate_id, dry_run=True, brief=True, writer=None):
     if canonical_id == duplicate_id:
         raise ValueError("Canonical and duplicate IDs must differ.")
 
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn)
+
     referencing_tables = {
         "EventTable": "PlaceID",
         "FANTable": "PlaceID",
@@ -136,8 +525,7 @@ def merge_place_records(conn, canonical_id, duplicate_id, dry_run=True, brief=Tr
        print("        📋 Comparing PlaceTable fields:")
 
     differing_fields = []
-    cursor.execute("PRAGMA table_info(PlaceTable)")
-    columns = [col[1] for col in cursor.fetchall()]
+    columns = get_schema_catalog(conn).column_names("PlaceTable")
     for idx, field in enumerate(columns):
         if field in ("PlaceID", "UTCModDate"):
             continue
@@ -163,14 +551,7 @@ def merge_place_records(conn, canonical_id, duplicate_id, dry_run=True, brief=Tr
                 print(f" → Would update {count} row(s) in {table}.{col}")
 
             if not dry_run:
-                utcmoddate = current_utcmoddate()
-                update_sql = f"""
-                    UPDATE {table}
-                    SET {col} = ?,
-                        UTCModDate = ?
-                    WHERE {col} = ?
-                """
-                cursor.execute(update_sql, (canonical_id, utcmoddate, duplicate_id))
+                writer.repoint_place(table, col, duplicate_id, canonical_id)
 
     # Update referencing tables with conditional OwnerID = PlaceID
     for table, owner_type in conditional_tables:
@@ -182,25 +563,16 @@ def merge_place_records(conn, canonical_id, duplicate_id, dry_run=True, brief=Tr
         if count > 0:
             print(f" → Would update {count} row(s) in {table} (OwnerType={owner_type})")
             if not dry_run:
-                utcmoddate = current_utcmoddate()
-                update_sql = f"""
-                    UPDATE {table}
-                    SET OwnerID = ?,
-                        UTCModDate = ?
-                    WHERE OwnerType = ? AND OwnerID = ?
-                """
-                cursor.execute(
-                    update_sql, (canonical_id, utcmoddate, owner_type, duplicate_id)
-                )
+                writer.repoint_owner(table, owner_type, duplicate_id, canonical_id)
 
     # Delete the duplicate place
     if not dry_run:
-        cursor.execute("DELETE FROM PlaceTable WHERE PlaceID = ?", (duplicate_id,))
+        writer.delete_place(duplicate_id)
+        if own_writer:
+            writer.commit()
         if not brief:
             print(" ✅ Duplicate place deleted.")
 
-        conn.commit()
-
     if not brief:
         print("✅ Merge complete." if not dry_run else "ℹ️ Dry-run complete.")
 
@@ -285,13 +657,19 @@ def find_duplicate_place_names(conn: sqlite3.Connection, brief=True):
     return duplicates
 
 
-def merge_places(conn: sqlite3.Connection, dupes, dry_run=True, brief=True):
+def merge_places(conn: sqlite3.Connection, dupes, dry_run=True, brief=True, writer=None):
     """
     Merge PlaceTable records by replacing references to duplicates
     with a canonical PlaceID and removing the duplicates.
 
     Reports any critical conflicts where merge cannot proceed safely.
+    If a PlaceWriter is given, the merges are queued on it and committed
+    when the writer is; otherwise they are committed here in one transaction.
     """
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn, brief=brief)
+
     from rmutils import merge_place_records, get_place_details
 
     critical_conflicts = []
@@ -313,7 +691,7 @@ def merge_places(conn: sqlite3.Connection, dupes, dry_run=True, brief=True):
                 print(f"    🧬 Merging into PlaceID {survivor_id} from {victim_id}")
 
             try:
-                merge_place_records(conn, survivor_id, victim_id, dry_run, brief)
+                merge_place_records(conn, survivor_id, victim_id, dry_run, brief, writer=writer)
             except RuntimeError as e:
                 print(f"⚠️ Merge skipped due to critical differences:\n{e}")
                 # Fetch Name and full row details
@@ -356,29 +734,16 @@ def merge_places(conn: sqlite3.Connection, dupes, dry_run=True, brief=True):
 
     if dry_run:
         print("\n✅ Dry run complete — no changes committed.")
-    else:
-        conn.commit()
+    elif own_writer:
+        writer.commit()
         print("\n✅ Merges committed to database.")
 
 
 def find_placeid_references(conn: sqlite3.Connection):
-    # conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    referencing = []
-
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = [row[0] for row in cursor.fetchall()]
-
-    for table in tables:
-        cursor.execute(f"PRAGMA foreign_key_list({table})")
-        for row in cursor.fetchall():
-            ref_table = row[2]
-            from_col = row[3]
-            to_col = row[4]
-            if ref_table == "PlaceTable" and to_col == "PlaceID":
-                referencing.append((table, from_col))
-
-    return referencing
+    """
+    Return (table, column) pairs declared as foreign keys to PlaceTable.PlaceID.
+    """
+    return get_schema_catalog(conn).references_to("PlaceTable", "PlaceID")
 
 
 def get_place_details(conn, place_id):
@@ -402,12 +767,15 @@ def get_place_details(conn, place_id):
 
 
 
-def delete_place_id(conn: sqlite3.Connection, pid: int, dry_run=False, brief=True) -> bool:
+def delete_place_id(conn: sqlite3.Connection, pid: int, dry_run=False, brief=True, writer=None) -> bool:
     """
     Deletes a place from PlaceTable and removes all references to it from other tables.
     Skips deletion if PlaceType == 1 or if the place is still referenced.
     Sets PlaceID or OwnerID to 0 where applicable and updates UTCModDate.
     Returns True if deleted, False otherwise.
+
+    Without a PlaceWriter the changes are executed immediately (uncommitted);
+    with one they are queued on it.
     """
     cursor = conn.cursor()
 
@@ -421,15 +789,9 @@ def delete_place_id(conn: sqlite3.Connection, pid: int, dry_run=False, brief=Tru
         print(f"[delete_place_id] PlaceID {pid} has PlaceType == 1, skipping.")
         return False
 
-    utc_now = current_utcmoddate()
-
-    # Make sure pid is in the table
-    cursor.execute("SELECT PlaceID FROM PlaceTable WHERE PlaceID = ?", (pid,))
-    empty_id = [row[0] for row in cursor.fetchall()]
-
-    if not empty_id:
-        print("✅ No place with PlaceID = {pid} found.")
-        return False
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn)
 
     if not brief:
         print(f"🧹 Deleting PlaceID {pid} (and cleaning referencing records) ...")
@@ -442,23 +804,11 @@ def delete_place_id(conn: sqlite3.Connection, pid: int, dry_run=False, brief=Tru
 
     for table, col in referencing_tables.items():
         if table_has_column(cursor, table, col):
-            update_sql = f"UPDATE {table} SET {col} = 0"
-            params = []
-            if table_has_column(cursor, table, "UTCModDate"):
-                update_sql += ", UTCModDate = ?"
-                params.append(utc_now)
-            update_sql += f" WHERE {col} = ?"
-            params.append(pid)
+            touch = table_has_column(cursor, table, "UTCModDate")
             if not dry_run:
                 if not brief:
-                    # print(f"    🧹 Cleaning {table} record.\n{update_sql}, {params}")
                     print(f"    🧹 Cleaning {table} record.")
-
-                cursor.execute(update_sql, tuple(params))
-                updated_rows = cursor.rowcount
-                if updated_rows > 0:
-                    if not brief:
-                        print(f"    ✅ Updated {updated_rows} rows in {table}")
+                writer.repoint_place(table, col, pid, 0, touch=touch)
 
 
     # Conditionally referencing tables
@@ -474,39 +824,36 @@ def delete_place_id(conn: sqlite3.Connection, pid: int, dry_run=False, brief=Tru
         if not table_has_column(cursor, table, "OwnerType") or not table_has_column(cursor, table, "OwnerID"):
             continue
 
-        update_sql = f"UPDATE {table} SET OwnerID = 0"
-        params = []
-        if table_has_column(cursor, table, "UTCModDate"):
-            update_sql += ", UTCModDate = ?"
-            params.append(utc_now)
-        update_sql += " WHERE OwnerType = ? AND OwnerID = ?"
-        params.extend([owner_type, pid])
+        touch = table_has_column(cursor, table, "UTCModDate")
         if not dry_run:
             if not brief:
-                # print(f"    🧹 Cleaning {table} record.\n{update_sql}, {params}")
                 print(f"    🧹 Cleaning {table} record.")
-            cursor.execute(update_sql, tuple(params))
-            updated_rows = cursor.rowcount
-            if updated_rows > 0:
-                if not brief:
-                    print(f"    ✅ Updated {updated_rows} rows in {table}")
+            writer.repoint_owner(table, owner_type, pid, 0, touch=touch)
 
 
     # Delete the PlaceTable row
     if not dry_run:
-        cursor.execute("DELETE FROM PlaceTable WHERE PlaceID = ?", (pid,))
+        writer.delete_place(pid)
+        if own_writer:
+            writer.flush()
+            if not brief:
+                writer.report()
         if not brief:
             print(f"🗑️ Deleted PlaceID {pid}")
 
     return True 
 
 
-def delete_blank_place_records(conn, dry_run=False, brief=True):
+def delete_blank_place_records(conn, dry_run=False, brief=True, writer=None):
     """
     Deletes PlaceTable rows where Name is an empty string.
     Updates referencing and conditionally referencing tables,
     setting PlaceID or OwnerID to 0 and updating UTCModDate if present.
     """
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn, brief=brief)
+
     cursor = conn.cursor()
 
     # Get all PlaceIDs with blank names
@@ -517,23 +864,252 @@ def delete_blank_place_records(conn, dry_run=False, brief=True):
         return
 
     for pid in blank_place_ids:
-        ret = delete_place_id(conn, pid, dry_run=dry_run, brief=brief)
+        ret = delete_place_id(conn, pid, dry_run=dry_run, brief=brief, writer=writer)
 
     if not dry_run:
-        conn.commit()
+        if own_writer:
+            writer.commit()
         print(f"✅ Removed {len(blank_place_ids)} PlaceTable record(s) with empty names.")
     else:
         print(f"ℹ️ Dry run complete — {len(blank_place_ids)} PlaceTable record(s) would be removed.")
 
 
 
+class SchemaCatalog:
+    """
+    Tables, columns, indexes and foreign keys of a database, read with
+    PRAGMAs once instead of on every lookup. Use get_schema_catalog(conn)
+    to get the catalog cached on a connection, and invalidate() (or
+    invalidate_schema_catalog(conn)) after changing the schema.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.tables = None
+
+    def invalidate(self) -> None:
+        """Forget everything; the next lookup re-reads the schema."""
+        self.tables = None
+
+    def _load(self):
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        tables = [row[0] for row in cursor.fetchall()]
+
+        # SQLite matches table and column names case-insensitively, so the
+        # dicts are keyed (and looked up) casefolded; values keep the case
+        self.columns = {}        # table -> [column, ...] in declaration order
+        self.column_index = {}   # table -> {column: position}
+        self.indexes = {}        # table -> {index name: [column, ...]}
+        self.foreign_keys = {}   # table -> [(from column, ref table, ref column), ...]
+
+        for table in tables:
+            key = table.casefold()
+            cursor.execute(f"PRAGMA table_info({table})")
+            names = [row[1] for row in cursor.fetchall()]
+            self.columns[key] = names
+            self.column_index[key] = {name.casefold(): i for i, name in enumerate(names)}
+
+            self.indexes[key] = {}
+            cursor.execute(f"PRAGMA index_list({table})")
+            for index_name in [row[1] for row in cursor.fetchall()]:
+                cursor.execute(f"PRAGMA index_info({index_name})")
+                self.indexes[key][index_name] = [row[2] for row in cursor.fetchall()]
+
+            cursor.execute(f"PRAGMA foreign_key_list({table})")
+            self.foreign_keys[key] = [(row[3], row[2], row[4]) for row in cursor.fetchall()]
+
+        self.table_names = {table.casefold(): table for table in tables}
+        self.tables = tables
+
+    def _loaded(self):
+        if self.tables is None:
+            self._load()
+        return self
+
+    def has_table(self, table: str) -> bool:
+        return table.casefold() in self._loaded().columns
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column.casefold() in self._loaded().column_index.get(table.casefold(), ())
+
+    def column_names(self, table: str) -> list[str]:
+        return self._loaded().columns.get(table.casefold(), [])
+
+    def column_position(self, table: str, column: str) -> int | None:
+        return self._loaded().column_index.get(table.casefold(), {}).get(column.casefold())
+
+    def indexes_on(self, table: str) -> dict[str, list[str]]:
+        """Index name -> indexed columns for a table."""
+        return self._loaded().indexes.get(table.casefold(), {})
+
+    def references_to(self, table: str, column: str) -> list[tuple[str, str]]:
+        """(table, column) pairs with a foreign key to table.column."""
+        table, column = table.casefold(), column.casefold()
+        return [
+            (self.table_names[from_table], from_col)
+            for from_table, keys in self._loaded().foreign_keys.items()
+            for from_col, ref_table, ref_col in keys
+            if ref_table.casefold() == table and ref_col.casefold() == column
+        ]
+
+
+# catalogs of plain sqlite3 connections, which take neither attributes nor
+# weak references: the most recent few, by id(), each checked to be for
+# that very connection (an id can be reused once a connection is gone)
+_plain_catalogs = OrderedDict()
+_PLAIN_CATALOG_LIMIT = 8
+
+
+def _plain_catalog(conn):
+    catalog = _plain_catalogs.get(id(conn))
+    if catalog is not None and catalog.conn is conn:
+        _plain_catalogs.move_to_end(id(conn))
+        return catalog
+    return None
+
+
+def get_schema_catalog(conn) -> SchemaCatalog:
+    """
+    Return the SchemaCatalog cached for conn: on the connection itself for
+    those from get_connection(), in a small per-module cache for others.
+    """
+    catalog = getattr(conn, "schema_catalog", None) or _plain_catalog(conn)
+    if catalog is None:
+        catalog = SchemaCatalog(conn)
+        if isinstance(conn, RMConnection):
+            conn.schema_catalog = catalog
+        else:
+            _plain_catalogs[id(conn)] = catalog
+            while len(_plain_catalogs) > _PLAIN_CATALOG_LIMIT:
+                _plain_catalogs.popitem(last=False)
+    return catalog
+
+
+def invalidate_schema_catalog(conn) -> None:
+    """Call after CREATE/DROP/ALTER on conn so the catalog is re-read."""
+    catalog = getattr(conn, "schema_catalog", None) or _plain_catalog(conn)
+    if catalog is not None:
+        catalog.invalidate()
+
+
+class HelperIndexes:
+    """
+    Opt-in, session-scoped indexes for the place-reference lookups in
+    is_place_referenced, dump_place_usage, delete_place_id and
+    merge_place_records. Whether RootsMagic indexed those columns varies,
+    so each hot query is checked with EXPLAIN QUERY PLAN and an index is
+    created only where it would otherwise scan the whole table:
+
+        with HelperIndexes(conn):
+            fix_places(conn, ...)
+
+    The indexes are dropped on exit, and leftovers from an interrupted run
+    are dropped on entry, so the file goes back to RootsMagic unchanged.
+    """
+
+    # (table, columns to index, hot query taking a PlaceID)
+    HOT_QUERIES = [
+        ("EventTable", ("PlaceID",), "SELECT EventID FROM EventTable WHERE PlaceID = ?"),
+        ("FANTable", ("PlaceID",), "SELECT COUNT(*) FROM FANTable WHERE PlaceID = ?"),
+        ("MediaLinkTable", ("OwnerType", "OwnerID"),
+         "SELECT MediaID FROM MediaLinkTable WHERE OwnerType = 14 AND OwnerID = ?"),
+        ("TaskLinkTable", ("OwnerType", "OwnerID"),
+         "SELECT TaskID FROM TaskLinkTable WHERE OwnerType IN (5, 14) AND OwnerID = ?"),
+        ("URLTable", ("OwnerType", "OwnerID"),
+         "SELECT LinkID FROM URLTable WHERE OwnerType = 5 AND OwnerID = ?"),
+    ]
+
+    def __init__(self, conn: sqlite3.Connection, brief: bool = True, sample_size: int = 500):
+        self.conn = conn
+        self.brief = brief
+        self.sample_size = sample_size
+        self.created = []   # index names created by this session
+        self.timings = {}   # table -> (seconds before, seconds after)
+
+    def __enter__(self):
+        drop_helper_indexes(self.conn)
+        catalog = get_schema_catalog(self.conn)
+        sample = [row[0] for row in self.conn.execute(
+            "SELECT PlaceID FROM PlaceTable LIMIT ?", (self.sample_size,)
+        )]
+
+        for table, columns, sql in self.HOT_QUERIES:
+            if not all(catalog.has_column(table, col) for col in columns):
+                continue
+            if _query_uses_index(self.conn, sql):
+                continue
+
+            before = _time_query(self.conn, sql, sample)
+            name = HELPER_INDEX_PREFIX + table + "_" + "_".join(columns)
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+            self.created.append(name)
+            after = _time_query(self.conn, sql, sample)
+            self.timings[table] = (before, after)
+
+        self.conn.commit()
+        invalidate_schema_catalog(self.conn)
+        if not self.brief:
+            self.report()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.conn.rollback()
+        for name in self.created:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self.conn.commit()
+        self.created = []
+        invalidate_schema_catalog(self.conn)
+        return False
+
+    def report(self) -> None:
+        if not self.timings:
+            print("✅ All place-reference lookups already use an index.")
+            return
+        print(f"🔎 Helper indexes for this session ({self.sample_size} lookups each):")
+        for table, (before, after) in self.timings.items():
+            speedup = before / after if after else float("inf")
+            print(f"    {table:<16} {before * 1000:8.2f} ms → {after * 1000:8.2f} ms  ({speedup:.1f}x)")
+
+
+# Name prefix marking indexes created by HelperIndexes
+HELPER_INDEX_PREFIX = "idxRmtreePyHelper_"
+
+
+def _query_uses_index(conn, sql) -> bool:
+    """True if EXPLAIN QUERY PLAN shows no full table scan for sql."""
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", (0,)).fetchall()
+    return not any(row[3].startswith("SCAN") for row in plan)
+
+
+def _time_query(conn, sql, place_ids) -> float:
+    t0 = time.perf_counter()
+    for pid in place_ids:
+        conn.execute(sql, (pid,)).fetchall()
+    return time.perf_counter() - t0
+
+
+def drop_helper_indexes(conn) -> None:
+    """Drop any HelperIndexes leftovers (e.g. from an interrupted run)."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE ?",
+        (HELPER_INDEX_PREFIX + "%",),
+    ).fetchall()
+    for (name,) in rows:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    if rows:
+        conn.commit()
+        invalidate_schema_catalog(conn)
+
+
 def table_has_column(cursor, table_name, column_name):
     """
     Returns True if the given table has a column with the given name.
+    Accepts a cursor or a connection; answered from the schema catalog.
     """
-    cursor.execute(f"PRAGMA table_info({table_name})")
-    columns = [row[1] for row in cursor.fetchall()]
-    return column_name in columns
+    conn = getattr(cursor, "connection", cursor)
+    return get_schema_catalog(conn).has_column(table_name, column_name)
 
 
 
@@ -575,13 +1151,13 @@ def report_non_normalized_places(conn, limit: int = 1000, show_references: bool
             continue
         
 
-        parts = [p.strip() for p in name.split(",")]
+        place = Place.parse(name)
 
 
         # detect things like "Clay County, Clay, Indiana, USA"
-        if len(parts) == 4 and parts[-1].upper() == "USA":
-            state = parts[2].strip()
-            if state in STATE_NAMES and parts[0].endswith(" County"):
+        if len(place) == 4 and place[-1].upper() == "USA":
+            state = place[2]
+            if state in STATE_NAMES and place[0].endswith(" County"):
                 reasons.append("county name misordered")
 
 
@@ -622,12 +1198,12 @@ def report_non_normalized_places(conn, limit: int = 1000, show_references: bool
 
 
         # first two parts are the same 
-        if len(parts) > 1:
-            if parts[0] == parts[1]:
+        if len(place) > 1:
+            if place[0] == place[1]:
                 reasons.append("first two fields identical")
 
 
-        for part in parts:
+        for part in place:
             if re.match(r'^[0-9 ,.-]+$', part):
                 reasons.append("numeric or punctuation only in any field")
 
@@ -1032,35 +1608,37 @@ def get_all_places(conn: sqlite3.Connection) -> list[tuple[int, str]]:
 
 
 
-def update_place_name(conn: sqlite3.Connection, place_id: int, new_name: str) -> None:
+def update_place_name(conn: sqlite3.Connection, place_id: int, new_name: str, writer=None) -> None:
     """
     Updates the Name field of the given PlaceID in PlaceTable.
     Also updates the UTCModDate to the current UTC time.
+    Committed immediately unless queued on a PlaceWriter.
     """
-    cursor = conn.cursor()
-    mod_date = current_utcmoddate()
-    cursor.execute("""
-        UPDATE PlaceTable
-        SET Name = ?, UTCModDate = ?
-        WHERE PlaceID = ?
-    """, (new_name, mod_date, place_id))
-    conn.commit()
+    if writer is not None:
+        writer.rename_place(place_id, new_name)
+        return
+    writer = PlaceWriter(conn)
+    writer.rename_place(place_id, new_name)
+    writer.commit()
 
 
 
 
-def split_place(name: str) -> list[str]:
+def split_place(name: str) -> Place:
     """
     Splits a place name string into components using commas.
-    Strips leading/trailing whitespace from each component.
-    Example: "Salt Lake City, Salt Lake, Utah, USA" → ["Salt Lake City", "Salt Lake", "Utah", "USA"]
+    Strips leading/trailing whitespace from each component, dropping empty ones.
+    Example: "Salt Lake City, Salt Lake, Utah, USA" → Place(("Salt Lake City", "Salt Lake", "Utah", "USA"))
     """
-    return [part.strip() for part in name.split(",") if part.strip()]
+    place = Place.parse(name)
+    if "" in place:
+        place = Place(field for field in place if field)
+    return place
 
 
-def join_place(parts: list[str]) -> str:
+def join_place(parts: Place | list[str]) -> str:
     """
-    Joins a list of place components into a standardized place string.
+    Joins place components into a standardized place string.
     Example: ["Salt Lake City", "Salt Lake", "Utah", "USA"] → "Salt Lake City, Salt Lake, Utah, USA"
     """
     return ", ".join(parts)
@@ -1098,13 +1676,17 @@ def join_place(parts: list[str]) -> str:
 # 
 
 
-def infer_and_insert_missing_county(conn, dry_run=True, brief=False):
+def infer_and_insert_missing_county(conn, dry_run=True, brief=False, writer=None):
     """
     Scan PlaceTable for 3-field US place names (City, State, USA) and see if there’s a
     corresponding 4-field (City, County, State, USA) match. If found, insert County into 3-field name.
 
     Skips updates where the 4-field name has the same City and County (e.g., "Kankakee, Kankakee, Illinois, USA").
     """
+    own_writer = writer is None
+    if own_writer:
+        writer = PlaceWriter(conn, brief=brief)
+
     places = get_all_places(conn)
     place_map = {pid: split_place(name) for pid, name in places}
 
@@ -1114,7 +1696,7 @@ def infer_and_insert_missing_county(conn, dry_run=True, brief=False):
     for pid, fields in place_map.items():
         if len(fields) == 4 and fields[3] == "USA":
             city, county, state, _ = fields
-            if state in STATE_NAMES and (county, state) in US_COUNTIES:
+            if state in STATE_NAMES and GAZETTEER.is_county(county, state):
                 # Skip if city == county (e.g., "Kankakee, Kankakee, Illinois, USA")
                 if city.strip().lower() == county.strip().lower():
                     continue
@@ -1138,7 +1720,10 @@ def infer_and_insert_missing_county(conn, dry_run=True, brief=False):
                 if not dry_run:
                     if not brief:
                         print(f"📝 Updating PlaceID {pid}: '{join_place(fields)}' → '{new_name}'")
-                    update_place_name(conn, pid, new_name)
+                    update_place_name(conn, pid, new_name, writer=writer)
+
+    if own_writer and not dry_run:
+        writer.commit()
 
     if dry_run:
         print(f"✅ Would update {count} places\n")
@@ -1150,17 +1735,17 @@ def infer_and_insert_missing_county(conn, dry_run=True, brief=False):
 
 
 def is_non_county_missing_county(place: str) -> bool:
-    parts = [p.strip() for p in place.split(",")]
-    if len(parts) != 3:
+    parsed = Place.parse(place)
+    if len(parsed) != 3:
         return False
-    city, state, country = parts
+    city, state, country = parsed
     if country.upper() != "USA":
         return False
     if state not in STATE_NAMES:
         return False
     if city.endswith(" County"):
         return False
-    if (city, state) in US_COUNTIES:
+    if GAZETTEER.is_county(city, state):
         return False
     return True
 
@@ -1173,11 +1758,9 @@ def is_non_county_missing_county(place: str) -> bool:
 #     find_matches_against_known_segments(conn)
 
 def is_foreign_country(name: str) -> bool:
-    normalized = name.strip().casefold()  # normalize whitespace and case
-    return any(country.casefold() == normalized for country in FOREIGN_COUNTRIES)
-    # return any(country == name for country in FOREIGN_COUNTRIES)
+    # case and surrounding whitespace are ignored
+    return JURISDICTIONS.is_a(name, COUNTRY)
 
 def is_us_territory(name: str) -> bool:
-    normalized = name.strip().casefold()  # normalize whitespace and case
-    return any(country.casefold() == normalized for country in HISTORICAL_US_TERRITORIES) 
+    return JURISDICTIONS.is_a(name, US_TERRITORY)
 
@@ -0,0 +1,281 @@
+# spelling.py
+"""
+Typo correction for the fields of a place name, against the names the
+gazetteer files and config tables know.
+
+A NameIndex holds its names SymSpell-style: each casefolded name is filed
+under itself and under every form with one character deleted, so the names
+one edit (insertion, deletion, substitution or swap of neighbours) from a
+word are found with len(word) + 1 dict lookups.  A candidate must also have
+the word's Soundex code and the same spaces and punctuation ("De Kalb" is not a
+misspelling of "DeKalb"), and a word is corrected only when exactly one name
+qualifies: a misspelling left alone does less harm than one fixed by a guess.
+
+correct_misspellings() checks each field against the names that fit its
+place in the name: the country or state at the end, the county before a
+U.S. state against its counties, and the city against the places of that
+county (or of the state when no county is given).  The gazetteer is far
+from complete, so a correction is only made when the rest of the name
+confirms it: "USA" after a state, a county or place of the state before
+it, " County" or a city listed in the county for a county, the county a
+city is listed in.  suggested_corrections() lists the others for review.
+Words known (accents aside) as a region, a county or a place of the state
+are left as they are.
+
+Only the counties and the region tables are held in memory; places are
+looked up in the gazetteer's place index, and the per-state candidate
+indexes are built from that state's records alone.
+"""
+import unicodedata
+from functools import lru_cache
+
+from config import STATE_NAMES, FOREIGN_COUNTRIES, CANADIAN_PROVINCES, MEXICAN_STATES
+from gazetteer import GAZETTEER
+from place import Place
+
+MIN_LENGTH = 5  # shorter words have too many neighbours to correct safely
+
+_SOUNDEX_CODES = {
+    letter: digit
+    for digit, letters in (("1", "BFPV"), ("2", "CGJKQSXZ"), ("3", "DT"), ("4", "L"), ("5", "MN"), ("6", "R"))
+    for letter in letters
+}
+
+
+def soundex(word: str) -> str:
+    """American Soundex of the letters of word, e.g. "Ireland" and "Irland" -> "I645"."""
+    letters = [char for char in word.upper() if char.isalpha()]
+    if not letters:
+        return ""
+    code = letters[0]
+    last = _SOUNDEX_CODES.get(letters[0], "")
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, "")
+        if digit and digit != last:
+            code += digit
+        if letter not in "HW":  # H and W do not separate equal codes
+            last = digit
+    return (code + "000")[:4]
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insertion, deletion, substitution or swap of neighbours."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < len(a) and i < len(b) and a[i] == b[i]:
+        i += 1
+    if len(a) > len(b):
+        return a[i + 1:] == b[i:]
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return a[i + 1:i + 2] == b[i:i + 1] and a[i:i + 1] == b[i + 1:i + 2] and a[i + 2:] == b[i + 2:]
+
+
+def _deletes(word):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _skeleton(word):
+    """The characters of word that are not letters, in order."""
+    return [char for char in word if not char.isalpha()]
+
+
+def _fold(word):
+    """word casefolded and without accents, so "México" is known as "Mexico"."""
+    return "".join(char for char in unicodedata.normalize("NFKD", word.casefold())
+                   if not unicodedata.combining(char))
+
+
+class NameIndex:
+    """Names by casefolded form and one-deletion forms; see correct()."""
+
+    def __init__(self, names=()):
+        self._names = {}     # casefolded -> name as given
+        self._forms = {}     # casefolded name or one of its deletions -> casefolded names
+        self._corrections = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        folded = name.casefold()
+        self._names.setdefault(folded, name)
+        for form in _deletes(folded) | {folded}:
+            self._forms.setdefault(form, set()).add(folded)
+        self._corrections.clear()
+
+    def __contains__(self, word):
+        return word.casefold() in self._names
+
+    def get(self, word):
+        """The name word is (ignoring case) as given to the index, or None."""
+        return self._names.get(word.casefold())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names.values())
+
+    def candidates(self, word) -> list:
+        """The names one edit or less from word, sorted."""
+        folded = word.casefold()
+        found = set()
+        for form in _deletes(folded) | {folded}:
+            found |= self._forms.get(form, set())
+        return sorted(self._names[name] for name in found if within_one_edit(folded, name))
+
+    def correct(self, word) -> str | None:
+        """The one name word is a misspelling of, or None (known, too short, or no single candidate)."""
+        if word in self._corrections:
+            return self._corrections[word]
+        correction = None
+        if len(word) >= MIN_LENGTH and word not in self:
+            code, skeleton = soundex(word), _skeleton(word)
+            matches = [name for name in self.candidates(word)
+                       if soundex(name) == code and _skeleton(name) == skeleton]
+            if len(matches) == 1:
+                correction = matches[0]
+        self._corrections[word] = correction
+        return correction
+
+
+# the name that ends a place: a U.S. state, a country, a province or a Mexican state
+REGIONS = NameIndex(sorted(STATE_NAMES | FOREIGN_COUNTRIES) + CANADIAN_PROVINCES + MEXICAN_STATES)
+STATES = NameIndex(sorted(STATE_NAMES))
+
+
+@lru_cache(maxsize=None)
+def counties_of_state(state: str) -> NameIndex:
+    return NameIndex(sorted(GAZETTEER.counties_in(state)))
+
+
+@lru_cache(maxsize=None)
+def places_of(state: str, county: str | None = None) -> NameIndex:
+    """The places of a U.S. state, or of one of its counties ("X County")."""
+    return NameIndex(sorted(GAZETTEER.places_in(state, county)))
+
+
+@lru_cache(maxsize=1)
+def _region_and_county_names() -> frozenset:
+    """Every folded region and county name; the places stay in their index."""
+    names = {_fold(name) for name in REGIONS}
+    names.update(_fold(county) for county, _ in GAZETTEER.counties)
+    return frozenset(names)
+
+
+def is_known(word: str, state: str | None = None) -> bool:
+    """True if word (accents aside) is a region, a county, or a place of state."""
+    if _fold(word) in _region_and_county_names():
+        return True
+    return state is not None and bool(GAZETTEER.counties_of(word, state, ignore_case=True))
+
+
+def _county_stem(word):
+    """word without a " County" suffix in any case, and whether it had one."""
+    if word.casefold().endswith(" county"):
+        return word[:-len(" county")], True
+    return word, False
+
+
+def _candidate(word, index, state=None):
+    """The one name in index word is a misspelling of, keeping a " County" suffix, or None."""
+    stem, _ = _county_stem(word)
+    if is_known(stem, state):
+        return None
+    correction = index.correct(stem)
+    return None if correction is None else correction + word[len(stem):]
+
+
+def _is_local(word, state):
+    """True if word is a county or place of state."""
+    stem, _ = _county_stem(word)
+    return GAZETTEER.is_county(stem, state, ignore_case=True) or bool(GAZETTEER.counties_of(stem, state, ignore_case=True))
+
+
+def _find_corrections(name):
+    """
+    (fields of name with the confirmed corrections made, [(field, candidate)]
+    for the ones nothing around them confirms).
+    """
+    fields = list(Place.parse(name))
+    suggestions = []
+    if not fields[-1]:
+        return fields, suggestions
+
+    def settle(i, candidate, confirmed):
+        if candidate is None:
+            return
+        if confirmed:
+            fields[i] = candidate
+        else:
+            suggestions.append((fields[i], candidate))
+
+    if fields[-1].upper() == "USA":
+        # the "USA" says it is a state
+        state_at = len(fields) - 2
+        if state_at >= 0 and fields[state_at] not in STATE_NAMES:
+            settle(state_at, _candidate(fields[state_at], STATES), True)
+    else:
+        # a state is confirmed by a county or place of it before it
+        state_at = len(fields) - 1
+        candidate = _candidate(fields[-1], REGIONS)
+        settle(state_at, candidate,
+               candidate in STATE_NAMES and state_at >= 1 and _is_local(fields[state_at - 1], candidate))
+
+    state = STATES.get(fields[state_at]) if state_at >= 1 else None
+    if state is None:
+        return fields, suggestions
+
+    # "City, County, State", "X County, State" or "City, State"
+    county_at = None
+    city_at = state_at - 1
+    if state_at >= 2 or _county_stem(fields[city_at])[1]:
+        county_at, city_at = state_at - 1, state_at - 2
+
+    if county_at is not None and fields[county_at]:
+        # a county is confirmed by its " County" or by the city before it
+        candidate = _candidate(fields[county_at], counties_of_state(state), state)
+        confirmed = candidate is not None and (
+            _county_stem(candidate)[1]
+            or (city_at >= 0 and f"{candidate} County" in GAZETTEER.counties_of(fields[city_at], state, ignore_case=True))
+        )
+        settle(county_at, candidate, confirmed)
+
+    if city_at < 0 or not fields[city_at]:
+        return fields, suggestions
+    # a city is confirmed by the known county it is listed in
+    county = None
+    if county_at is not None:
+        stem, _ = _county_stem(fields[county_at])
+        name = counties_of_state(state).get(stem)
+        county = None if name is None else f"{name} County"
+    if county is not None:
+        settle(city_at, _candidate(fields[city_at], places_of(state, county), state), True)
+    else:
+        settle(city_at, _candidate(fields[city_at], places_of(state), state), False)
+    return fields, suggestions
+
+
+def correct_misspellings(name: str) -> str:
+    """
+    Fix the fields one edit away from a single known name that the rest of
+    the name confirms, e.g. "Abingon, Knox County, Illinois, USA" ->
+    "Abingdon, ..." (Abingdon is listed in Knox County).
+    """
+    fields, _ = _find_corrections(name)
+    if fields == list(Place.parse(name)):
+        return name
+    return ", ".join(fields)
+
+
+def suggested_corrections(name: str) -> list:
+    """
+    [(field, candidate)] of the misspellings correct_misspellings() leaves
+    alone because nothing in the name confirms them, for review.
+    """
+    return _find_corrections(name)[1]
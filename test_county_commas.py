@@ -0,0 +1,17 @@
+import pytest
+
+from normalizer import fix_missing_commas_in_county_state
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Edinburg Shenandoah, Virginia, USA", "Edinburg, Shenandoah, Virginia, USA"),
+    ("Akron Summit, Ohio, USA", "Akron, Summit, Ohio, USA"),
+    ("Aledo Mercer, Illinois", "Aledo, Mercer, Illinois"),
+    # a city whose last word is a county of its state
+    ("Fort Wayne, Indiana, USA", "Fort Wayne, Indiana, USA"),
+    # the county alone, or a county of another state
+    ("Shenandoah, Virginia, USA", "Shenandoah, Virginia, USA"),
+    ("Akron Summit, Indiana, USA", "Akron Summit, Indiana, USA"),
+])
+def test_missing_comma_between_city_and_county(name, expected):
+    assert fix_missing_commas_in_county_state(name) == expected
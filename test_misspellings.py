@@ -0,0 +1,31 @@
+import pytest
+
+from normalizer import normalize_place_iteratively
+from spelling import correct_misspellings, suggested_corrections
+
+
+@pytest.mark.parametrize("name, expected", [
+    # fixed by the literal rules: nothing in the name confirms the index's candidate
+    ("Abingon, Illinois, USA", "Abingdon, Illinois, USA"),
+    ("Bethlehm, Kentucky, USA", "Bethlehem, Kentucky, USA"),
+    ("123 Main St, Fraanklin County, Kentucky, USA", "Franklin, Kentucky, USA"),
+    ("Los Angles, California", "Los Angeles, California, USA"),
+    ("Belfast, Irland", "Belfast, Ireland"),
+    # confirmed by the county
+    ("Abingon, Knox County, Illinois, USA", "Abingdon, Knox, Illinois, USA"),
+    ("Fraanklin County, Kentucky, USA", "Franklin County, Kentucky, USA"),
+    ("abingon, knox county, illinois, usa", "Abingdon, Knox county, Illinois, Usa"),
+])
+def test_normalized_misspellings(name, expected):
+    assert normalize_place_iteratively(0, name) == expected
+
+
+def test_county_suffix_in_any_case():
+    assert correct_misspellings("abingon, knox county, illinois, usa") == "Abingdon, knox county, illinois, usa"
+    assert correct_misspellings("fraanklin county, Kentucky, USA") == "Franklin county, Kentucky, USA"
+
+
+def test_unconfirmed_is_suggested_not_written():
+    name = "Haine City, Florida, USA"
+    assert correct_misspellings(name) == name
+    assert suggested_corrections(name) == [("Haine City", "Haines City")]
@@ -0,0 +1,89 @@
+import sqlite3
+
+import pytest
+
+from rmutils import PlaceWriter, merge_places, delete_place_id
+
+SCHEMA = """
+CREATE TABLE PlaceTable (PlaceID INTEGER PRIMARY KEY, PlaceType INTEGER, Name TEXT, Reverse TEXT, UTCModDate FLOAT);
+CREATE TABLE EventTable (EventID INTEGER PRIMARY KEY, PlaceID INTEGER, UTCModDate FLOAT);
+CREATE TABLE FANTable (FanID INTEGER PRIMARY KEY, PlaceID INTEGER, UTCModDate FLOAT);
+CREATE TABLE TaskLinkTable (LinkID INTEGER PRIMARY KEY, OwnerType INTEGER, OwnerID INTEGER, UTCModDate FLOAT);
+CREATE TABLE URLTable (LinkID INTEGER PRIMARY KEY, OwnerType INTEGER, OwnerID INTEGER, UTCModDate FLOAT);
+CREATE TABLE MediaLinkTable (LinkID INTEGER PRIMARY KEY, OwnerType INTEGER, OwnerID INTEGER, UTCModDate FLOAT);
+
+-- a place may only go once nothing points at it any more
+CREATE TRIGGER place_still_referenced BEFORE DELETE ON PlaceTable
+WHEN EXISTS (SELECT 1 FROM EventTable WHERE PlaceID = OLD.PlaceID)
+  OR EXISTS (SELECT 1 FROM FANTable WHERE PlaceID = OLD.PlaceID)
+  OR EXISTS (SELECT 1 FROM TaskLinkTable WHERE OwnerType IN (5, 14) AND OwnerID = OLD.PlaceID)
+  OR EXISTS (SELECT 1 FROM URLTable WHERE OwnerType = 5 AND OwnerID = OLD.PlaceID)
+  OR EXISTS (SELECT 1 FROM MediaLinkTable WHERE OwnerType = 14 AND OwnerID = OLD.PlaceID)
+BEGIN
+  SELECT RAISE(ABORT, 'place still referenced');
+END;
+
+INSERT INTO PlaceTable VALUES (1, 0, 'Knox, Illinois, USA', NULL, 0), (2, 0, 'Knox, Illinois, USA', NULL, 0),
+                              (3, 0, 'Knox, Illinois, USA', NULL, 0), (4, 0, 'Nowhere', NULL, 0);
+INSERT INTO EventTable VALUES (10, 2, 0), (11, 3, 0), (12, 1, 0), (13, 4, 0), (14, 2, 0);
+INSERT INTO FANTable VALUES (20, 3, 0), (21, 4, 0);
+INSERT INTO TaskLinkTable VALUES (30, 5, 2, 0), (31, 14, 4, 0);
+INSERT INTO URLTable VALUES (40, 5, 3, 0);
+INSERT INTO MediaLinkTable VALUES (50, 14, 2, 0), (51, 14, 4, 0);
+"""
+
+DUPES = {"knox, illinois, usa": [(1, "Knox, Illinois, USA"), (2, "Knox, Illinois, USA"), (3, "Knox, Illinois, USA")]}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "tree.rmtree")
+    conn.executescript(SCHEMA)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _dump(conn):
+    tables = ("PlaceTable", "EventTable", "FANTable", "TaskLinkTable", "URLTable", "MediaLinkTable")
+    return {table: conn.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall() for table in tables}
+
+
+def test_delete_before_repoint_is_refused(conn):
+    with pytest.raises(sqlite3.IntegrityError):
+        with PlaceWriter(conn) as writer:
+            writer.delete_place(2)
+    assert conn.execute("SELECT COUNT(*) FROM PlaceTable").fetchone()[0] == 4
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 3, 5])
+def test_merge_and_delete_repoint_before_deleting(conn, batch_size):
+    with PlaceWriter(conn, batch_size=batch_size) as writer:
+        merge_places(conn, DUPES, dry_run=False, writer=writer)
+        assert delete_place_id(conn, 4, writer=writer)
+
+    assert [row[0] for row in conn.execute("SELECT PlaceID FROM PlaceTable")] == [1]
+    assert conn.execute("SELECT EventID, PlaceID FROM EventTable ORDER BY 1").fetchall() == [
+        (10, 1), (11, 1), (12, 1), (13, 0), (14, 1)]
+    assert conn.execute("SELECT FanID, PlaceID FROM FANTable ORDER BY 1").fetchall() == [(20, 1), (21, 0)]
+    assert conn.execute("SELECT LinkID, OwnerID FROM TaskLinkTable ORDER BY 1").fetchall() == [(30, 1), (31, 0)]
+    assert conn.execute("SELECT LinkID, OwnerID FROM URLTable ORDER BY 1").fetchall() == [(40, 1)]
+    assert conn.execute("SELECT LinkID, OwnerID FROM MediaLinkTable ORDER BY 1").fetchall() == [(50, 1), (51, 0)]
+    # repointed rows are touched, the rest are not
+    assert conn.execute("SELECT UTCModDate FROM EventTable WHERE EventID = 12").fetchone()[0] == 0
+    assert conn.execute("SELECT UTCModDate FROM EventTable WHERE EventID = 10").fetchone()[0] > 0
+
+
+@pytest.mark.parametrize("batch_size", [None, 1])
+def test_dry_run_writes_nothing(conn, batch_size):
+    before = _dump(conn)
+    changes = conn.total_changes
+
+    with PlaceWriter(conn, batch_size=batch_size) as writer:
+        merge_places(conn, DUPES, dry_run=True, writer=writer)
+        assert delete_place_id(conn, 4, dry_run=True, writer=writer)
+    merge_places(conn, DUPES, dry_run=True)
+    delete_place_id(conn, 4, dry_run=True)
+
+    assert conn.total_changes == changes
+    assert _dump(conn) == before
@@ -0,0 +1,77 @@
+import sqlite3
+
+import pytest
+
+import rmutils
+from rmnocase import register_rmnocase, RMNOCASE_VERSION
+
+
+def _make_tree(path):
+    conn = sqlite3.connect(path)
+    register_rmnocase(conn)
+    conn.execute("CREATE TABLE PlaceTable (PlaceID INTEGER PRIMARY KEY, Name TEXT COLLATE RMNOCASE)")
+    conn.execute("CREATE INDEX idxPlaceName ON PlaceTable (Name)")
+    conn.executemany("INSERT INTO PlaceTable (Name) VALUES (?)", [("Knox",), ("knox",), ("Abingdon",)])
+    conn.commit()
+    conn.close()
+
+
+def test_marker_round_trip(tmp_path, monkeypatch):
+    """Open in memory, save, reopen: the marker written by save() spares the reopen a REINDEX."""
+    path = str(tmp_path / "tree.rmtree")
+    _make_tree(path)
+    monkeypatch.setattr(rmutils, "rmtree_path", path)
+
+    conn = rmutils.get_connection(read_only=False, collation="python", in_memory=True)
+    assert conn.indexes_valid
+    conn.execute("INSERT INTO PlaceTable (Name) VALUES ('Galesburg')")
+    conn.save()
+    conn.close()
+
+    saved_state = rmutils._file_state(path)
+    marker = rmutils._read_reindex_marker(path)
+    assert marker == rmutils._collation_fingerprint(path, RMNOCASE_VERSION)
+
+    conn = rmutils.get_connection(read_only=False, collation="python")
+    conn.close()
+    # a REINDEX would have bumped the change counter and rewritten the marker
+    assert rmutils._file_state(path) == saved_state
+    assert rmutils._read_reindex_marker(path) == marker
+
+
+def test_stale_marker_reindexes(tmp_path, monkeypatch):
+    path = str(tmp_path / "tree.rmtree")
+    _make_tree(path)
+    monkeypatch.setattr(rmutils, "rmtree_path", path)
+    rmutils._write_reindex_marker(path, "some other collation|0|0")
+
+    conn = rmutils.get_connection(read_only=False, collation="python")
+    conn.close()
+    assert rmutils._read_reindex_marker(path) == rmutils._collation_fingerprint(path, RMNOCASE_VERSION)
+
+
+def test_save_refuses_a_source_changed_since_the_copy(tmp_path, monkeypatch):
+    path = str(tmp_path / "tree.rmtree")
+    _make_tree(path)
+    monkeypatch.setattr(rmutils, "rmtree_path", path)
+
+    conn = rmutils.get_connection(read_only=False, collation="python", in_memory=True)
+    conn.execute("INSERT INTO PlaceTable (Name) VALUES ('Galesburg')")
+
+    # e.g. RootsMagic writing to the file while the copy is being worked on
+    other = sqlite3.connect(path)
+    register_rmnocase(other)
+    other.execute("DELETE FROM PlaceTable WHERE Name = 'Abingdon'")
+    other.commit()
+    other.close()
+
+    with pytest.raises(ValueError):
+        conn.save()
+    conn.save(force=True)
+    conn.save()  # the file is now what the copy last wrote
+    conn.close()
+
+    check = sqlite3.connect(path)
+    register_rmnocase(check)
+    assert [row[0] for row in check.execute("SELECT Name FROM PlaceTable WHERE Name = 'Galesburg'")] == ["Galesburg"]
+    check.close()
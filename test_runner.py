@@ -4,6 +4,9 @@ from pathlib import Path
 import runpy
 import subprocess
 
+from rmutils import get_connection
+from report_executor import ReportExecutor, print_report_results
+
 # List of finalized testable scripts
 TEST_SCRIPTS = [
     {"name": "check_birth_inconsistencies.py", "label": "birth inconsistencies"},
@@ -47,14 +50,23 @@ def run_test(script_info):
         print(f"❌ Error running {script_path.name}: {e}")
         return False
 
-def main():
-    all_passed = True
-    for script_info in TEST_SCRIPTS:
-        if not run_test(script_info):
-            all_passed = False
+def main(jobs=None):
+    # settle any pending RMNOCASE reindex once, before the scripts race for it
+    get_connection().close()
+
+    # each script opens its own connection, so the workers don't need one
+    executor = ReportExecutor(jobs=jobs or len(TEST_SCRIPTS), connect=False)
+    results = executor.run((info["name"], run_test, info) for info in TEST_SCRIPTS)
+    print_report_results(results)
+    all_passed = all(result.value for result in results)
 
     print("\n✅ All tests passed!" if all_passed else "\n❌ Some tests failed.")
     sys.exit(0 if all_passed else 1)
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Run the finalized report scripts")
+    parser.add_argument("--jobs", type=int, help="Scripts to run at once (default: all of them)")
+    args = parser.parse_args()
+
+    main(jobs=args.jobs)